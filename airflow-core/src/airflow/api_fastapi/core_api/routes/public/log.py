@@ -84,6 +84,7 @@ def get_log(
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
+    tail_lines: PositiveInt | None = None,
 ):
     """Get logs for a specific task instance."""
     if not token:
@@ -100,6 +101,9 @@ def get_log(
         full_content = True
 
     metadata["download_logs"] = full_content
+    if tail_lines:
+        # Only the end of the local and served log files is read then, and no continuation token is returned
+        metadata["tail_lines"] = tail_lines
 
     task_log_reader = TaskLogReader()
 
@@ -159,12 +163,12 @@ def get_log(
 
     # LogMetadata(TypedDict) is used as type annotation for log_reader; added ignore to suppress mypy error
     structured_log_stream, out_metadata = task_log_reader.read_log_chunks(ti, try_number, metadata)  # type: ignore[arg-type]
+    # The log position in the metadata is only known once the stream has been read
+    content = list(structured_log_stream)
     encoded_token = None
     if not out_metadata.get("end_of_log", False):
         encoded_token = URLSafeSerializer(request.app.state.secret_key).dumps(out_metadata)
-    return TaskInstancesLogResponse.model_construct(
-        continuation_token=encoded_token, content=list(structured_log_stream)
-    )
+    return TaskInstancesLogResponse.model_construct(continuation_token=encoded_token, content=content)
 
 
 @task_instances_log_router.get(
@@ -236,6 +236,35 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBulkHeartbeatItem(TIHeartbeatInfo):
+    """Schema for the heartbeat of one TaskInstance in the bulk heartbeat endpoint."""
+
+    id: uuid.UUID
+    token: str
+    """The token of the TaskInstance, as the request itself is only authenticated for one of them."""
+
+
+class TIBulkHeartbeatPayload(StrictBaseModel):
+    """Schema for the bulk TaskInstance heartbeat endpoint."""
+
+    heartbeats: list[TIBulkHeartbeatItem]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """Outcome of the heartbeat of one TaskInstance, as the TaskInstance heartbeat endpoint would respond."""
+
+    id: uuid.UUID
+    status_code: int
+    detail: dict[str, Any] | None = None
+    refreshed_token: str | None = None
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """Schema for the response of the bulk TaskInstance heartbeat endpoint, in the order of the request."""
+
+    results: list[TIBulkHeartbeatResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
@@ -22,7 +22,7 @@ from typing import Any
 
 from pydantic import JsonValue, RootModel
 
-from airflow.api_fastapi.core_api.base import BaseModel
+from airflow.api_fastapi.core_api.base import BaseModel, StrictBaseModel
 
 if sys.version_info < (3, 12):
     # zmievsa/cadwyn#262
@@ -48,3 +48,30 @@ class XComSequenceSliceResponse(RootModel):
     """XCom schema with minimal structure for slice-based access."""
 
     root: list[JsonValue]
+
+
+class XComBulkPullItem(StrictBaseModel):
+    """An XCom requested in a bulk pull."""
+
+    task_id: str
+    key: str
+    map_index: int | None = -1
+    """The map index of the XCom, or *None* for the XComs of every map index of the task."""
+
+
+class XComBulkPullRequest(StrictBaseModel):
+    """Request to pull many XComs of a DAG run at once."""
+
+    xcoms: list[XComBulkPullItem]
+    include_prior_dates: bool = False
+    """Also look for XComs from earlier DAG runs. Only applies to XComs requested with a map index."""
+
+
+class XComBulkPullResponse(BaseModel):
+    """XCom values of a bulk pull, in the order they were requested."""
+
+    values: list[list[JsonValue]]
+    """
+    For each requested XCom, the matching values: at most one for an XCom requested with a map index, and
+    the values of every map index, ordered by map index, otherwise. Empty if no XCom was found.
+    """
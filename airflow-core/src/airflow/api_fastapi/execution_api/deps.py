@@ -113,6 +113,10 @@ class JWTReissuer:
             30,
         )
 
+    def needs_refresh(self, claims: dict[str, Any]) -> bool:
+        """Whether a token with these claims is about to run out, so a new one should be issued."""
+        return claims["exp"] - int(time.time()) <= self.refresh_when_less_than
+
     async def __call__(
         self,
         response: Response,
@@ -127,7 +131,7 @@ class JWTReissuer:
 
             try:
                 valid_left = token.claims["exp"] - now
-                if valid_left <= self.refresh_when_less_than:
+                if self.needs_refresh(token.claims):
                     generator: JWTGenerator = await services.aget(JWTGenerator)
                     new = generator.generate(token.claims)
                     response.headers["Refreshed-API-Token"] = new
@@ -21,7 +21,7 @@ import contextlib
 import itertools
 import json
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Annotated, Any, cast
 from uuid import UUID
@@ -35,9 +35,10 @@ from sqlalchemy import func, or_, tuple_, update
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
-from structlog.contextvars import bind_contextvars
+from structlog.contextvars import bind_contextvars, bound_contextvars
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import dag_bag_from_app
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
@@ -45,6 +46,10 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     InactiveAssetsResponse,
     PrevSuccessfulDagRunResponse,
     TaskStatesResponse,
+    TIBulkHeartbeatItem,
+    TIBulkHeartbeatPayload,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -56,7 +61,7 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TISuccessStatePayload,
     TITerminalStatePayload,
 )
-from airflow.api_fastapi.execution_api.deps import JWTBearerTIPathDep
+from airflow.api_fastapi.execution_api.deps import DepContainer, JWTBearerTIPathDep, JWTReissuer
 from airflow.exceptions import TaskNotFound
 from airflow.models.asset import AssetActive
 from airflow.models.dagbag import DagBag
@@ -605,20 +610,31 @@ def ti_heartbeat(
 
     old = select(TI.state, TI.hostname, TI.pid).where(TI.id == ti_id_str).with_for_update()
 
-    try:
-        (previous_state, hostname, pid) = session.execute(old).one()
-        log.debug(
-            "Retrieved current task state", state=previous_state, current_hostname=hostname, current_pid=pid
-        )
-    except NoResultFound:
+    current = session.execute(old).one_or_none()
+    if error := _heartbeat_error(current, ti_payload):
+        status_code, detail = error
+        raise HTTPException(status_code=status_code, detail=detail)
+
+    # Update the last heartbeat time!
+    session.execute(update(TI).where(TI.id == ti_id_str).values(last_heartbeat_at=timezone.utcnow()))
+    log.debug("Heartbeat updated", state=current[0])
+
+
+def _heartbeat_error(
+    current: Sequence[Any] | None, ti_payload: TIHeartbeatInfo
+) -> tuple[int, dict[str, Any]] | None:
+    """Get the status code and detail to respond to a heartbeat with, if the task should not be running."""
+    if current is None:
         log.error("Task Instance not found")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "reason": "not_found",
-                "message": "Task Instance not found",
-            },
-        )
+        return status.HTTP_404_NOT_FOUND, {
+            "reason": "not_found",
+            "message": "Task Instance not found",
+        }
+
+    previous_state, hostname, pid = current
+    log.debug(
+        "Retrieved current task state", state=previous_state, current_hostname=hostname, current_pid=pid
+    )
 
     if hostname != ti_payload.hostname or pid != ti_payload.pid:
         log.warning(
@@ -628,30 +644,120 @@ def ti_heartbeat(
             requested_hostname=ti_payload.hostname,
             requested_pid=ti_payload.pid,
         )
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "reason": "running_elsewhere",
-                "message": "TI is already running elsewhere",
-                "current_hostname": hostname,
-                "current_pid": pid,
-            },
-        )
+        return status.HTTP_409_CONFLICT, {
+            "reason": "running_elsewhere",
+            "message": "TI is already running elsewhere",
+            "current_hostname": hostname,
+            "current_pid": pid,
+        }
 
     if previous_state != TaskInstanceState.RUNNING:
         log.warning("Task not in running state", current_state=previous_state)
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "reason": "not_running",
-                "message": "TI is no longer in the running state and task should terminate",
-                "current_state": previous_state,
-            },
-        )
+        return status.HTTP_409_CONFLICT, {
+            "reason": "not_running",
+            "message": "TI is no longer in the running state and task should terminate",
+            "current_state": previous_state,
+        }
+    return None
+
+
+@attrs.define
+class _AuthorizedHeartbeats:
+    heartbeats: list[TIBulkHeartbeatItem]
+    authorized: set[UUID]
+    refreshed_tokens: dict[UUID, str]
+
+
+_token_reissuer = JWTReissuer()
+
+
+async def _authorize_heartbeats(
+    ti_payload: TIBulkHeartbeatPayload,
+    services=DepContainer,
+) -> _AuthorizedHeartbeats:
+    """Validate the token of each heartbeat against its TaskInstance, and refresh those about to run out."""
+    validator: JWTValidator = await services.aget(JWTValidator)
+    generator: JWTGenerator | None = None
+    authorized = set()
+    refreshed_tokens = {}
+    for heartbeat in ti_payload.heartbeats:
+        try:
+            claims = await validator.avalidated_claims(
+                heartbeat.token, {"sub": {"essential": True, "value": str(heartbeat.id)}}
+            )
+        except Exception:
+            log.warning("Failed to validate JWT of heartbeat", ti_id=str(heartbeat.id), exc_info=True)
+            continue
+        authorized.add(heartbeat.id)
+        if _token_reissuer.needs_refresh(claims):
+            generator = generator or await services.aget(JWTGenerator)
+            refreshed_tokens[heartbeat.id] = generator.generate(claims)
+    return _AuthorizedHeartbeats(ti_payload.heartbeats, authorized, refreshed_tokens)
+
+
+@router.put(
+    "/heartbeats",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "Invalid payload for the heartbeats"},
+    },
+)
+def ti_bulk_heartbeat(
+    heartbeats: Annotated[_AuthorizedHeartbeats, Depends(_authorize_heartbeats)],
+    session: SessionDep,
+) -> TIBulkHeartbeatResponse:
+    """
+    Update the heartbeats of many TaskInstances at once, e.g. those of all the tasks running on a worker.
 
-    # Update the last heartbeat time!
-    session.execute(update(TI).where(TI.id == ti_id_str).values(last_heartbeat_at=timezone.utcnow()))
-    log.debug("Heartbeat updated", state=previous_state)
+    All the heartbeats are updated with a single statement, and each gets the status code and detail that
+    the TaskInstance heartbeat endpoint would have responded with, so one failed heartbeat does not fail them
+    all.
+    """
+    authorized = [hb for hb in heartbeats.heartbeats if hb.id in heartbeats.authorized]
+    current: dict[str, Sequence[Any]] = {}
+    if authorized:
+        # Only the heartbeats the TaskInstance heartbeat endpoint would accept are updated. That's checked in the
+        # same statement rather than with a locking read first, so no row stays locked while we go back and forth
+        session.execute(
+            update(TI)
+            .where(
+                tuple_(TI.id, TI.hostname, TI.pid).in_(
+                    [(str(hb.id), hb.hostname, hb.pid) for hb in authorized]
+                ),
+                TI.state == TaskInstanceState.RUNNING,
+            )
+            .values(last_heartbeat_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        rows = session.execute(
+            select(TI.id, TI.state, TI.hostname, TI.pid).where(TI.id.in_([str(hb.id) for hb in authorized]))
+        )
+        current = {str(row.id): row[1:] for row in rows}
+
+    results = []
+    for hb in heartbeats.heartbeats:
+        if hb.id not in heartbeats.authorized:
+            results.append(
+                TIBulkHeartbeatResult(
+                    id=hb.id,
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail={"reason": "invalid_token", "message": "Invalid auth token for the Task Instance"},
+                )
+            )
+            continue
+        with bound_contextvars(ti_id=str(hb.id)):
+            error = _heartbeat_error(current.get(str(hb.id)), hb)
+        status_code, detail = error or (status.HTTP_204_NO_CONTENT, None)
+        results.append(
+            TIBulkHeartbeatResult(
+                id=hb.id,
+                status_code=status_code,
+                detail=detail,
+                refreshed_token=heartbeats.refreshed_tokens.get(hb.id),
+            )
+        )
+    log.debug("Bulk heartbeat processed", count=len(results), updated=len(authorized))
+    return TIBulkHeartbeatResponse(results=results)
 
 
 @ti_id_router.put(
@@ -19,20 +19,25 @@ from __future__ import annotations
 
 import logging
 import sys
+from collections import defaultdict
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
 from pydantic import BaseModel, JsonValue, StringConstraints
-from sqlalchemy import delete
+from sqlalchemy import delete, func, select
 from sqlalchemy.sql.selectable import Select
 
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.execution_api.datamodels.xcom import (
+    XComBulkPullItem,
+    XComBulkPullRequest,
+    XComBulkPullResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
 )
 from airflow.api_fastapi.execution_api.deps import JWTBearerDep
+from airflow.models.dagrun import DagRun
 from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
 from airflow.utils.db import get_query_count
@@ -47,10 +52,12 @@ async def has_xcom_access(
     token=JWTBearerDep,
 ) -> bool:
     """Check if the task has access to the XCom."""
-    # TODO: Placeholder for actual implementation
-
     write = request.method not in {"GET", "HEAD", "OPTIONS"}
+    return _check_xcom_access(dag_id, run_id, task_id, xcom_key, write=write, token=token)
 
+
+def _check_xcom_access(dag_id: str, run_id: str, task_id: str, xcom_key: str, *, write: bool, token) -> bool:
+    # TODO: Placeholder for actual implementation
     log.debug(
         "Checking %s XCom access for xcom from TaskInstance with key '%s' to XCom '%s'",
         "write" if write else "read",
@@ -69,6 +76,30 @@ router = APIRouter(
     dependencies=[Depends(has_xcom_access)],
 )
 
+
+async def has_xcom_bulk_access(
+    dag_id: str,
+    run_id: str,
+    body: XComBulkPullRequest,
+    token=JWTBearerDep,
+) -> bool:
+    """Check if the task has access to all the requested XComs."""
+    # The request is a POST only because of its body, it reads the XComs
+    return all(
+        _check_xcom_access(dag_id, run_id, item.task_id, item.key, write=False, token=token)
+        for item in body.xcoms
+    )
+
+
+# Bulk endpoints span many tasks and keys, so they check the access to each XCom of the request body
+bulk_router = APIRouter(
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the XComs"},
+    },
+    dependencies=[Depends(has_xcom_bulk_access)],
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -314,6 +345,83 @@ def get_mapped_xcom_by_slice(
     return XComSequenceSliceResponse(values)
 
 
+@bulk_router.post(
+    "/{dag_id}/{run_id}/pull",
+    description="Get many XCom values of a DAG run at once",
+)
+def pull_xcoms(
+    dag_id: str,
+    run_id: str,
+    body: XComBulkPullRequest,
+    session: SessionDep,
+) -> XComBulkPullResponse:
+    """
+    Get XComs from database - not other XCom Backends - with one query per XCom key.
+
+    Unlike ``get_xcom`` a missing XCom is not an error, it just has no values in the response.
+    """
+    items_by_key: dict[str, list[XComBulkPullItem]] = defaultdict(list)
+    for item in body.xcoms:
+        items_by_key[item.key].append(item)
+
+    found: dict[tuple[str, str, int | None], list[JsonValue]] = {}
+    for key, items in items_by_key.items():
+        if single_items := [item for item in items if item.map_index is not None]:
+            query = XComModel.get_many(
+                run_id=run_id,
+                key=key,
+                task_ids={item.task_id for item in single_items},
+                dag_ids=dag_id,
+                map_indexes={item.map_index for item in single_items},  # type: ignore[misc]
+                include_prior_dates=body.include_prior_dates,
+                session=session,
+            )
+            requested = {(item.task_id, item.map_index) for item in single_items}
+            rows = query.with_entities(XComModel.task_id, XComModel.map_index, XComModel.value)
+            if body.include_prior_dates:
+                # Only the latest XCom of each task and map index, rather than one from every prior run
+                latest = (
+                    query.with_entities(
+                        XComModel.task_id,
+                        XComModel.map_index,
+                        XComModel.value,
+                        func.row_number()
+                        .over(
+                            partition_by=(XComModel.task_id, XComModel.map_index),
+                            order_by=(DagRun.logical_date.desc(), XComModel.timestamp.desc()),
+                        )
+                        .label("row_number"),
+                    )
+                    .order_by(None)
+                    .subquery()
+                )
+                rows = session.execute(
+                    select(latest.c.task_id, latest.c.map_index, latest.c.value).where(
+                        latest.c.row_number == 1
+                    )
+                )
+            for task_id, map_index, value in rows:
+                # The latest XComs come first, like in ``get_xcom``
+                if (task_id, map_index) in requested:
+                    found.setdefault((key, task_id, map_index), [value])
+
+        if all_map_index_task_ids := {item.task_id for item in items if item.map_index is None}:
+            query = XComModel.get_many(
+                run_id=run_id,
+                key=key,
+                task_ids=all_map_index_task_ids,
+                dag_ids=dag_id,
+                session=session,
+            )
+            query = query.order_by(None).order_by(XComModel.task_id, XComModel.map_index.asc())
+            for task_id, value in query.with_entities(XComModel.task_id, XComModel.value):
+                found.setdefault((key, task_id, None), []).append(value)
+
+    return XComBulkPullResponse(
+        values=[found.get((item.key, item.task_id, item.map_index), []) for item in body.xcoms]
+    )
+
+
 if sys.version_info < (3, 12):
     # zmievsa/cadwyn#262
     # Setting this to "Any" doesn't have any impact on the API as it has to be parsed as valid JSON regardless
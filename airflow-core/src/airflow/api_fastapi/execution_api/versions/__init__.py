@@ -25,9 +25,13 @@ from airflow.api_fastapi.execution_api.versions.v2025_08_10 import (
     AddDagRunStateFieldAndPreviousEndpoint,
     AddDagVersionIdField,
 )
+from airflow.api_fastapi.execution_api.versions.v2025_09_23 import AddXComBulkPullEndpoint
+from airflow.api_fastapi.execution_api.versions.v2025_10_10 import AddBulkHeartbeatEndpoint
 
 bundle = VersionBundle(
     HeadVersion(),
+    Version("2025-10-10", AddBulkHeartbeatEndpoint),
+    Version("2025-09-23", AddXComBulkPullEndpoint),
     Version("2025-08-10", AddDagVersionIdField, AddDagRunStateFieldAndPreviousEndpoint),
     Version("2025-05-20", DowngradeUpstreamMapIndexes),
     Version("2025-04-28", AddRenderedMapIndexField),
@@ -439,8 +439,10 @@ ARG_REPLACE_MICRO = Arg(
 ARG_DB_TABLES = Arg(
     ("-t", "--tables"),
     help=lazy_object_proxy.Proxy(
-        lambda: f"Table names to perform maintenance on (use comma-separated list).\n"
-        f"Options: {import_string('airflow.cli.commands.db_command.all_tables')}"
+        lambda: (
+            f"Table names to perform maintenance on (use comma-separated list).\n"
+            f"Options: {import_string('airflow.cli.commands.db_command.all_tables')}"
+        )
     ),
     type=string_list_type,
 )
@@ -500,6 +502,23 @@ ARG_DB_BATCH_SIZE = Arg(
         "Lower values reduce long-running locks but increase the number of batches."
     ),
 )
+ARG_DB_CLEANUP_WORKERS = Arg(
+    ("--workers",),
+    default=1,
+    type=positive_int(allow_zero=False),
+    help=(
+        "Number of workers deleting the rows of each table in parallel, each from its own range of "
+        "timestamps. Requires --batch-size, and is not used with SQLite."
+    ),
+)
+ARG_DB_CLEANUP_RESUME = Arg(
+    ("--resume",),
+    help=(
+        "Carry on with a cleanup that was stopped halfway, moving the rows of each table to the archive "
+        "table of its last cleanup instead of a new one. Requires --batch-size."
+    ),
+    action="store_true",
+)
 
 # pool
 ARG_POOL_NAME = Arg(("pool",), metavar="NAME", help="Pool name")
@@ -1471,6 +1490,8 @@ DB_COMMANDS = (
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
             ARG_DB_BATCH_SIZE,
+            ARG_DB_CLEANUP_WORKERS,
+            ARG_DB_CLEANUP_RESUME,
         ),
     ),
     ActionCommand(
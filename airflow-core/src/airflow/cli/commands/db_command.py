@@ -284,6 +284,8 @@ def cleanup_tables(args):
         confirm=not args.yes,
         skip_archive=args.skip_archive,
         batch_size=args.batch_size,
+        workers=args.workers,
+        resume=args.resume,
     )
 
 
@@ -30,6 +30,7 @@ import shlex
 import stat
 import subprocess
 import sys
+import time
 import warnings
 from base64 import b64encode
 from collections.abc import Generator, Iterable
@@ -71,6 +72,8 @@ ConfigSourcesType = dict[str, ConfigSectionSourcesType]
 
 ENV_VAR_PREFIX = "AIRFLOW__"
 
+_NO_FALLBACK = object()
+
 
 class ConfigModifications:
     """
@@ -215,6 +218,12 @@ class AirflowConfigParser(ConfigParser):
     :param configuration_description: description of configuration to use
     """
 
+    # Resolved values of ``get`` keyed by (section, key, lookup_from_deprecated, fallback), with the
+    # monotonic time they expire at (or None), when the cache is enabled with ``enable_value_cache``. The
+    # class default is needed as ``ConfigParser.__init__`` can read values in, invalidating the cache, before
+    # ``__init__`` below sets it.
+    _value_cache: dict[tuple[str, str, bool, Any], tuple[str | None, float | None]] | None = None
+
     def __init__(
         self,
         default_config: str | None = None,
@@ -237,6 +246,8 @@ class AirflowConfigParser(ConfigParser):
         self.is_validated = False
         self._suppress_future_warnings = False
         self._providers_configuration_loaded = False
+        self._value_cache = None
+        self._value_cache_sensitive_ttl = 0.0
 
     def _update_logging_deprecated_template_to_one_from_defaults(self):
         default = self.get_default_value("logging", "log_filename_template")
@@ -426,6 +437,7 @@ class AirflowConfigParser(ConfigParser):
         ("logging", "celery_logging_level"): [*_available_logging_levels, ""],
         ("webserver", "analytical_tool"): ["google_analytics", "metarouter", "segment", "matomo", ""],
         ("api", "grid_view_sorting_order"): ["topological", "hierarchical_alphabetical"],
+        ("scheduler", "task_selection_strategy"): ["loop", "window"],
     }
 
     upgraded_values: dict[tuple[str, str], str]
@@ -756,6 +768,7 @@ class AirflowConfigParser(ConfigParser):
         self.configuration_description = retrieve_configuration_description(include_providers=False)
         self._default_values = create_default_config_parser(self.configuration_description)
         self._providers_configuration_loaded = False
+        self._invalidate_value_cache()
 
     def validate(self):
         self._validate_sqlite3_version()
@@ -972,6 +985,89 @@ class AirflowConfigParser(ConfigParser):
         lookup_from_deprecated: bool = True,
         _extra_stacklevel: int = 0,
         **kwargs,
+    ) -> str | None:
+        if self._value_cache is None or kwargs.keys() - {"fallback"}:
+            return self._get_uncached(
+                section,
+                key,
+                suppress_warnings=suppress_warnings,
+                lookup_from_deprecated=lookup_from_deprecated,
+                _extra_stacklevel=_extra_stacklevel + 1,
+                **kwargs,
+            )
+
+        section = section.lower()
+        key = key.lower()
+        cache_key = (section, key, lookup_from_deprecated, kwargs.get("fallback", _NO_FALLBACK))
+        try:
+            cached = self._value_cache.get(cache_key)
+        except TypeError:
+            # Unhashable fallback
+            return self._get_uncached(
+                section,
+                key,
+                suppress_warnings=suppress_warnings,
+                lookup_from_deprecated=lookup_from_deprecated,
+                _extra_stacklevel=_extra_stacklevel + 1,
+                **kwargs,
+            )
+        if cached is not None and (cached[1] is None or cached[1] > time.monotonic()):
+            return cached[0]
+
+        value = self._get_uncached(
+            section,
+            key,
+            suppress_warnings=suppress_warnings,
+            lookup_from_deprecated=lookup_from_deprecated,
+            _extra_stacklevel=_extra_stacklevel + 1,
+            **kwargs,
+        )
+        expires_at = None
+        if self._is_sensitive_option(section, key):
+            # The value may come from a command or a secrets backend, which can change at any time
+            expires_at = time.monotonic() + self._value_cache_sensitive_ttl
+        self._value_cache[cache_key] = (value, expires_at)
+        return value
+
+    def _is_sensitive_option(self, section: str, key: str) -> bool:
+        if (section, key) in self.sensitive_config_values:
+            return True
+        if section in self.inversed_deprecated_sections:
+            return (self.inversed_deprecated_sections[section], key) in self.sensitive_config_values
+        return self.inversed_deprecated_options.get((section, key)) in self.sensitive_config_values
+
+    def enable_value_cache(self, sensitive_ttl: float = 60) -> None:
+        """
+        Cache the values resolved by ``get`` and the ``get*`` methods built on it.
+
+        Once enabled, looking up an option again does not go through the deprecation maps, the environment
+        variables, the config file, the commands, the secrets backends and the defaults. The cache is dropped
+        whenever the configuration is changed with ``set``, ``remove_option``, ``read``, ``read_dict`` or
+        ``load_test_config``, but changes to environment variables are not seen until then. Deprecation
+        warnings are only emitted the first time an option is looked up.
+
+        :param sensitive_ttl: Number of seconds the values of sensitive options, which can be read from
+            ``_cmd`` and ``_secret`` sources, are cached for.
+        """
+        self._value_cache_sensitive_ttl = sensitive_ttl
+        self._value_cache = {}
+
+    def disable_value_cache(self) -> None:
+        """Stop caching the values resolved by ``get``."""
+        self._value_cache = None
+
+    def _invalidate_value_cache(self) -> None:
+        if self._value_cache:
+            self._value_cache.clear()
+
+    def _get_uncached(
+        self,
+        section: str,
+        key: str,
+        suppress_warnings: bool = False,
+        lookup_from_deprecated: bool = True,
+        _extra_stacklevel: int = 0,
+        **kwargs,
     ) -> str | None:
         section = section.lower()
         key = key.lower()
@@ -1317,6 +1413,11 @@ class AirflowConfigParser(ConfigParser):
         encoding=None,
     ):
         super().read(filenames=filenames, encoding=encoding)
+        self._invalidate_value_cache()
+
+    def read_file(self, f: Iterable[str], source: str | None = None) -> None:
+        super().read_file(f, source=source)
+        self._invalidate_value_cache()
 
     def read_dict(  # type: ignore[override]
         self, dictionary: dict[str, dict[str, Any]], source: str = "<dict>"
@@ -1329,6 +1430,7 @@ class AirflowConfigParser(ConfigParser):
         :return:
         """
         super().read_dict(dictionary=dictionary, source=source)
+        self._invalidate_value_cache()
 
     def has_option(self, section: str, option: str, lookup_from_deprecated: bool = True) -> bool:
         """
@@ -1371,6 +1473,7 @@ class AirflowConfigParser(ConfigParser):
             # automatically create it
             self.add_section(section)
         super().set(section, option, value)
+        self._invalidate_value_cache()
 
     def remove_option(self, section: str, option: str, remove_default: bool = True):
         """
@@ -1386,6 +1489,16 @@ class AirflowConfigParser(ConfigParser):
 
         if self.get_default_value(section, option) is not None and remove_default:
             self._default_values.remove_option(section, option)
+        self._invalidate_value_cache()
+
+    def add_section(self, section: str) -> None:
+        super().add_section(section)
+        self._invalidate_value_cache()
+
+    def remove_section(self, section: str) -> bool:
+        removed = super().remove_section(section)
+        self._invalidate_value_cache()
+        return removed
 
     def getsection(self, section: str) -> ConfigOptionsDictType | None:
         """
@@ -1841,6 +1954,7 @@ class AirflowConfigParser(ConfigParser):
         FERNET_KEY = Fernet.generate_key().decode()
         JWT_SECRET_KEY = b64encode(os.urandom(16)).decode("utf-8")
         self.expand_all_configuration_values()
+        self._invalidate_value_cache()
         log.info("Unit test configuration loaded from 'config_unit_tests.cfg'")
 
     def expand_all_configuration_values(self):
@@ -1860,6 +1974,7 @@ class AirflowConfigParser(ConfigParser):
         """Remove all read configurations, leaving only default values in the config."""
         for section in self.sections():
             self.remove_section(section)
+        self._invalidate_value_cache()
 
     @property
     def providers_configuration_loaded(self) -> bool:
@@ -1911,6 +2026,7 @@ class AirflowConfigParser(ConfigParser):
             # no problem if cache is not set yet
             del self.sensitive_config_values
         self._providers_configuration_loaded = True
+        self._invalidate_value_cache()
 
     @staticmethod
     def _warn_deprecate(
@@ -2122,6 +2238,10 @@ def initialize_config() -> AirflowConfigParser:
         # file on top of it.
         if airflow_config_parser.getboolean("core", "unit_test_mode"):
             airflow_config_parser.load_test_config()
+    if airflow_config_parser.getboolean("core", "cache_config_values"):
+        airflow_config_parser.enable_value_cache(
+            sensitive_ttl=airflow_config_parser.getint("core", "cache_config_values_ttl_seconds")
+        )
     return airflow_config_parser
 
 
@@ -53,7 +53,12 @@ from airflow.api_fastapi.execution_api.app import InProcessExecutionAPI
 from airflow.configuration import conf
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParserWorker,
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    file_fingerprint,
+)
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -105,6 +110,35 @@ class DagFileStat:
     last_num_of_db_queries: int = 0
 
 
+@attrs.define
+class ParseResultCacheEntry:
+    """Fingerprints of a successfully parsed DAG file, used to skip parsing it again while unchanged."""
+
+    file_fingerprint: str
+    module_fingerprints: dict[str, str]
+    dag_ids: list[str]
+    cached_at: float
+    bundle_version: str | None
+
+    def is_valid(self, fingerprint: str | None, bundle_version: str | None, now: float, ttl: float) -> bool:
+        """
+        Check whether the file and the bundle modules it imported are unchanged and the entry is fresh.
+
+        A new bundle version always needs the file to be parsed again, as its DAGs are recorded against the
+        bundle version they were parsed from.
+        """
+        if (
+            fingerprint != self.file_fingerprint
+            or bundle_version != self.bundle_version
+            or now - self.cached_at > ttl
+        ):
+            return False
+        return all(
+            file_fingerprint(path) == module_fingerprint
+            for path, module_fingerprint in self.module_fingerprints.items()
+        )
+
+
 @dataclass(frozen=True)
 class DagFileInfo:
     """Information about a DAG file."""
@@ -230,6 +264,24 @@ class DagFileProcessorManager(LoggingMixin):
     _api_server: InProcessExecutionAPI = attrs.field(init=False, factory=InProcessExecutionAPI)
     """API server to interact with Metadata DB"""
 
+    parse_result_cache_ttl: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parse_result_cache_ttl")
+    )
+    _parse_result_cache: dict[DagFileInfo, ParseResultCacheEntry] = attrs.field(factory=dict, init=False)
+    _parsing_fingerprints: dict[DagFileInfo, str | None] = attrs.field(factory=dict, init=False)
+    """Fingerprints of the files being parsed, taken right before their processor was started"""
+
+    parser_worker_max_parses: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parser_worker_max_parses")
+    )
+    parser_worker_max_memory: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parser_worker_max_memory")
+    )
+    _idle_workers: list[DagFileParserWorker] = attrs.field(factory=list, init=False)
+    """Parser workers waiting for the next file, when ``parser_worker_max_parses`` is set"""
+    _stopping_workers: list[tuple[DagFileParserWorker, float]] = attrs.field(factory=list, init=False)
+    """Recycled parser workers that were asked to exit, with the time to kill them at if they have not"""
+
     def register_exit_signals(self):
         """Register signals that stop child processes."""
         signal.signal(signal.SIGINT, self._exit_gracefully)
@@ -367,6 +419,8 @@ class DagFileProcessorManager(LoggingMixin):
 
             self._collect_results()
 
+            self._reap_stopping_workers()
+
             for callback in self._fetch_callbacks():
                 self._add_callback_to_queue(callback)
             self._scan_stale_dags()
@@ -381,6 +435,7 @@ class DagFileProcessorManager(LoggingMixin):
                 self.log.info(
                     "Exiting dag parsing loop as all files have been processed %s times", self.max_runs
                 )
+                self._stop_idle_workers()
                 break
 
             loop_duration = time.monotonic() - loop_start_time
@@ -798,6 +853,10 @@ class DagFileProcessorManager(LoggingMixin):
         stats_to_remove = set(self._file_stats).difference(present)
         for file in stats_to_remove:
             del self._file_stats[file]
+        for file in set(self._parse_result_cache).difference(present):
+            del self._parse_result_cache[file]
+        for file in set(self._parsing_fingerprints).difference(present):
+            del self._parsing_fingerprints[file]
 
     def terminate_orphan_processes(self, present: set[DagFileInfo]):
         """Stop processors that are working on deleted files."""
@@ -832,10 +891,110 @@ class DagFileProcessorManager(LoggingMixin):
                 parsing_result=proc.parsing_result,
                 session=session,
             )
+            if file in self._parsing_fingerprints:
+                self._update_parse_result_cache(file, proc)
 
         for file in finished:
             processor = self._processors.pop(file)
-            processor.logger_filehandle.close()
+            if isinstance(processor, DagFileParserWorker):
+                self._release_worker(processor)
+            else:
+                processor.logger_filehandle.close()
+
+    def _release_worker(self, worker: DagFileParserWorker) -> None:
+        """Make a worker that finished parsing a file available again, or replace it if it has to be."""
+        worker.release_logger(structlog.get_logger(logger_name="processor"))
+        if worker.should_recycle(self.parser_worker_max_parses, self.parser_worker_max_memory):
+            self.log.debug("Recycling parser worker %s after %d files", worker.pid, worker.parse_count)
+            Stats.incr("dag_processing.parser_worker_recycles")
+            # Reaped by the parsing loop, so that it does not wait for the worker to exit
+            worker.stop(signal.SIGTERM)
+            self._stopping_workers.append((worker, time.monotonic() + 5.0))
+        else:
+            self._idle_workers.append(worker)
+
+    def _reap_stopping_workers(self) -> None:
+        """Forget the recycled parser workers that exited, and kill the ones that take too long to."""
+        now = time.monotonic()
+        still_stopping = []
+        for worker, kill_at in self._stopping_workers:
+            if worker.poll() is not None:
+                continue
+            if now >= kill_at:
+                self.log.warning("Parser worker %s did not exit in time, killing it", worker.pid)
+                worker.stop(signal.SIGKILL)
+            still_stopping.append((worker, kill_at))
+        self._stopping_workers = still_stopping
+
+    def _update_parse_result_cache(self, file: DagFileInfo, proc: DagFileProcessorProcess) -> None:
+        """
+        Cache the fingerprints of a parsed file, if the result only depends on the bundle's code.
+
+        Files that failed to import, or requested Variables, Connections or DAG runs while being parsed
+        are never cached, as their result may change without any change to the files.
+        """
+        fingerprint = self._parsing_fingerprints.pop(file)
+        result = proc.parsing_result
+        if (
+            fingerprint is None
+            or result is None
+            or result.import_errors
+            or result.module_fingerprints is None
+            or proc.requested_external_state
+        ):
+            self._parse_result_cache.pop(file, None)
+            return
+        self._parse_result_cache[file] = ParseResultCacheEntry(
+            file_fingerprint=fingerprint,
+            module_fingerprints=result.module_fingerprints,
+            dag_ids=[dag.dag_id for dag in result.serialized_dags],
+            cached_at=time.monotonic(),
+            bundle_version=self._bundle_versions[file.bundle_name],
+        )
+
+    @provide_session
+    def _reuse_parse_result(self, file: DagFileInfo, session: Session = NEW_SESSION) -> bool:
+        """
+        Skip parsing a file whose contents and imported bundle modules did not change since it was cached.
+
+        Parsing the file would produce the same DAGs again, so only the ``last_parsed_time`` of its DAGs is
+        refreshed, to keep them from being deactivated as stale.
+
+        :return: Whether the cached result was used, and the file does not need to be parsed
+        """
+        if self.parse_result_cache_ttl <= 0 or self._callback_to_execute.get(file):
+            return False
+
+        fingerprint = file_fingerprint(file.absolute_path)
+        entry = self._parse_result_cache.get(file)
+        bundle_version = self._bundle_versions[file.bundle_name]
+        if entry is None or not entry.is_valid(
+            fingerprint, bundle_version, time.monotonic(), self.parse_result_cache_ttl
+        ):
+            self._parse_result_cache.pop(file, None)
+            self._parsing_fingerprints[file] = fingerprint
+            Stats.incr("dag_processing.parse_result_cache_misses")
+            return False
+
+        now = timezone.utcnow()
+        if entry.dag_ids:
+            session.execute(
+                update(DagModel)
+                .where(DagModel.dag_id.in_(entry.dag_ids))
+                .values(last_parsed_time=now)
+                .execution_options(synchronize_session=False)
+            )
+        stat = self._file_stats[file]
+        self._file_stats[file] = DagFileStat(
+            num_dags=stat.num_dags,
+            import_errors=stat.import_errors,
+            last_finish_time=now,
+            last_duration=stat.last_duration,
+            run_count=stat.run_count + 1,
+            last_num_of_db_queries=stat.last_num_of_db_queries,
+        )
+        Stats.incr("dag_processing.parse_result_cache_hits")
+        return True
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -900,6 +1059,26 @@ class DagFileProcessorManager(LoggingMixin):
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
         logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
 
+        if self.parser_worker_max_parses > 0:
+            if self._idle_workers:
+                worker = self._idle_workers.pop()
+            else:
+                worker = DagFileParserWorker.start(
+                    id=id,
+                    selector=self.selector,
+                    logger=logger,
+                    logger_filehandle=logger_filehandle,
+                    client=self.client,
+                )
+            worker.parse_file(
+                path=dag_file.absolute_path,
+                bundle_path=cast("Path", dag_file.bundle_path),
+                callbacks=callback_to_execute_for_file,
+                logger=logger,
+                logger_filehandle=logger_filehandle,
+            )
+            return worker
+
         return DagFileProcessorProcess.start(
             id=id,
             path=dag_file.absolute_path,
@@ -918,6 +1097,8 @@ class DagFileProcessorManager(LoggingMixin):
             # Stop creating duplicate processor i.e. processor with the same filepath
             if file in self._processors:
                 continue
+            if self._reuse_parse_result(file):
+                continue
 
             processor = self._create_process(file)
             Stats.incr("dag_processing.processes", tags={"file_path": file, "action": "start"})
@@ -1036,6 +1217,7 @@ class DagFileProcessorManager(LoggingMixin):
                 processor.kill(signal.SIGKILL)
 
                 processors_to_remove.append(file)
+                self._parsing_fingerprints.pop(file, None)
 
                 stat = DagFileStat(
                     num_dags=0,
@@ -1076,10 +1258,22 @@ class DagFileProcessorManager(LoggingMixin):
             Stats.decr("dag_processing.processes", tags={"file_path": file, "action": "terminate"})
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
+        self._stop_idle_workers()
+
+    def _stop_idle_workers(self):
+        """Stop the parser workers that are not parsing any file, and wait for the recycled ones to exit."""
+        for worker in self._idle_workers:
+            worker.kill(signal.SIGTERM, escalation_delay=5.0)
+        self._idle_workers.clear()
+        for worker, _ in self._stopping_workers:
+            worker.kill(signal.SIGTERM, escalation_delay=5.0, force=True)
+        self._stopping_workers.clear()
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
         pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill.extend(worker.pid for worker in self._idle_workers)
+        pids_to_kill.extend(worker.pid for worker, _ in self._stopping_workers)
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
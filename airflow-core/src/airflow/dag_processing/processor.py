@@ -19,13 +19,16 @@ from __future__ import annotations
 import contextlib
 import importlib
 import os
+import signal
 import sys
+import time
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
 
 import attrs
+import psutil
 from pydantic import BaseModel, Field, TypeAdapter
 
 from airflow.callbacks.callback_requests import (
@@ -54,6 +57,7 @@ from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
 from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedDAG
 from airflow.stats import Stats
 from airflow.utils.file import iter_airflow_imports
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
@@ -94,11 +98,24 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    module_fingerprints: dict[str, str] | None = None
+    """Fingerprints of the modules from the bundle imported by the file, ``None`` if they are unknown."""
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileParseFinished(BaseModel):
+    """
+    Sent by a :class:`DagFileParserWorker` once it handled a :class:`DagFileParseRequest`.
+
+    The worker is ready to receive the next request after this.
+    """
+
+    type: Literal["DagFileParseFinished"] = "DagFileParseFinished"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileParseFinished
     | GetConnection
     | GetVariable
     | PutVariable
@@ -120,6 +137,40 @@ ToDagProcessor = Annotated[
 ]
 
 
+def file_fingerprint(path: str | os.PathLike[str]) -> str | None:
+    """Return a fingerprint of the contents of the given file, or ``None`` if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return md5(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _iter_bundle_modules(bundle_path: Path) -> Iterator[tuple[str, str]]:
+    """Yield the name and file path of the imported modules that are part of the given dag bundle."""
+    bundle_root = os.path.join(os.fspath(bundle_path), "")
+    for name, module in list(sys.modules.items()):
+        module_path = getattr(module, "__file__", None)
+        if module_path and module_path.startswith(bundle_root):
+            yield name, module_path
+
+
+def _get_module_fingerprints(file_path: str, bundle_path: Path) -> dict[str, str] | None:
+    """
+    Fingerprint the modules from the dag bundle that are imported, other than the parsed file itself.
+
+    :return: A mapping of module file path to fingerprint, or ``None`` if any of them cannot be read
+    """
+    fingerprints = {}
+    for _, module_path in _iter_bundle_modules(bundle_path):
+        if module_path == file_path:
+            continue
+        if (fingerprint := file_fingerprint(module_path)) is None:
+            return None
+        fingerprints[module_path] = fingerprint
+    return fingerprints
+
+
 def _pre_import_airflow_modules(file_path: str, log: FilteringBoundLogger) -> None:
     """
     Pre-import Airflow modules found in the given file.
@@ -168,6 +219,49 @@ def _parse_file_entrypoint():
         comms_decoder.send(result)
 
 
+def _parse_files_entrypoint():
+    """
+    Parse DAG files until the manager closes the connection, see :class:`DagFileParserWorker`.
+
+    After each file, the modules of its dag bundle are unloaded, so a change to them is seen when the next
+    file imports them. Other imports, such as Airflow and provider modules, stay warm for the next file.
+    """
+    import structlog
+
+    from airflow.sdk.execution_time import comms, task_runner
+
+    comms_decoder = comms.CommsDecoder[ToDagProcessor, ToManager](
+        body_decoder=TypeAdapter[ToDagProcessor](ToDagProcessor),
+    )
+    task_runner.SUPERVISOR_COMMS = comms_decoder
+    log = structlog.get_logger(logger_name="task")
+
+    while True:
+        try:
+            msg = comms_decoder._get_response()
+        except EOFError:
+            return
+        if not isinstance(msg, DagFileParseRequest):
+            raise RuntimeError(f"Expected a DagFileParseRequest, it was {msg}")
+
+        # The bundle root, and whatever the file adds to sys.path, is only on it while parsing the file
+        sys_path = sys.path.copy()
+        try:
+            if (bundle_root := os.fspath(msg.bundle_path)) not in sys.path:
+                sys.path.append(bundle_root)
+            _pre_import_airflow_modules(msg.file, log)
+            result = _parse_file(msg, log)
+            if result is not None:
+                comms_decoder.send(result)
+        except Exception:
+            log.exception("Failed to process DAG file", file=msg.file)
+        finally:
+            sys.path[:] = sys_path
+            for name, _ in _iter_bundle_modules(msg.bundle_path):
+                del sys.modules[name]
+        comms_decoder.send(DagFileParseFinished())
+
+
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
     # TODO: Set known_pool names on DagBag!
 
@@ -191,6 +285,7 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         import_errors=bag.import_errors,
         # TODO: Make `bag.dag_warnings` not return SQLA model objects
         warnings=[],
+        module_fingerprints=_get_module_fingerprints(msg.file, msg.bundle_path),
     )
     return result
 
@@ -352,6 +447,8 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
     logger_filehandle: BinaryIO
     parsing_result: DagFileParsingResult | None = None
+    requested_external_state: bool = False
+    """Whether the file requested Variables, Connections or DAG runs while it was being parsed."""
     decoder: ClassVar[TypeAdapter[ToManager]] = TypeAdapter[ToManager](ToManager)
 
     client: Client
@@ -394,6 +491,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
         resp: BaseModel | None = None
         dump_opts = {}
+        if not isinstance(msg, (DagFileParsingResult, DagFileParseFinished)):
+            self.requested_external_state = True
+
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
         elif isinstance(msg, GetConnection):
@@ -450,3 +550,97 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
     def wait(self) -> int:
         raise NotImplementedError(f"Don't call wait on {type(self).__name__} objects")
+
+
+@attrs.define
+class _ParserWorkerLogger:
+    """Send the logs of a :class:`DagFileParserWorker` to the logger of the file it is currently parsing."""
+
+    target: FilteringBoundLogger
+
+    def __getattr__(self, name: str):
+        return getattr(self.target, name)
+
+
+@attrs.define(kw_only=True)
+class DagFileParserWorker(DagFileProcessorProcess):
+    """
+    Long-lived process that parses one DAG file after the other.
+
+    Unlike :class:`DagFileProcessorProcess`, which forks a new process for every file, the worker keeps its
+    imports warm between files. It is started once with :meth:`start`, and is then given files to parse
+    with :meth:`parse_file`, one at a time.
+    """
+
+    parse_count: int = 0
+    """Number of files given to this worker so far."""
+
+    parse_finished: bool = False
+
+    _log_router: _ParserWorkerLogger = attrs.field(repr=False)
+
+    @classmethod
+    def start(  # type: ignore[override]
+        cls,
+        *,
+        client: Client,
+        target: Callable[[], None] = _parse_files_entrypoint,
+        **kwargs,
+    ) -> Self:
+        kwargs["logger"] = kwargs["log_router"] = _ParserWorkerLogger(kwargs["logger"])
+        return super(DagFileProcessorProcess, cls).start(target=target, client=client, **kwargs)
+
+    def parse_file(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        callbacks: list[CallbackRequest],
+        logger: FilteringBoundLogger,
+        logger_filehandle: BinaryIO,
+    ) -> None:
+        """Send the next file to parse to the worker, with the logger to send its logs to."""
+        self._log_router.target = logger
+        self.logger_filehandle = logger_filehandle
+        self.parsing_result = None
+        self.requested_external_state = False
+        self.parse_finished = False
+        self.parse_count += 1
+        self.start_time = time.monotonic()
+        self._on_child_started(callbacks, path, bundle_path)
+
+    def release_logger(self, logger: FilteringBoundLogger) -> None:
+        """Close the log file of the parsed file, and send any further logs to ``logger`` until the next."""
+        self._log_router.target = logger
+        self.logger_filehandle.close()
+
+    def should_recycle(self, max_parses: int, max_memory_mb: int) -> bool:
+        """Whether the worker has to be replaced, as it parsed ``max_parses`` files or uses too much memory."""
+        if self._check_subprocess_exit() is not None:
+            return True
+        if self.parse_count >= max_parses:
+            return True
+        if max_memory_mb > 0:
+            with contextlib.suppress(psutil.Error):
+                return self._process.memory_info().rss > max_memory_mb * 1024 * 1024
+        return False
+
+    def stop(self, sig: signal.Signals = signal.SIGTERM) -> None:
+        """Send the worker a signal to exit, without waiting for it to; :meth:`poll` tells once it has."""
+        with contextlib.suppress(psutil.NoSuchProcess):
+            self._process.send_signal(sig)
+
+    def poll(self) -> int | None:
+        """Get the exit code of the worker, or None if it is still running."""
+        return self._check_subprocess_exit(expect_signal=signal.SIGTERM)
+
+    def _handle_request(self, msg: ToManager, log: FilteringBoundLogger, req_id: int) -> None:
+        if isinstance(msg, DagFileParseFinished):
+            self.parse_finished = True
+            self.send_msg(None, request_id=req_id)
+            return
+        super()._handle_request(msg, log, req_id)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.parse_finished or super().is_ready
@@ -18,6 +18,8 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 from collections import defaultdict, deque
 from collections.abc import Sequence
@@ -64,6 +66,115 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+class QueuedTasks(dict):
+    """
+    Dict of queued workloads that can return its items in priority order without sorting all of them.
+
+    Next to the dict, the keys are kept in a heap ordered by descending ``priority_weight`` and then by
+    insertion order -- the same order as a stable sort of the dict by descending ``priority_weight``.
+    Overwriting a key keeps its place in the insertion order, like it does in a dict.
+
+    Removing or re-weighting a key leaves its old heap entry behind. Such stale entries are skipped when the
+    heap is read, and the heap is rebuilt once they outnumber the queued tasks.
+
+    :meta private:
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._heap: list[tuple[int, int, TaskInstanceKey]] = []
+        # Key -> (negated priority_weight, insertion sequence) of its current heap entry
+        self._entries: dict[TaskInstanceKey, tuple[int, int]] = {}
+        self._sequence = itertools.count()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: TaskInstanceKey, value: workloads.ExecuteTask) -> None:
+        priority = -value.ti.priority_weight
+        entry = self._entries.get(key)
+        super().__setitem__(key, value)
+        if entry is None:
+            entry = (priority, next(self._sequence))
+        elif entry[0] != priority:
+            entry = (priority, entry[1])
+        else:
+            return
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (*entry, key))
+        self._maybe_compact()
+
+    def __delitem__(self, key: TaskInstanceKey) -> None:
+        super().__delitem__(key)
+        del self._entries[key]
+        self._maybe_compact()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        # The dict items would otherwise be restored before the heap exists; the dict order is the
+        # insertion order the heap entries are rebuilt from
+        return type(self), (dict(self),)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        del self._entries[key]
+        self._maybe_compact()
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._heap.clear()
+        self._entries.clear()
+
+    def items_by_priority(self, limit: int | None = None) -> list[tuple[TaskInstanceKey, Any]]:
+        """
+        Return up to ``limit`` items, highest ``priority_weight`` first, without removing them.
+
+        :param limit: Maximum number of items to return, all of them if ``None``.
+        """
+        if limit is None:
+            limit = len(self)
+        items: list[tuple[TaskInstanceKey, Any]] = []
+        popped: list[tuple[int, int, TaskInstanceKey]] = []
+        while self._heap and len(items) < limit:
+            heap_entry = heapq.heappop(self._heap)
+            priority, sequence, key = heap_entry
+            if self._entries.get(key) != (priority, sequence):
+                continue
+            # A key that went back to an earlier priority_weight has two identical entries, keep one
+            if popped and popped[-1] == heap_entry:
+                continue
+            popped.append(heap_entry)
+            items.append((key, self[key]))
+        for heap_entry in popped:
+            heapq.heappush(self._heap, heap_entry)
+        return items
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self) + 64:
+            self._heap = [(*entry, key) for key, entry in self._entries.items()]
+            heapq.heapify(self._heap)
+
+
 @dataclass
 class RunningRetryAttemptType:
     """
@@ -146,7 +257,7 @@ class BaseExecutor(LoggingMixin):
 
         self.parallelism: int = parallelism
         self.team_id: str | None = team_id
-        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = QueuedTasks()
         self.running: set[TaskInstanceKey] = set()
         self.event_buffer: dict[TaskInstanceKey, EventBufferValueType] = {}
         self._task_event_logs: deque[Log] = deque()
@@ -304,6 +415,9 @@ class BaseExecutor(LoggingMixin):
         if not self.queued_tasks:
             return []
 
+        if isinstance(self.queued_tasks, QueuedTasks):
+            return self.queued_tasks.items_by_priority()
+
         # V3 + new executor that supports workloads
         return sorted(
             self.queued_tasks.items(),
@@ -311,6 +425,18 @@ class BaseExecutor(LoggingMixin):
             reverse=True,
         )
 
+    def _next_queued_tasks_by_priority(
+        self, num_tasks: int
+    ) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+        """Return the ``num_tasks`` queued tasks with the highest priority, in order."""
+        if (
+            isinstance(self.queued_tasks, QueuedTasks)
+            and type(self).order_queued_tasks_by_priority is BaseExecutor.order_queued_tasks_by_priority
+        ):
+            # Only read the top of the heap rather than ordering every queued task
+            return self.queued_tasks.items_by_priority(num_tasks)
+        return self.order_queued_tasks_by_priority()[:num_tasks]
+
     @add_debug_span
     def trigger_tasks(self, open_slots: int) -> None:
         """
@@ -318,12 +444,9 @@ class BaseExecutor(LoggingMixin):
 
         :param open_slots: Number of open slots
         """
-        sorted_queue = self.order_queued_tasks_by_priority()
         workload_list = []
 
-        for _ in range(min((open_slots, len(self.queued_tasks)))):
-            key, item = sorted_queue.pop(0)
-
+        for key, item in self._next_queued_tasks_by_priority(min(open_slots, len(self.queued_tasks))):
             # If a task makes it here but is still understood by the executor
             # to be running, it generally means that the task has been killed
             # externally and not yet been marked as failed.
@@ -25,33 +25,69 @@ LocalExecutor.
 
 from __future__ import annotations
 
-import ctypes
+import contextlib
 import logging
 import multiprocessing
-import multiprocessing.sharedctypes
 import os
-from multiprocessing import Queue, SimpleQueue
-from typing import TYPE_CHECKING
+import selectors
+import socket
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
+import msgspec
+from pydantic import TypeAdapter
 from setproctitle import setproctitle
 
 from airflow.executors import workloads
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
-    TaskInstanceStateType = tuple[workloads.TaskInstance, TaskInstanceState, Exception | None]
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
 
 
-def _run_worker(
-    logger_name: str,
-    input: SimpleQueue[workloads.All | None],
-    output: Queue[TaskInstanceStateType],
-    unread_messages: multiprocessing.sharedctypes.Synchronized[int],
-):
+def _send_frame(sock: socket.socket, obj: Any) -> None:
+    """Send ``obj`` as a msgpack frame, prefixed with its length."""
+    data = _encoder.encode(obj)
+    sock.sendall(len(data).to_bytes(4, byteorder="big") + data)
+
+
+def _recv_exactly(sock: socket.socket, length: int) -> bytes | None:
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    pos = 0
+    while pos < length:
+        nread = sock.recv_into(view[pos:])
+        if not nread:
+            return None
+        pos += nread
+    return bytes(buffer)
+
+
+def _recv_frame(sock: socket.socket) -> Any:
+    """
+    Receive a frame sent with :func:`_send_frame`.
+
+    :return: The decoded object, or ``None`` if the other end of the socket was closed
+    """
+    if (length := _recv_exactly(sock, 4)) is None:
+        return None
+    if (data := _recv_exactly(sock, int.from_bytes(length, byteorder="big"))) is None:
+        return None
+    return _decoder.decode(data)
+
+
+def _run_worker(logger_name: str, conn: socket.socket):
+    """
+    Run the workloads the executor sends over ``conn``, one at a time, and send back their state.
+
+    The worker exits once the executor shuts down its end of ``conn``.
+    """
     import signal
 
     # Ignore ctrl-c in this process -- we don't want to kill _this_ one. we let tasks run to completion
@@ -60,41 +96,29 @@ def _run_worker(
     log = logging.getLogger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    workload_adapter: TypeAdapter[workloads.All] = TypeAdapter(workloads.All)
     while True:
         setproctitle("airflow worker -- LocalExecutor: <idle>")
-        try:
-            workload = input.get()
-        except EOFError:
+        frame = _recv_frame(conn)
+        if frame is None:
             log.info(
-                "Failed to read tasks from the task queue because the other "
-                "end has closed the connection. Terminating worker %s.",
+                "The executor has closed the connection, no more tasks to run. Terminating worker %s.",
                 multiprocessing.current_process().name,
             )
-            break
-
-        if workload is None:
-            # Received poison pill, no more tasks to run
             return
 
+        workload = workload_adapter.validate_python(frame)
         if not isinstance(workload, workloads.ExecuteTask):
             raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
 
-        # Decrement this as soon as we pick up a message off the queue
-        with unread_messages:
-            unread_messages.value -= 1
-        key = None
-        if ti := getattr(workload, "ti", None):
-            key = ti.key
-        else:
-            raise TypeError(f"Don't know how to get ti key from {type(workload).__name__}")
-
+        key = workload.ti.key
         try:
             _execute_work(log, workload)
 
-            output.put((key, TaskInstanceState.SUCCESS, None))
+            _send_frame(conn, (key, TaskInstanceState.SUCCESS, None))
         except Exception as e:
             log.exception("uhoh")
-            output.put((key, TaskInstanceState.FAILED, e))
+            _send_frame(conn, (key, TaskInstanceState.FAILED, repr(e)))
 
 
 def _execute_work(log: logging.Logger, workload: workloads.ExecuteTask) -> None:
@@ -132,7 +156,8 @@ class LocalExecutor(BaseExecutor):
     """
     LocalExecutor executes tasks locally in parallel.
 
-    It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
+    It uses the multiprocessing Python library to run tasks in worker processes. Each worker has its own
+    socket to the executor, over which it is sent one workload at a time and sends back the resulting state.
 
     :param parallelism: how many parallel processes are run in the executor
     """
@@ -141,10 +166,11 @@ class LocalExecutor(BaseExecutor):
 
     serve_logs: bool = True
 
-    activity_queue: SimpleQueue[workloads.All | None]
-    result_queue: SimpleQueue[TaskInstanceStateType]
     workers: dict[int, multiprocessing.Process]
-    _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
+    _worker_conns: dict[int, socket.socket]
+    _idle_workers: deque[int]
+    _pending_workloads: deque[workloads.All]
+    _selector: selectors.BaseSelector
 
     def __init__(self, parallelism: int = PARALLELISM):
         super().__init__(parallelism=parallelism)
@@ -153,70 +179,89 @@ class LocalExecutor(BaseExecutor):
 
     def start(self) -> None:
         """Start the executor."""
-        # We delay opening these queues until the start method mostly for unit tests. ExecutorLoader caches
-        # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the queues, then test 2
+        # We delay creating these until the start method mostly for unit tests. ExecutorLoader caches
+        # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the sockets, then test 2
         # comes back and gets the same LocalExecutor instance, so we have to open new here.)
-        self.activity_queue = SimpleQueue()
-        self.result_queue = SimpleQueue()
         self.workers = {}
-
-        # Mypy sees this value as `SynchronizedBase[c_uint]`, but that isn't the right runtime type behaviour
-        # (it looks like an int to python)
-        self._unread_messages = multiprocessing.Value(ctypes.c_uint)
+        self._worker_conns = {}
+        self._idle_workers = deque()
+        self._pending_workloads = deque()
+        self._selector = selectors.DefaultSelector()
 
     def _check_workers(self):
         # Reap any dead workers
-        to_remove = set()
-        for pid, proc in self.workers.items():
+        for pid, proc in list(self.workers.items()):
             if not proc.is_alive():
-                to_remove.add(pid)
                 proc.close()
-
-        if to_remove:
-            self.workers = {pid: proc for pid, proc in self.workers.items() if pid not in to_remove}
-
-        with self._unread_messages:
-            num_outstanding = self._unread_messages.value
-
-        if num_outstanding <= 0 or self.activity_queue.empty():
-            # Nothing to do. Future enhancement if someone wants: shut down workers that have been idle for N
-            # seconds
-            return
-
-        # If we're using spawn in multiprocessing (default on macOS now) to start tasks, this can get called a
-        # via `sync()` a few times before the spawned process actually starts picking up messages. Try not to
-        # create too much
-        need_more_workers = len(self.workers) < num_outstanding
-        if need_more_workers and (self.parallelism == 0 or len(self.workers) < self.parallelism):
-            # This only creates one worker, which is fine as we call this directly after putting a message on
-            # activity_queue in execute_async
-            self._spawn_worker()
+                del self.workers[pid]
+                self._close_worker_conn(pid)
+
+        self._send_pending_workloads()
+
+    def _send_pending_workloads(self):
+        """Send the pending workloads to idle workers, starting new workers as long as parallelism allows."""
+        while self._pending_workloads:
+            if not self._idle_workers:
+                if self.parallelism and len(self.workers) >= self.parallelism:
+                    # Wait for a worker to be done with its workload.
+                    # Future enhancement if someone wants: shut down workers that have been idle for N seconds
+                    return
+                self._spawn_worker()
+                continue
+
+            pid = self._idle_workers.popleft()
+            workload = self._pending_workloads[0]
+            try:
+                _send_frame(self._worker_conns[pid], workload.model_dump(mode="json"))
+            except OSError:
+                # The worker died while idle, try the next one
+                self._close_worker_conn(pid)
+                continue
+            self._pending_workloads.popleft()
 
     def _spawn_worker(self):
+        conn, child_conn = socket.socketpair()
         p = multiprocessing.Process(
             target=_run_worker,
             kwargs={
                 "logger_name": self.log.name,
-                "input": self.activity_queue,
-                "output": self.result_queue,
-                "unread_messages": self._unread_messages,
+                "conn": child_conn,
             },
         )
         p.start()
+        child_conn.close()
         if TYPE_CHECKING:
             assert p.pid  # Since we've called start
         self.workers[p.pid] = p
+        self._worker_conns[p.pid] = conn
+        self._selector.register(conn, selectors.EVENT_READ, p.pid)
+        self._idle_workers.append(p.pid)
+
+    def _close_worker_conn(self, pid: int):
+        if (conn := self._worker_conns.pop(pid, None)) is None:
+            return
+        self._selector.unregister(conn)
+        conn.close()
+        if pid in self._idle_workers:
+            self._idle_workers.remove(pid)
 
     def sync(self) -> None:
         """Sync will get called periodically by the heartbeat method."""
         self._read_results()
         self._check_workers()
 
-    def _read_results(self):
-        while not self.result_queue.empty():
-            key, state, exc = self.result_queue.get()
+    def _read_results(self, timeout: float = 0):
+        for selector_key, _ in self._selector.select(timeout=timeout):
+            pid = selector_key.data
+            result = _recv_frame(self._worker_conns[pid])
+            if result is None:
+                # The worker exited
+                self._close_worker_conn(pid)
+                continue
 
-            self.change_state(key, state)
+            key, state, _ = result
+            self.change_state(TaskInstanceKey(*key), TaskInstanceState(state))
+            self._idle_workers.append(pid)
 
     def end(self) -> None:
         """End the executor."""
@@ -225,13 +270,15 @@ class LocalExecutor(BaseExecutor):
             "; waiting for running tasks to finish.  Signal again if you don't want to wait."
         )
 
-        # We can't tell which proc will pick which close message up, so we send all the messages, and then
-        # wait on all the procs
+        # Run the workloads that are still waiting for a worker first
+        while self._pending_workloads and self.workers:
+            self._read_results(timeout=1.0)
+            self._check_workers()
 
-        for proc in self.workers.values():
-            # Send the shutdown message once for each alive worker
-            if proc.is_alive():
-                self.activity_queue.put(None)
+        # Each worker exits once it finished its current workload and sees the end of its connection
+        for conn in self._worker_conns.values():
+            with contextlib.suppress(OSError):
+                conn.shutdown(socket.SHUT_WR)
 
         for proc in self.workers.values():
             if proc.is_alive():
@@ -239,17 +286,15 @@ class LocalExecutor(BaseExecutor):
             proc.close()
 
         # Process any extra results before closing
-        self._read_results()
+        while self._worker_conns:
+            self._read_results()
 
-        self.activity_queue.close()
-        self.result_queue.close()
+        self._selector.close()
 
     def terminate(self):
         """Terminate the executor is not doing anything."""
 
     @provide_session
     def queue_workload(self, workload: workloads.All, session: Session = NEW_SESSION):
-        self.activity_queue.put(workload)
-        with self._unread_messages:
-            self._unread_messages.value += 1
-        self._check_workers()
+        self._pending_workloads.append(workload)
+        self._send_pending_workloads()
@@ -23,8 +23,9 @@ import operator
 import os
 import signal
 import sys
+import threading
 import time
-from collections import Counter, defaultdict, deque
+from collections import Counter, OrderedDict, defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator
 from contextlib import ExitStack
 from datetime import date, timedelta
@@ -32,7 +33,7 @@ from functools import lru_cache, partial
 from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, delete, desc, exists, func, or_, select, text, tuple_, update
+from sqlalchemy import and_, case, delete, desc, exists, func, or_, select, text, tuple_, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import joinedload, lazyload, load_only, make_transient, selectinload
 from sqlalchemy.sql import expression
@@ -45,7 +46,7 @@ from airflow.configuration import conf
 from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.executors import workloads
 from airflow.jobs.base_job_runner import BaseJobRunner
-from airflow.jobs.job import Job, perform_heartbeat
+from airflow.jobs.job import Job, health_check_threshold, perform_heartbeat
 from airflow.models import Log
 from airflow.models.asset import (
     AssetActive,
@@ -65,6 +66,7 @@ from airflow.models.dagwarning import DagWarning, DagWarningType
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.trigger import TRIGGER_FAIL_REPR, TriggerFailureReason
+from airflow.settings import json
 from airflow.stats import Stats
 from airflow.ti_deps.dependencies_states import EXECUTION_STATES
 from airflow.timetables.simple import AssetTriggeredTimetable
@@ -88,9 +90,11 @@ if TYPE_CHECKING:
 
     from pendulum.datetime import DateTime
     from sqlalchemy.orm import Query, Session
+    from sqlalchemy.sql import ColumnElement, Select
 
     from airflow.executors.base_executor import BaseExecutor
     from airflow.executors.executor_utils import ExecutorName
+    from airflow.models.pool import PoolStats
     from airflow.models.taskinstance import TaskInstanceKey
     from airflow.utils.sqlalchemy import (
         CommitProhibitorGuard,
@@ -108,15 +112,44 @@ class SchedulerDagBag:
     """
     Internal class for retrieving and caching dags in the scheduler.
 
+    Deserialized dags are kept in an LRU cache keyed by dag version id. The cache can be bounded by
+    number of entries (``[scheduler] dag_version_cache_size``) and by the approximate size of the
+    serialized dags (``[scheduler] dag_version_cache_max_bytes``); a value of ``0`` disables the
+    respective limit. Versions that are no longer used by any queued or running dag run can be dropped
+    with :meth:`evict_unreferenced`.
+
     :meta private:
     """
 
-    def __init__(self):
-        self._dags: dict[str, DAG] = {}  # dag_version_id to dag
+    def __init__(self, max_size: int | None = None, max_bytes: int | None = None):
+        if max_size is None:
+            max_size = conf.getint("scheduler", "dag_version_cache_size", fallback=0)
+        if max_bytes is None:
+            max_bytes = conf.getint("scheduler", "dag_version_cache_max_bytes", fallback=0)
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._dags: OrderedDict[str, DAG] = OrderedDict()  # dag_version_id to dag, least recently used first
+        self._sizes: dict[str, int] = {}  # dag_version_id to approximate size in bytes
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._dags)
+
+    @staticmethod
+    def _estimate_size(serdag: SerializedDagModel) -> int:
+        data = serdag.data
+        if not data:
+            return 0
+        return len(json.dumps(data))
 
     def _get_dag(self, version_id: str, session: Session) -> DAG | None:
-        if dag := self._dags.get(version_id):
-            return dag
+        with self._lock:
+            if dag := self._dags.get(version_id):
+                self._dags.move_to_end(version_id)
+                Stats.incr("scheduler.dag_bag.cache_hits")
+                return dag
+        Stats.incr("scheduler.dag_bag.cache_misses")
         dag_version = session.get(DagVersion, version_id, options=[joinedload(DagVersion.serialized_dag)])
         if not dag_version:
             return None
@@ -127,9 +160,34 @@ class SchedulerDagBag:
         dag = serdag.dag
         if not dag:
             return None
-        self._dags[version_id] = dag
+        size = self._estimate_size(serdag) if self.max_bytes > 0 else 0
+        with self._lock:
+            self._add(version_id, dag, size)
         return dag
 
+    def _add(self, version_id: str, dag: DAG, size: int) -> None:
+        self._discard(version_id)
+        self._dags[version_id] = dag
+        self._sizes[version_id] = size
+        self._total_bytes += size
+        evicted = 0
+        # Always keep the entry just added, even if it alone exceeds the byte limit.
+        while len(self._dags) > 1 and (
+            (self.max_size > 0 and len(self._dags) > self.max_size)
+            or (self.max_bytes > 0 and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._dags))
+            self._discard(oldest)
+            evicted += 1
+        if evicted:
+            Stats.incr("scheduler.dag_bag.cache_evictions", evicted)
+
+    def _discard(self, version_id: str) -> bool:
+        if self._dags.pop(version_id, None) is None:
+            return False
+        self._total_bytes -= self._sizes.pop(version_id, 0)
+        return True
+
     @staticmethod
     def _version_from_dag_run(dag_run, latest, session):
         if latest or not dag_run.bundle_version:
@@ -145,6 +203,56 @@ class SchedulerDagBag:
             return None
         return self._get_dag(version_id=version.id, session=session)
 
+    @staticmethod
+    def _referenced_version_ids(session: Session) -> set:
+        """
+        Get ids of dag versions that queued or running dag runs may still need.
+
+        That is the version each active dag run was created with, plus the latest version of every dag
+        with an active dag run, since :meth:`get_dag` resolves to the latest version for dag runs that
+        are not pinned to a bundle version.
+        """
+        active_dag_runs = DagRun.state.in_((DagRunState.QUEUED, DagRunState.RUNNING))
+        latest_versions = (
+            select(DagVersion.dag_id, func.max(DagVersion.version_number).label("max_version_number"))
+            .where(DagVersion.dag_id.in_(select(DagRun.dag_id).where(active_dag_runs)))
+            .group_by(DagVersion.dag_id)
+            .subquery()
+        )
+        created_version_ids = session.scalars(
+            select(DagRun.created_dag_version_id).where(active_dag_runs).distinct()
+        )
+        latest_version_ids = session.scalars(
+            select(DagVersion.id).join(
+                latest_versions,
+                and_(
+                    DagVersion.dag_id == latest_versions.c.dag_id,
+                    DagVersion.version_number == latest_versions.c.max_version_number,
+                ),
+            )
+        )
+        return {*created_version_ids, *latest_version_ids} - {None}
+
+    def evict_unreferenced(self, session: Session) -> int:
+        """
+        Drop cached dag versions that are not used by any queued or running dag run.
+
+        :param session: The database session.
+        :return: The number of evicted dag versions.
+        """
+        if not self._dags:
+            return 0
+        referenced = self._referenced_version_ids(session=session)
+        with self._lock:
+            unreferenced = [version_id for version_id in self._dags if version_id not in referenced]
+            for version_id in unreferenced:
+                self._discard(version_id)
+            size = len(self._dags)
+        if unreferenced:
+            Stats.incr("scheduler.dag_bag.cache_evictions", len(unreferenced))
+        Stats.gauge("scheduler.dag_bag.cache_size", size)
+        return len(unreferenced)
+
 
 def _get_current_dag(dag_id: str, session: Session) -> DAG | None:
     serdag = SerializedDagModel.get(dag_id=dag_id, session=session)  # grabs the latest version
@@ -168,10 +276,13 @@ class ConcurrencyMap:
         self.task_concurrency_map: Counter[tuple[str, str]] = Counter()
         self.task_dagrun_concurrency_map: Counter[tuple[str, str, str]] = Counter()
 
-    def load(self, session: Session) -> None:
+    def clear(self) -> None:
         self.dag_run_active_tasks_map.clear()
         self.task_concurrency_map.clear()
         self.task_dagrun_concurrency_map.clear()
+
+    def load(self, session: Session) -> None:
+        self.clear()
         query = session.execute(
             select(TI.dag_id, TI.task_id, TI.run_id, func.count("*"))
             .where(TI.state.in_(EXECUTION_STATES))
@@ -182,6 +293,100 @@ class ConcurrencyMap:
             self.task_concurrency_map[(dag_id, task_id)] += c
             self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += c
 
+    def add_ti(self, ti: TI) -> None:
+        """Account for a task instance that is about to be queued."""
+        self.dag_run_active_tasks_map[(ti.dag_id, ti.run_id)] += 1
+        self.task_concurrency_map[(ti.dag_id, ti.task_id)] += 1
+        self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] += 1
+
+    def _as_tuple(self) -> tuple[Counter, Counter, Counter]:
+        # Drop zero and negative counts so that maps with the same effective content compare equal.
+        return (
+            +self.dag_run_active_tasks_map,
+            +self.task_concurrency_map,
+            +self.task_dagrun_concurrency_map,
+        )
+
+
+class IncrementalConcurrencyMap(ConcurrencyMap, LoggingMixin):
+    """
+    Concurrency map kept in memory across scheduler loops.
+
+    Instead of running a full ``GROUP BY`` over all running and queued task instances in every
+    scheduler loop, the map is updated as the scheduler queues task instances and as executor events
+    report them finished, and is only reconciled against the database every ``reconcile_interval``
+    seconds.
+
+    Task instances leaving the execution states without this scheduler noticing (e.g. finished through
+    another scheduler's executor or marked through the API) keep being counted until the next
+    reconciliation, which can only hold back other task instances for longer than needed. Task
+    instances queued by other schedulers would not be counted at all, which could exceed the limits,
+    so the scheduler counts them from the database with a :class:`ConcurrencyMap` in every loop while
+    other schedulers are running (see :meth:`SchedulerJobRunner._get_concurrency_map`).
+
+    :param reconcile_interval: How often (in seconds) to reconcile the map against the database.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        self._active_tis: set[tuple[str, str, str, int]] = set()
+        self._last_reconciled: float | None = None
+
+    def load(self, session: Session) -> None:
+        self.clear()
+        self._active_tis.clear()
+        query = session.execute(
+            select(TI.dag_id, TI.task_id, TI.run_id, TI.map_index).where(TI.state.in_(EXECUTION_STATES))
+        )
+        for dag_id, task_id, run_id, map_index in query:
+            self._add(dag_id, task_id, run_id, map_index)
+        self._last_reconciled = time.monotonic()
+
+    def _add(self, dag_id: str, task_id: str, run_id: str, map_index: int) -> None:
+        if (key := (dag_id, task_id, run_id, map_index)) in self._active_tis:
+            return
+        self._active_tis.add(key)
+        self.dag_run_active_tasks_map[(dag_id, run_id)] += 1
+        self.task_concurrency_map[(dag_id, task_id)] += 1
+        self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += 1
+
+    def add_ti(self, ti: TI) -> None:
+        self._add(ti.dag_id, ti.task_id, ti.run_id, ti.map_index)
+
+    def remove_ti(self, ti: TI) -> None:
+        """Stop accounting for a task instance that left the execution states."""
+        key = (ti.dag_id, ti.task_id, ti.run_id, ti.map_index)
+        if key not in self._active_tis:
+            return
+        self._active_tis.discard(key)
+        self.dag_run_active_tasks_map[(ti.dag_id, ti.run_id)] -= 1
+        self.task_concurrency_map[(ti.dag_id, ti.task_id)] -= 1
+        self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] -= 1
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next :meth:`refresh`."""
+        self._last_reconciled = None
+
+    def refresh(self, session: Session) -> None:
+        """
+        Reconcile the map against the database if it is due.
+
+        When the in-memory map has drifted from the database, the drift is reported and the map is
+        replaced by the database state.
+        """
+        if self._last_reconciled is None:
+            self.load(session=session)
+            return
+        if time.monotonic() - self._last_reconciled < self.reconcile_interval:
+            return
+
+        incremental = self._as_tuple()
+        self.load(session=session)
+        if incremental != self._as_tuple():
+            Stats.incr("scheduler.concurrency_map.drift")
+            self.log.debug("Concurrency map drifted from the database, reloaded it")
+
 
 def _is_parent_process() -> bool:
     """
@@ -254,6 +459,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self._log = log
 
         self.scheduler_dag_bag = SchedulerDagBag()
+        self._task_selection_strategy = conf.get("scheduler", "task_selection_strategy", fallback="loop")
+
+        concurrency_map_reconcile_interval = conf.getfloat(
+            "scheduler", "concurrency_map_reconcile_interval", fallback=0.0
+        )
+        self._concurrency_map: IncrementalConcurrencyMap | None = None
+        # Whether other schedulers were alive when last checked, and the monotonic time it was checked at
+        self._other_schedulers_alive = False
+        self._other_schedulers_checked_at: float | None = None
+        if concurrency_map_reconcile_interval > 0:
+            self._concurrency_map = IncrementalConcurrencyMap(
+                reconcile_interval=concurrency_map_reconcile_interval
+            )
 
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
@@ -331,6 +549,138 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("\n\t".join(map(repr, callstack)))
             self.log.info("-" * 80)
 
+    @staticmethod
+    def _scheduled_ti_ids_within_limits(
+        pools: dict[str, PoolStats], starved_filters: list[ColumnElement[bool]]
+    ) -> Select:
+        """
+        Select the ids of scheduled task instances that fit in their pool and DAG run limits.
+
+        Candidates are ranked by priority within their pool and within their DAG run using window
+        functions, so that the pool open slots and the DAG ``max_active_tasks`` limits are applied by the
+        database in a single query instead of being discovered one starved pool or DAG at a time.
+        Task level limits (``max_active_tis_per_dag`` and ``max_active_tis_per_dagrun``) and executor
+        slots are not known to the database and are still checked on the selected task instances; the
+        task instances found starved by them are excluded before ranking in the next query, so that
+        they do not take up the slots of the task instances ranked after them.
+
+        :param pools: Pool stats as returned by :meth:`~airflow.models.pool.Pool.slots_stats`.
+        :param starved_filters: Filters excluding the task instances found starved by earlier queries.
+        """
+        active_tis_per_dag_run = (
+            select(TI.dag_id, TI.run_id, func.count().label("num_active"))
+            .where(TI.state.in_(EXECUTION_STATES))
+            .group_by(TI.dag_id, TI.run_id)
+            .subquery()
+        )
+        # Rank the candidates within their DAG run first, so that task instances held back by the DAG
+        # run limit do not take up pool slots in the pool ranking below.
+        dag_run_ranked = (
+            select(
+                TI.id,
+                TI.pool,
+                TI.pool_slots,
+                TI.priority_weight,
+                TI.map_index,
+                TI.task_id,
+                DR.logical_date,
+                DM.max_active_tasks,
+                func.coalesce(active_tis_per_dag_run.c.num_active, 0).label("num_active"),
+                func.row_number()
+                .over(
+                    partition_by=(TI.dag_id, TI.run_id),
+                    order_by=(-TI.priority_weight, DR.logical_date, TI.map_index, TI.task_id),
+                )
+                .label("dag_run_rank"),
+            )
+            .join(TI.dag_run)
+            .join(TI.dag_model)
+            .outerjoin(
+                active_tis_per_dag_run,
+                and_(
+                    active_tis_per_dag_run.c.dag_id == TI.dag_id,
+                    active_tis_per_dag_run.c.run_id == TI.run_id,
+                ),
+            )
+            .where(
+                DR.state == DagRunState.RUNNING,
+                ~DM.is_paused,
+                DM.bundle_name.is_not(None),
+                TI.state == TaskInstanceState.SCHEDULED,
+                *starved_filters,
+            )
+            .subquery()
+        )
+        candidates = dag_run_ranked.c
+        pool_ranked = (
+            select(
+                candidates.id,
+                candidates.pool,
+                func.sum(candidates.pool_slots)
+                .over(
+                    partition_by=candidates.pool,
+                    order_by=(
+                        -candidates.priority_weight,
+                        candidates.logical_date,
+                        candidates.map_index,
+                        candidates.task_id,
+                    ),
+                    rows=(None, 0),
+                )
+                .label("pool_slots_needed"),
+            )
+            .where(candidates.dag_run_rank + candidates.num_active <= candidates.max_active_tasks)
+            .subquery()
+        )
+        open_slots = {
+            name: int(stats["open"]) for name, stats in pools.items() if stats["open"] != float("inf")
+        }
+        unlimited_pools = [name for name, stats in pools.items() if stats["open"] == float("inf")]
+        within_pool_limits = pool_ranked.c.pool.in_(unlimited_pools)
+        if open_slots:
+            within_pool_limits = or_(
+                within_pool_limits,
+                pool_ranked.c.pool_slots_needed <= case(open_slots, value=pool_ranked.c.pool, else_=0),
+            )
+        return select(pool_ranked.c.id).where(within_pool_limits)
+
+    def _get_concurrency_map(self, session: Session) -> ConcurrencyMap:
+        if self._concurrency_map is None or self._other_schedulers_running(session=session):
+            if self._concurrency_map is not None:
+                # What the other schedulers queue is only seen in the database, so it is counted from there
+                # in every loop, and the incremental map is reloaded once they are gone
+                self._concurrency_map.invalidate()
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
+            return concurrency_map
+        self._concurrency_map.refresh(session=session)
+        return self._concurrency_map
+
+    def _other_schedulers_running(self, session: Session) -> bool:
+        """
+        Whether any scheduler other than this one has heartbeat recently enough to be alive.
+
+        Checked at most once per heartbeat interval of this scheduler.
+        """
+        now = time.monotonic()
+        if (
+            self._other_schedulers_checked_at is None
+            or now - self._other_schedulers_checked_at >= self.job.heartrate
+        ):
+            threshold = health_check_threshold(self.job_type, self.job.heartrate)
+            self._other_schedulers_alive = session.scalar(
+                select(
+                    exists().where(
+                        Job.job_type == self.job_type,
+                        Job.state == JobState.RUNNING,
+                        Job.id.is_distinct_from(self.job.id),
+                        Job.latest_heartbeat > timezone.utcnow() - timedelta(seconds=threshold),
+                    )
+                )
+            )
+            self._other_schedulers_checked_at = now
+        return self._other_schedulers_alive
+
     def _executable_task_instances_to_queued(self, max_tis: int, session: Session) -> list[TI]:
         """
         Find TIs that are ready for execution based on conditions.
@@ -383,8 +733,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        concurrency_map = self._get_concurrency_map(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -415,20 +764,27 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
             )
 
+            starved_filters: list[ColumnElement[bool]] = []
+
             if starved_pools:
-                query = query.where(TI.pool.not_in(starved_pools))
+                starved_filters.append(TI.pool.not_in(starved_pools))
 
             if starved_dags:
-                query = query.where(TI.dag_id.not_in(starved_dags))
+                starved_filters.append(TI.dag_id.not_in(starved_dags))
 
             if starved_tasks:
-                query = query.where(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
+                starved_filters.append(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
 
             if starved_tasks_task_dagrun_concurrency:
-                query = query.where(
+                starved_filters.append(
                     tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
                 )
 
+            query = query.where(*starved_filters)
+
+            if self._task_selection_strategy == "window":
+                query = query.where(TI.id.in_(self._scheduled_ti_ids_within_limits(pools, starved_filters)))
+
             query = query.limit(max_tis)
 
             timer = Stats.timer("scheduler.critical_section_query_duration")
@@ -627,15 +983,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.add_ti(task_instance)
 
                 pool_stats["open"] = open_slots
 
-            is_done = executable_tis or len(task_instances_to_examine) < max_tis
+            is_done = executable_tis or (
+                # The window query leaves out task instances that fit once the starved ones are excluded
+                len(task_instances_to_examine) < max_tis and self._task_selection_strategy != "window"
+            )
             # Check this to avoid accidental infinite loops
             found_new_filters = (
                 len(starved_pools) > num_starved_pools
@@ -769,11 +1124,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             job_id=self.job.id,
             scheduler_dag_bag=self.scheduler_dag_bag,
             session=session,
+            concurrency_map=self._concurrency_map,
         )
 
     @classmethod
     def process_executor_events(
-        cls, executor: BaseExecutor, job_id: str | None, scheduler_dag_bag: SchedulerDagBag, session: Session
+        cls,
+        executor: BaseExecutor,
+        job_id: str | None,
+        scheduler_dag_bag: SchedulerDagBag,
+        session: Session,
+        concurrency_map: IncrementalConcurrencyMap | None = None,
     ) -> int:
         """
         Respond to executor events.
@@ -781,6 +1142,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         This is a classmethod because this is also used in `dag.test()`.
         `dag.test` execute DAGs with no scheduler, therefore it needs to handle the events pushed by the
         executors as well.
+
+        :param concurrency_map: If given, task instances that are no longer running or queued are removed
+            from it.
         """
         ti_primary_key_to_try_number_map: dict[tuple[str, str, str, int], int] = {}
         event_buffer = executor.get_event_buffer()
@@ -826,6 +1190,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_id for %s to %s", ti, info)
                 continue
 
+            if concurrency_map is not None and ti.state not in EXECUTION_STATES:
+                concurrency_map.remove_ti(ti)
+
             msg = (
                 "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, "
                 "run_start_date=%s, run_end_date=%s, "
@@ -1253,6 +1620,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self._update_asset_orphanage,
         )
 
+        dag_version_cache_cleanup_interval = conf.getfloat(
+            "scheduler", "dag_version_cache_cleanup_interval", fallback=300.0
+        )
+        if dag_version_cache_cleanup_interval > 0:
+            timers.call_regular_interval(
+                dag_version_cache_cleanup_interval,
+                self._evict_unreferenced_dag_versions,
+            )
+
         if any(x.is_local for x in self.job.executors):
             bundle_cleanup_mgr = BundleUsageTrackingManager()
             check_interval = conf.getint(
@@ -1421,6 +1797,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except OperationalError as e:
                     timer.stop(send=False)
 
+                    if self._concurrency_map is not None:
+                        # The task instances counted in this attempt were not queued after all.
+                        self._concurrency_map.invalidate()
+
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
                         Stats.incr("scheduler.critical_section_busy")
@@ -1453,6 +1833,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         guard.commit()
         # END: create dagruns
 
+    @provide_session
+    def _evict_unreferenced_dag_versions(self, session: Session = NEW_SESSION) -> None:
+        """Drop dag versions no longer used by any queued or running dag run from the scheduler dag bag."""
+        num_evicted = self.scheduler_dag_bag.evict_unreferenced(session=session)
+        if num_evicted:
+            self.log.debug("Evicted %d unreferenced dag versions from the scheduler dag bag", num_evicted)
+
     @provide_session
     def _mark_backfills_complete(self, session: Session = NEW_SESSION) -> None:
         """Mark completed backfills as completed."""
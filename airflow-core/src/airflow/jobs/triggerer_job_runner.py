@@ -17,8 +17,11 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
+import hashlib
 import logging
+import math
 import os
 import selectors
 import signal
@@ -33,6 +36,7 @@ from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, TypedDict
 
 import attrs
+import psutil
 import structlog
 from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import func, select
@@ -43,7 +47,7 @@ from airflow.configuration import conf
 from airflow.executors import workloads
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import perform_heartbeat
-from airflow.models.trigger import Trigger
+from airflow.models.trigger import NEW_TRIGGER_CHANNEL, Trigger
 from airflow.sdk.api.datamodels._generated import HITLDetailResponse
 from airflow.sdk.execution_time.comms import (
     CommsDecoder,
@@ -98,9 +102,9 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
     """
     Run active triggers in asyncio and update their dependent tests/DAGs once their events have fired.
 
-    It runs as two threads:
-     - The main thread does DB calls/checkins
-     - A subthread runs all the async code
+    It runs as two processes:
+     - The main process does DB calls/checkins
+     - ``[triggerer] runner_processes`` subprocesses run all the async code, each with a share of the triggers
     """
 
     job_type = "TriggererJob"
@@ -109,6 +113,7 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         self,
         job: Job,
         capacity=None,
+        runner_processes=None,
     ):
         super().__init__(job)
         if capacity is None:
@@ -117,6 +122,11 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             self.capacity = capacity
         else:
             raise ValueError(f"Capacity number {capacity!r} is invalid")
+        if runner_processes is None:
+            runner_processes = conf.getint("triggerer", "runner_processes")
+        if not isinstance(runner_processes, int) or runner_processes < 1:
+            raise ValueError(f"Number of runner processes {runner_processes!r} is invalid")
+        self.runner_processes = runner_processes
 
     def register_signals(self) -> None:
         """Register signals that stop child processes."""
@@ -158,12 +168,12 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         try:
             # Kick off runner sub-process without DB access
             self.trigger_runner = TriggerRunnerSupervisor.start(
-                job=self.job, capacity=self.capacity, logger=log
+                job=self.job, capacity=self.capacity, runner_processes=self.runner_processes, logger=log
             )
 
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
-            return self.trigger_runner._exit_code
+            return self.trigger_runner.exit_code
         except Exception:
             self.log.exception("Exception when executing TriggerRunnerSupervisor.run")
             raise
@@ -309,6 +319,70 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+def _ring_position(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode(), usedforsecurity=False).digest()[:8], "big")
+
+
+class NewTriggerListener:
+    """
+    Listens for the notifications sent on PostgreSQL when triggers are created.
+
+    Its connection is registered with the selector of the supervisor, so that a notification wakes up the
+    supervisor's main loop.
+    """
+
+    def __init__(self, connection, selector: selectors.BaseSelector):
+        self.connection = connection
+        self.selector = selector
+        self.notified = False
+        self.closed = False
+
+    @classmethod
+    def start(cls, selector: selectors.BaseSelector) -> NewTriggerListener | None:
+        from airflow import settings
+
+        if settings.engine is None or settings.engine.dialect.driver != "psycopg2":
+            log.warning(
+                "New trigger notifications need PostgreSQL with psycopg2, polling for triggers instead"
+            )
+            return None
+
+        pooled_connection = settings.engine.raw_connection()
+        # The connection stays in LISTEN mode for the life of the triggerer, so it must not go back to the pool
+        pooled_connection.detach()
+        connection = pooled_connection.dbapi_connection
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NEW_TRIGGER_CHANNEL}")
+
+        listener = cls(connection, selector)
+        selector.register(connection, selectors.EVENT_READ, (listener._read, listener._on_close))
+        return listener
+
+    def _read(self, connection) -> bool:
+        try:
+            connection.poll()
+        except Exception:
+            log.warning(
+                "Lost the connection listening for new triggers, polling for them instead", exc_info=True
+            )
+            return False
+        if connection.notifies:
+            connection.notifies.clear()
+            self.notified = True
+        return True
+
+    def _on_close(self, connection) -> None:
+        self.closed = True
+        with suppress(KeyError):
+            self.selector.unregister(connection)
+
+    def consume(self) -> bool:
+        """Return whether new triggers were announced since the last call."""
+        notified, self.notified = self.notified, False
+        return notified
+
+
 @attrs.define(kw_only=True)
 class TriggerRunnerSupervisor(WatchedSubprocess):
     """
@@ -316,6 +390,10 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     This class (which runs in the main/sync process) is responsible for querying the DB, sending RunTrigger
     workload messages to the subprocess, and collecting results and updating them in the DB.
+
+    When started with several runner processes, this supervisor also drives the supervisors of the other
+    runner subprocesses (its ``secondary_shards``): they share its selector and its outbound event and
+    failure queues, and the triggers are spread across all of them by consistent hashing on the trigger id.
     """
 
     job: Job
@@ -347,9 +425,32 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # Supervisors of the other runner subprocesses, driven by this one
+    secondary_shards: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False)
+
+    # Sorted (position, shard index) virtual nodes of the consistent hash ring of the shards
+    _shard_ring: list[tuple[int, int]] = attrs.field(factory=list, init=False, repr=False)
+
+    # Number of virtual nodes of each shard on the hash ring, which evens out the share of each shard
+    SHARD_RING_REPLICAS: ClassVar[int] = 64
+
+    # Listens for the creation of triggers, when [triggerer] new_trigger_notifications is enabled
+    new_trigger_listener: NewTriggerListener | None = attrs.field(default=None, init=False, repr=False)
+
+    # How often to load the triggers from the database when not listening for new triggers
+    trigger_poll_interval: ClassVar[float] = 1.0
+
+    # Monotonic time after which the triggers are loaded again, even if no new trigger was announced
+    _next_trigger_load: float = attrs.field(default=0.0, init=False, repr=False)
+
+    # Whether the runner subprocess has reached its main loop, where it can be woken up with SIGUSR2
+    _runner_accepts_wakeup: bool = attrs.field(default=False, init=False, repr=False)
+
     def is_alive(self) -> bool:
-        # Set by `_service_subprocess` in the loop
-        return self._exit_code is None
+        # Set by `_service_subprocess` in the loop, which only checks the exit of this shard's process
+        return self._exit_code is None and all(
+            shard._check_subprocess_exit() is None for shard in self.secondary_shards
+        )
 
     @classmethod
     def start(  # type: ignore[override]
@@ -357,14 +458,92 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         *,
         job: Job,
         logger=None,
+        runner_processes: int = 1,
         **kwargs,
     ):
+        proc = cls._start_shard(job=job, logger=logger, **kwargs)
+        for _ in range(1, runner_processes):
+            # Sharing the selector lets the main loop service the sockets of every runner subprocess at once
+            shard = cls._start_shard(job=job, logger=logger, selector=proc.selector, **kwargs)
+            shard.events = proc.events
+            shard.failed_triggers = proc.failed_triggers
+            proc.secondary_shards.append(shard)
+        if conf.getboolean("triggerer", "new_trigger_notifications"):
+            proc.new_trigger_listener = NewTriggerListener.start(proc.selector)
+        return proc
+
+    @classmethod
+    def _start_shard(cls, *, job: Job, logger=None, **kwargs):
         proc = super().start(id=job.id, job=job, target=cls.run_in_process, logger=logger, **kwargs)
 
         msg = messages.StartTriggerer()
         proc.send_msg(msg, request_id=0)
         return proc
 
+    @property
+    def exit_code(self) -> int | None:
+        """
+        The exit code of this shard, or else of the first secondary shard found to have died.
+
+        A secondary shard only exits when it dies, so its death is never reported as success.
+        """
+        if self._exit_code is not None:
+            return self._exit_code
+        return next(
+            (shard._exit_code or 1 for shard in self.secondary_shards if shard._exit_code is not None), None
+        )
+
+    @property
+    def shards(self) -> list[TriggerRunnerSupervisor]:
+        """The supervisors of all the runner subprocesses, starting with this one."""
+        return [self, *self.secondary_shards]
+
+    @property
+    def shard_capacity(self) -> int:
+        return math.ceil(self.capacity / len(self.shards))
+
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ):
+        for shard in self.secondary_shards:
+            shard.kill(signal_to_send=signal_to_send, escalation_delay=escalation_delay, force=force)
+        super().kill(signal_to_send=signal_to_send, escalation_delay=escalation_delay, force=force)
+
+    def wake_runner(self) -> None:
+        """Have the runner subprocess sync with us now, rather than at its next regular sync."""
+        if self._runner_accepts_wakeup:
+            with suppress(psutil.NoSuchProcess):
+                self.process.send_signal(signal.SIGUSR2)
+
+    def _shard_index_for(self, trigger_id: int, loads: list[int]) -> int:
+        """
+        Pick the shard to run a trigger in.
+
+        This is the first shard clockwise from the trigger id on the hash ring that is below its capacity, so
+        that a trigger stays on the same shard whatever the other triggers are, unless that shard is full.
+        If all shards are full, the first one is used regardless.
+        """
+        if not self.secondary_shards:
+            return 0
+        if not self._shard_ring:
+            self._shard_ring = sorted(
+                (_ring_position(f"{index}-{replica}"), index)
+                for index in range(len(self.shards))
+                for replica in range(self.SHARD_RING_REPLICAS)
+            )
+        start = bisect.bisect(self._shard_ring, (_ring_position(str(trigger_id)), len(self.shards)))
+        first_index = None
+        for offset in range(len(self._shard_ring)):
+            _, index = self._shard_ring[(start + offset) % len(self._shard_ring)]
+            if first_index is None:
+                first_index = index
+            if loads[index] < self.shard_capacity:
+                return index
+        return first_index  # type: ignore[return-value]
+
     @functools.cached_property
     def client(self) -> Client:
         from airflow.sdk.api.client import Client
@@ -386,6 +565,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         dump_opts = {}
 
         if isinstance(msg, messages.TriggerStateChanges):
+            # The runner installs its wake up signal handler before it first reports in
+            self._runner_accepts_wakeup = True
             if msg.events:
                 self.events.extend(msg.events)
             if msg.failures:
@@ -497,18 +678,36 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 log.error("Trigger runner process has died! Exiting.")
                 break
             with DebugTrace.start_span(span_name="triggerer_job_loop", component="TriggererJobRunner"):
-                self.load_triggers()
+                # The runner reports fired and finished triggers as soon as they happen, so this loop can go
+                # round many times a second. Only go to the database for triggers every so often.
+                trigger_load_due = self.trigger_load_due()
+                if trigger_load_due:
+                    self.load_triggers()
 
-                # Wait for up to 1 second for activity
-                self._service_subprocess(1)
+                # Wait for up to 1 second for activity, or until the triggers are next loaded
+                self._service_subprocess(min(1, self._next_trigger_load - time.monotonic()))
 
                 self.handle_events()
                 self.handle_failed_triggers()
-                self.clean_unused()
+                if trigger_load_due:
+                    self.clean_unused()
                 self.heartbeat()
 
                 self.emit_metrics()
 
+    def trigger_load_due(self) -> bool:
+        """Whether to load the triggers from the database: when new ones were announced, or at each poll."""
+        listener = self.new_trigger_listener
+        notified = listener is not None and listener.consume()
+        now = time.monotonic()
+        if not notified and now < self._next_trigger_load:
+            return False
+        if listener is not None and not listener.closed:
+            self._next_trigger_load = now + conf.getfloat("triggerer", "new_trigger_fallback_poll_interval")
+        else:
+            self._next_trigger_load = now + self.trigger_poll_interval
+        return True
+
     def heartbeat(self):
         perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
 
@@ -553,18 +752,29 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             Stats.incr("triggers.failed")
 
     def emit_metrics(self):
-        Stats.gauge(f"triggers.running.{self.job.hostname}", len(self.running_triggers))
-        Stats.gauge("triggers.running", len(self.running_triggers), tags={"hostname": self.job.hostname})
+        running = sum(len(shard.running_triggers) for shard in self.shards)
+        Stats.gauge(f"triggers.running.{self.job.hostname}", running)
+        Stats.gauge("triggers.running", running, tags={"hostname": self.job.hostname})
 
-        capacity_left = self.capacity - len(self.running_triggers)
+        capacity_left = self.capacity - running
         Stats.gauge(f"triggerer.capacity_left.{self.job.hostname}", capacity_left)
         Stats.gauge("triggerer.capacity_left", capacity_left, tags={"hostname": self.job.hostname})
 
+        if self.secondary_shards:
+            for index, shard in enumerate(self.shards):
+                tags = {"hostname": self.job.hostname, "shard": str(index)}
+                Stats.gauge("triggerer.shard.triggers_running", len(shard.running_triggers), tags=tags)
+                Stats.gauge(
+                    "triggerer.shard.capacity_left",
+                    self.shard_capacity - len(shard.running_triggers),
+                    tags=tags,
+                )
+
         span = Trace.get_current_span()
         span.set_attributes(
             {
                 "trigger host": self.job.hostname,
-                "triggers running": len(self.running_triggers),
+                "triggers running": running,
                 "capacity left": capacity_left,
             }
         )
@@ -579,18 +789,20 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         """
         render_log_fname = log_filename_template_renderer()
 
-        known_trigger_ids = (
-            self.running_triggers.union(x[0] for x in self.events)
-            .union(self.cancelling_triggers)
-            .union(trigger[0] for trigger in self.failed_triggers)
+        shards = self.shards
+        known_trigger_ids = set().union(
+            *(shard.running_triggers for shard in shards),
+            *(shard.cancelling_triggers for shard in shards),
+            *({workload.id for workload in shard.creating_triggers} for shard in shards),
+            (x[0] for x in self.events),
+            (trigger[0] for trigger in self.failed_triggers),
         )
-        # Work out the two difference sets
+        # Work out the new triggers, the ones to cancel are worked out per shard below
         new_trigger_ids = requested_trigger_ids - known_trigger_ids
-        cancel_trigger_ids = self.running_triggers - requested_trigger_ids
+        shard_loads = [len(shard.running_triggers) + len(shard.creating_triggers) for shard in shards]
         # Bulk-fetch new trigger records
         new_triggers = Trigger.bulk_fetch(new_trigger_ids)
         trigger_ids_with_non_task_associations = Trigger.fetch_trigger_ids_with_non_task_associations()
-        to_create: list[workloads.RunTrigger] = []
         # Add in new triggers
         for new_id in new_trigger_ids:
             # Check it didn't vanish in the meantime
@@ -614,6 +826,10 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 )
                 continue
 
+            shard_index = self._shard_index_for(new_id, shard_loads)
+            shard_loads[shard_index] += 1
+            shard = shards[shard_index]
+
             workload = workloads.RunTrigger(
                 classpath=new_trigger_orm.classpath,
                 id=new_id,
@@ -627,7 +843,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                     new_trigger_orm.task_instance, from_attributes=True
                 )
                 # When producing logs from TIs, include the job id producing the logs to disambiguate it.
-                self.logger_cache[new_id] = TriggerLoggingFactory(
+                shard.logger_cache[new_id] = TriggerLoggingFactory(
                     log_path=f"{log_path}.trigger.{self.job.id}.log",
                     ti=ser_ti,  # type: ignore
                 )
@@ -635,13 +851,18 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 workload.ti = ser_ti
                 workload.timeout_after = new_trigger_orm.task_instance.trigger_timeout
 
-            to_create.append(workload)
-
-        self.creating_triggers.extend(to_create)
+            shard.creating_triggers.append(workload)
 
-        if cancel_trigger_ids:
-            # Enqueue orphaned triggers for cancellation
-            self.cancelling_triggers.update(cancel_trigger_ids)
+        for shard in shards:
+            if (
+                cancel_trigger_ids := shard.running_triggers
+                - requested_trigger_ids
+                - shard.cancelling_triggers
+            ):
+                # Enqueue orphaned triggers for cancellation
+                shard.cancelling_triggers.update(cancel_trigger_ids)
+            if cancel_trigger_ids or shard.creating_triggers:
+                shard.wake_runner()
 
     def _register_pipe_readers(self, stdout: socket, stderr: socket, requests: socket, logs: socket):
         super()._register_pipe_readers(stdout, stderr, requests, logs)
@@ -794,6 +1015,12 @@ class TriggerRunner:
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException | None]]
 
+    # Set to wake up the main loop early: when a trigger fires or finishes, or the supervisor has new work
+    wakeup: asyncio.Event
+
+    # How long the main loop waits to be woken up before it syncs with the supervisor anyway
+    sync_interval: ClassVar[float] = 1.0
+
     # Should-we-stop flag
     # TODO: set this in a sig-int handler
     stop: bool = False
@@ -811,6 +1038,7 @@ class TriggerRunner:
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.wakeup = asyncio.Event()
         self.job_id = None
 
     def run(self):
@@ -823,6 +1051,9 @@ class TriggerRunner:
 
         Actual triggers run in their own separate coroutines.
         """
+        # The supervisor sends SIGUSR2 when it has new triggers for us, so they don't wait for the next sync
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, self.wakeup.set)
+
         # Make sure comms are initialized before allowing any Triggers to run
         await self.init_comms()
 
@@ -842,8 +1073,12 @@ class TriggerRunner:
                 await self.sync_state_to_supervisor(finished_ids)
                 await self.create_triggers()
                 await self.cancel_triggers()
-                # Sleep for a bit
-                await asyncio.sleep(1)
+                # Sleep until there is something to tell the supervisor, or for a bit if there is nothing
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=self.sync_interval)
+                self.wakeup.clear()
+                # Let the other triggers that are ready run first, so what they produce goes in the same batch
+                await asyncio.sleep(0)
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     count = len(self.triggers)
@@ -898,6 +1133,7 @@ class TriggerRunner:
                 # Either the trigger code or the path to it is bad. Fail the trigger.
                 self.log.error("Trigger failed to load code", error=e, classpath=workload.classpath)
                 self.failed_triggers.append((trigger_id, e))
+                self.wakeup.set()
                 continue
 
             # Loading the trigger class could have been expensive. Lets give other things a chance to run!
@@ -917,6 +1153,7 @@ class TriggerRunner:
             except TypeError as err:
                 self.log.error("Trigger failed to inflate", error=err)
                 self.failed_triggers.append((trigger_id, err))
+                self.wakeup.set()
                 continue
             trigger_instance.trigger_id = trigger_id
             trigger_instance.triggerer_job_id = self.job_id
@@ -928,10 +1165,11 @@ class TriggerRunner:
                 if ti
                 else f"ID {trigger_id}"
             )
+            task = asyncio.create_task(self.run_trigger(trigger_id, trigger_instance), name=trigger_name)
+            # Report finished triggers straight away, rather than on the next sync
+            task.add_done_callback(lambda _: self.wakeup.set())
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance), name=trigger_name
-                ),
+                "task": task,
                 "name": trigger_name,
                 "events": 0,
             }
@@ -1077,6 +1315,7 @@ class TriggerRunner:
                 )
                 self.triggers[trigger_id]["events"] += 1
                 self.events.append((trigger_id, event))
+                self.wakeup.set()
         except asyncio.CancelledError:
             # We get cancelled by the scheduler changing the task state. But if we do lets give a nice error
             # message about it
@@ -20,7 +20,9 @@
 from __future__ import annotations
 
 import logging
+import threading
 import zlib
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Literal
@@ -46,7 +48,7 @@ from airflow.models.dagrun import DagRun
 from airflow.sdk.definitions.asset import AssetUniqueKey
 from airflow.serialization.dag_dependency import DagDependency
 from airflow.serialization.serialized_objects import SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, json
+from airflow.settings import COMPRESS_SERIALIZED_DAGS, SERIALIZED_DAG_CACHE_SIZE, json
 from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
@@ -263,6 +265,65 @@ class _DagDependenciesResolver:
             )
 
 
+class _DeserializedDagCache:
+    """
+    Process-wide LRU cache of serialized DAG data and deserialized DAGs, keyed by DAG hash.
+
+    The DAG hash is computed over the whole serialized DAG, so an entry never goes stale: a changed
+    DAG has a different hash. The cache holds at most ``[core] serialized_dag_cache_size`` DAGs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, dict] = OrderedDict()
+        self._dags: OrderedDict[tuple[str, bool], SerializedDAG] = OrderedDict()
+
+    @staticmethod
+    def _get(cache: OrderedDict, key: Any) -> Any:
+        if (value := cache.get(key)) is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _put(cache: OrderedDict, key: Any, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > SERIALIZED_DAG_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def get_data(self, dag_hash: str) -> dict | None:
+        if SERIALIZED_DAG_CACHE_SIZE <= 0:
+            return None
+        with self._lock:
+            return self._get(self._data, dag_hash)
+
+    def put_data(self, dag_hash: str, data: dict) -> None:
+        if SERIALIZED_DAG_CACHE_SIZE <= 0:
+            return
+        with self._lock:
+            self._put(self._data, dag_hash, data)
+
+    def get_dag(self, dag_hash: str, load_op_links: bool) -> SerializedDAG | None:
+        if SERIALIZED_DAG_CACHE_SIZE <= 0:
+            return None
+        with self._lock:
+            return self._get(self._dags, (dag_hash, load_op_links))
+
+    def put_dag(self, dag_hash: str, load_op_links: bool, dag: SerializedDAG) -> None:
+        if SERIALIZED_DAG_CACHE_SIZE <= 0:
+            return
+        with self._lock:
+            self._put(self._dags, (dag_hash, load_op_links), dag)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._dags.clear()
+
+
+_deserialized_dag_cache = _DeserializedDagCache()
+
+
 class SerializedDagModel(Base):
     """
     A table for serialized DAGs.
@@ -348,11 +409,53 @@ class SerializedDagModel(Base):
 
     @classmethod
     def hash(cls, dag_data):
-        """Hash the data to get the dag_hash."""
-        dag_data = cls._sort_serialized_dag_dict(dag_data)
+        """
+        Hash the data to get the dag_hash.
+
+        The hash is the md5 of the same canonical JSON as produced by
+        ``json.dumps(cls._sort_serialized_dag_dict(dag_data), sort_keys=True)``, but dict keys are left to
+        be sorted by the JSON encoder, and only the lists whose order actually matters are copied.
+        """
+        dag_data = cls._sort_serialized_dag_lists(dag_data)
         data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
         return md5(data_json).hexdigest()
 
+    @classmethod
+    def _sort_serialized_dag_lists(cls, serialized_dag: Any):
+        """
+        Sort the lists of the serialized DAG the same way as :meth:`_sort_serialized_dag_dict`.
+
+        Unlike :meth:`_sort_serialized_dag_dict`, dict keys are not sorted, and a dict or list is only
+        copied when something inside of it was reordered; otherwise the original object is returned.
+        """
+        if isinstance(serialized_dag, dict):
+            copied = None
+            for key, value in serialized_dag.items():
+                if isinstance(value, (dict, list)):
+                    sorted_value = cls._sort_serialized_dag_lists(value)
+                    if sorted_value is not value:
+                        if copied is None:
+                            copied = dict(serialized_dag)
+                        copied[key] = sorted_value
+            return serialized_dag if copied is None else copied
+        if isinstance(serialized_dag, list):
+            if all(isinstance(i, dict) for i in serialized_dag):
+                if all(
+                    isinstance(i.get("__var", {}), Iterable) and "task_id" in i.get("__var", {})
+                    for i in serialized_dag
+                ):
+                    return sorted(
+                        [cls._sort_serialized_dag_lists(i) for i in serialized_dag],
+                        key=lambda x: x["__var"]["task_id"],
+                    )
+            elif all(isinstance(item, str) for item in serialized_dag):
+                return sorted(serialized_dag)
+            sorted_items = [cls._sort_serialized_dag_lists(i) for i in serialized_dag]
+            if all(new is old for new, old in zip(sorted_items, serialized_dag)):
+                return serialized_dag
+            return sorted_items
+        return serialized_dag
+
     @classmethod
     def _sort_serialized_dag_dict(cls, serialized_dag: Any):
         """Recursively sort json_dict and its nested dictionaries and lists."""
@@ -537,7 +640,10 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                if (data := _deserialized_dag_cache.get_data(self.dag_hash)) is None:
+                    data = json.loads(zlib.decompress(self._data_compressed))
+                    _deserialized_dag_cache.put_data(self.dag_hash, data)
+                self.__data_cache = data
             else:
                 self.__data_cache = self._data
 
@@ -547,13 +653,17 @@ class SerializedDagModel(Base):
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
         SerializedDAG._load_operator_extra_links = self.load_op_links
+        if dag := _deserialized_dag_cache.get_dag(self.dag_hash, self.load_op_links):
+            return dag
         if isinstance(self.data, dict):
             data = self.data
         elif isinstance(self.data, str):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return SerializedDAG.from_dict(data)
+        dag = SerializedDAG.from_dict(data)
+        _deserialized_dag_cache.put_dag(self.dag_hash, self.load_op_links, dag)
+        return dag
 
     @classmethod
     @provide_session
@@ -24,12 +24,13 @@ from functools import singledispatch
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Column, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import Column, Integer, String, Text, delete, event, func, or_, select, update
 from sqlalchemy.orm import Session, relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
 
 from airflow._shared.timezones import timezone
 from airflow.assets.manager import AssetManager
+from airflow.configuration import conf
 from airflow.models.asset import asset_trigger_association_table
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
@@ -52,6 +53,14 @@ Internal use only.
 :meta private:
 """
 
+NEW_TRIGGER_CHANNEL = "airflow_new_trigger"
+"""PostgreSQL notification channel on which the creation of triggers is announced to the triggerers.
+
+Internal use only.
+
+:meta private:
+"""
+
 log = logging.getLogger(__name__)
 
 
@@ -385,6 +394,14 @@ class Trigger(Base):
         return result
 
 
+@event.listens_for(Trigger, "after_insert")
+def _notify_new_trigger(mapper, connection, target: Trigger) -> None:
+    """Wake up the triggerers listening for new triggers, once the transaction creating this one commits."""
+    if connection.dialect.name == "postgresql" and conf.getboolean("triggerer", "new_trigger_notifications"):
+        # Identical notifications sent in one transaction are delivered only once
+        connection.execute(select(func.pg_notify(NEW_TRIGGER_CHANNEL, "")))
+
+
 @singledispatch
 def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
     """
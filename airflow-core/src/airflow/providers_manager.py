@@ -21,9 +21,13 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import hashlib
 import inspect
 import json
 import logging
+import os
+import sys
+import tempfile
 import traceback
 import warnings
 from collections.abc import Callable, MutableMapping
@@ -330,6 +334,114 @@ def _correctness_check(provider_package: str, class_name: str, provider_info: Pr
     return imported_class
 
 
+def _installed_packages_fingerprint(provider_distributions: list[tuple[str, str, str]]) -> str:
+    """
+    Return a fingerprint of the installed packages.
+
+    Installing, upgrading or removing a package changes the modification time of the ``sys.path`` directory
+    it is installed in, so the fingerprint changes whenever the result of the discovery could change.
+
+    :param provider_distributions: name, version and entry point of the installed provider distributions
+    """
+    from airflow import __version__ as airflow_version
+
+    path_mtimes = []
+    for path in sys.path:
+        with contextlib.suppress(OSError):
+            path_mtimes.append((path, os.stat(path).st_mtime_ns))
+    payload = json.dumps([airflow_version, sys.version, path_mtimes, sorted(provider_distributions)])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _ProvidersDiscoveryCache:
+    """
+    On-disk cache of the providers discovered in the installed packages.
+
+    It keeps the validated provider info of every provider package and the classes that passed
+    ``_correctness_check``, so that neither has to be done again by the next process, as long as the
+    fingerprint of the installed packages did not change.
+
+    :param path: path of the cache file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fingerprint: str | None = None
+        self.providers: dict[str, ProviderInfo] | None = None
+        self.checked_classes: set[str] = set()
+        self._dirty = False
+
+    def load(self, fingerprint: str) -> None:
+        """Load the cached discovery, if it was saved for the same installed packages."""
+        self.fingerprint = fingerprint
+        try:
+            with open(self.path) as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(content, dict) or content.get("fingerprint") != fingerprint:
+            log.debug("Ignoring the providers discovery cache %s as installed packages changed", self.path)
+            return
+        try:
+            providers = {
+                package_name: ProviderInfo(version=info["version"], data=info["data"])
+                for package_name, info in content["providers"].items()
+            }
+            checked_classes = set(content["checked_classes"])
+        except (AttributeError, KeyError, TypeError):
+            log.debug("Ignoring the malformed providers discovery cache %s", self.path)
+            return
+        self.providers, self.checked_classes = providers, checked_classes
+
+    def set_providers(self, providers: dict[str, ProviderInfo]) -> None:
+        self.providers = providers
+        self.checked_classes = set()
+        self._dirty = True
+
+    def add_checked_class(self, class_name: str) -> None:
+        if class_name not in self.checked_classes:
+            self.checked_classes.add(class_name)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if anything was discovered since it was loaded."""
+        if not self._dirty or self.fingerprint is None or self.providers is None:
+            return
+        content = {
+            "fingerprint": self.fingerprint,
+            "providers": {
+                package_name: {"version": info.version, "data": info.data}
+                for package_name, info in self.providers.items()
+            },
+            "checked_classes": sorted(self.checked_classes),
+        }
+        try:
+            # Write to a temporary file first so that other processes never read a partially written cache
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        except OSError as e:
+            log.debug("Could not write the providers discovery cache %s: %s", self.path, e)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(content, f)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Could not write the providers discovery cache %s: %s", self.path, e)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+        self._dirty = False
+
+
+def _create_providers_discovery_cache() -> _ProvidersDiscoveryCache | None:
+    from airflow.configuration import conf
+
+    path = conf.get("core", "providers_discovery_cache_path", fallback="")
+    if not path:
+        return None
+    return _ProvidersDiscoveryCache(os.path.expanduser(path))
+
+
 # We want to have better control over initialization of parameters and be able to debug and test it
 # So we add our own decorator
 def provider_info_cache(cache_name: str) -> Callable[[Callable[PS, None]], Callable[PS, None]]:
@@ -353,6 +465,8 @@ def provider_info_cache(cache_name: str) -> Callable[[Callable[PS, None]], Calla
             log.debug("Initializing Providers Manager[%s]", cache_name)
             func(*args, **kwargs)
             providers_manager_instance._initialized_cache[cache_name] = True
+            if providers_manager_instance._discovery_cache is not None:
+                providers_manager_instance._discovery_cache.save()
             log.debug(
                 "Initialization of Providers Manager[%s] took %.2f seconds",
                 cache_name,
@@ -415,14 +529,21 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         self._provider_configs: dict[str, dict[str, Any]] = {}
         self._trigger_info_set: set[TriggerInfo] = set()
         self._notification_info_set: set[NotificationInfo] = set()
-        self._provider_schema_validator = _create_provider_info_schema_validator()
-        self._customized_form_fields_schema_validator = (
-            _create_customized_form_field_behaviours_schema_validator()
-        )
         # Set of plugins contained in providers
         self._plugins_set: set[PluginInfo] = set()
+        self._discovery_cache = _create_providers_discovery_cache()
         self._init_airflow_core_hooks()
 
+    # Importing jsonschema and reading the schemas is not needed when providers are loaded from the
+    # discovery cache, so the validators are only created when they are used
+    @functools.cached_property
+    def _provider_schema_validator(self):
+        return _create_provider_info_schema_validator()
+
+    @functools.cached_property
+    def _customized_form_fields_schema_validator(self):
+        return _create_customized_form_field_behaviours_schema_validator()
+
     def _init_airflow_core_hooks(self):
         """Initialize the hooks dict with default hooks from Airflow core."""
         core_dummy_hooks = {
@@ -585,10 +706,24 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         the code. The runtime version is more relaxed (allows for additional properties)
         and verifies only the subset of fields that are needed at runtime.
         """
-        for entry_point, dist in entry_points_with_dist("apache_airflow_provider"):
-            if not dist.metadata:
-                continue
-            package_name = canonicalize_name(dist.metadata["name"])
+        provider_entry_points = [
+            (entry_point, dist, canonicalize_name(dist.metadata["name"]))
+            for entry_point, dist in entry_points_with_dist("apache_airflow_provider")
+            if dist.metadata
+        ]
+        if self._discovery_cache is not None:
+            provider_distributions = [
+                (package_name, dist.version, entry_point.value)
+                for entry_point, dist, package_name in provider_entry_points
+            ]
+            self._discovery_cache.load(_installed_packages_fingerprint(provider_distributions))
+            if self._discovery_cache.providers is not None:
+                log.debug("Loading providers from the discovery cache %s", self._discovery_cache.path)
+                for package_name, provider in self._discovery_cache.providers.items():
+                    self._provider_dict.setdefault(package_name, provider)
+                return
+
+        for entry_point, dist, package_name in provider_entry_points:
             if package_name in self._provider_dict:
                 continue
             log.debug("Loading %s from package %s", entry_point, package_name)
@@ -609,6 +744,8 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
                     "package name have already been registered",
                     package_name,
                 )
+        if self._discovery_cache is not None:
+            self._discovery_cache.set_providers(dict(self._provider_dict))
 
     def _discover_hooks_from_connection_types(
         self,
@@ -787,11 +924,22 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         # that the main reason why original sorting moved to cli part:
         # self._connection_form_widgets = dict(sorted(self._connection_form_widgets.items()))
 
+    def _is_importable(self, provider_package: str, class_name: str, provider: ProviderInfo) -> bool:
+        """Run ``_correctness_check`` for the class, unless it already passed it for the installed packages."""
+        cache = self._discovery_cache
+        if cache is not None and class_name in cache.checked_classes:
+            return True
+        if not _correctness_check(provider_package, class_name, provider):
+            return False
+        if cache is not None:
+            cache.add_checked_class(class_name)
+        return True
+
     def _discover_filesystems(self) -> None:
         """Retrieve all filesystems defined in the providers."""
         for provider_package, provider in self._provider_dict.items():
             for fs_module_name in provider.data.get("filesystems", []):
-                if _correctness_check(provider_package, f"{fs_module_name}.get_fs", provider):
+                if self._is_importable(provider_package, f"{fs_module_name}.get_fs", provider):
                     self._fs_set.add(fs_module_name)
         self._fs_set = set(sorted(self._fs_set))
 
@@ -1051,7 +1199,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("auth-managers"):
                 for auth_manager_class_name in provider.data["auth-managers"]:
-                    if _correctness_check(provider_package, auth_manager_class_name, provider):
+                    if self._is_importable(provider_package, auth_manager_class_name, provider):
                         self._auth_manager_class_name_set.add(auth_manager_class_name)
 
     def _discover_notifications(self) -> None:
@@ -1059,7 +1207,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("notifications"):
                 for notification_class_name in provider.data["notifications"]:
-                    if _correctness_check(provider_package, notification_class_name, provider):
+                    if self._is_importable(provider_package, notification_class_name, provider):
                         self._notification_info_set.add(notification_class_name)
 
     def _discover_extra_links(self) -> None:
@@ -1067,7 +1215,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("extra-links"):
                 for extra_link_class_name in provider.data["extra-links"]:
-                    if _correctness_check(provider_package, extra_link_class_name, provider):
+                    if self._is_importable(provider_package, extra_link_class_name, provider):
                         self._extra_link_class_name_set.add(extra_link_class_name)
 
     def _discover_logging(self) -> None:
@@ -1075,7 +1223,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("logging"):
                 for logging_class_name in provider.data["logging"]:
-                    if _correctness_check(provider_package, logging_class_name, provider):
+                    if self._is_importable(provider_package, logging_class_name, provider):
                         self._logging_class_name_set.add(logging_class_name)
 
     def _discover_secrets_backends(self) -> None:
@@ -1083,7 +1231,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("secrets-backends"):
                 for secrets_backends_class_name in provider.data["secrets-backends"]:
-                    if _correctness_check(provider_package, secrets_backends_class_name, provider):
+                    if self._is_importable(provider_package, secrets_backends_class_name, provider):
                         self._secrets_backend_class_name_set.add(secrets_backends_class_name)
 
     def _discover_executors(self) -> None:
@@ -1091,7 +1239,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("executors"):
                 for executors_class_name in provider.data["executors"]:
-                    if _correctness_check(provider_package, executors_class_name, provider):
+                    if self._is_importable(provider_package, executors_class_name, provider):
                         self._executor_class_name_set.add(executors_class_name)
 
     def _discover_queues(self) -> None:
@@ -1099,7 +1247,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         for provider_package, provider in self._provider_dict.items():
             if provider.data.get("queues"):
                 for queue_class_name in provider.data["queues"]:
-                    if _correctness_check(provider_package, queue_class_name, provider):
+                    if self._is_importable(provider_package, queue_class_name, provider):
                         self._queue_class_name_set.add(queue_class_name)
 
     def _discover_config(self) -> None:
@@ -1112,7 +1260,7 @@ class ProvidersManager(LoggingMixin, metaclass=Singleton):
         """Retrieve all plugins defined in the providers."""
         for provider_package, provider in self._provider_dict.items():
             for plugin_dict in provider.data.get("plugins", ()):
-                if not _correctness_check(provider_package, plugin_dict["plugin-class"], provider):
+                if not self._is_importable(provider_package, plugin_dict["plugin-class"], provider):
                     log.warning("Plugin not loaded due to above correctness check problem.")
                     continue
                 self._plugins_set.add(
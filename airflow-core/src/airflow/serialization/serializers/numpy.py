@@ -36,6 +36,7 @@ serializers = [
     "numpy.float16",
     "numpy.complex128",
     "numpy.complex64",
+    "numpy.ndarray",
 ]
 
 if TYPE_CHECKING:
@@ -75,9 +76,29 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     if isinstance(o, (np.float16, np.float32, np.float64, np.complex64, np.complex128)):
         return float(o), name, __version__, True
 
+    if isinstance(o, np.ndarray):
+        return _serialize_ndarray(o)
+
     return "", "", 0, False
 
 
+def _serialize_ndarray(o: Any) -> tuple[U, str, int, bool]:
+    from base64 import b64encode
+    from io import BytesIO
+
+    import numpy as np
+
+    buf = BytesIO()
+    try:
+        # The .npy format keeps dtype and shape and, without pickles, is safe to load
+        np.lib.format.write_array(buf, o, allow_pickle=False)
+    except ValueError:
+        # Arrays of Python objects can only be stored as pickles
+        return "", "", 0, False
+
+    return b64encode(buf.getbuffer()).decode("ascii"), qualname(o), __version__, True
+
+
 def deserialize(cls: type, version: int, data: str) -> Any:
     if version > __version__:
         raise TypeError("serialized version is newer than class version")
@@ -87,4 +108,12 @@ def deserialize(cls: type, version: int, data: str) -> Any:
     if cls not in allowed_deserialize_classes:
         raise TypeError(f"unsupported {qualname(cls)} found for numpy deserialization")
 
+    import numpy as np
+
+    if cls is np.ndarray:
+        from base64 import b64decode
+        from io import BytesIO
+
+        return np.lib.format.read_array(BytesIO(b64decode(data)), allow_pickle=False)
+
     return cls(data)
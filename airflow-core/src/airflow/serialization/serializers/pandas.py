@@ -32,10 +32,13 @@ if TYPE_CHECKING:
 
     from airflow.serialization.serde import U
 
-__version__ = 1
+# Version 1 stored the Parquet data hex encoded, version 2 base64 encoded
+__version__ = 2
 
 
 def serialize(o: object) -> tuple[U, str, int, bool]:
+    from base64 import b64encode
+
     import pandas as pd
     import pyarrow as pa
     from pyarrow import parquet as pq
@@ -50,7 +53,8 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     buf = pa.BufferOutputStream()
     pq.write_table(table, buf, compression="snappy")
 
-    return buf.getvalue().hex().decode("utf-8"), qualname(o), __version__, True
+    # base64 is a third smaller than hex and, unlike base85, encoded in C
+    return b64encode(buf.getvalue()).decode("ascii"), qualname(o), __version__, True
 
 
 def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
@@ -65,11 +69,11 @@ def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
     if not isinstance(data, str):
         raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
 
-    from io import BytesIO
+    from base64 import b64decode
 
+    import pyarrow as pa
     from pyarrow import parquet as pq
 
-    with BytesIO(bytes.fromhex(data)) as buf:
-        df = pq.read_table(buf).to_pandas()
-
-    return df
+    raw = bytes.fromhex(data) if version == 1 else b64decode(data)
+    # Read straight from the decoded bytes, without copying them into a file object first
+    return pq.read_table(pa.BufferReader(raw)).to_pandas()
@@ -676,6 +676,9 @@ COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", f
 # read rate. This config controls when your DAGs are updated in the Webserver
 MIN_SERIALIZED_DAG_FETCH_INTERVAL = conf.getint("core", "min_serialized_dag_fetch_interval", fallback=10)
 
+# Number of deserialized DAGs kept in memory per process, keyed by DAG hash. 0 disables the cache.
+SERIALIZED_DAG_CACHE_SIZE = conf.getint("core", "serialized_dag_cache_size", fallback=0)
+
 CAN_FORK = hasattr(os, "fork")
 
 EXECUTE_TASKS_NEW_PYTHON_INTERPRETER = not CAN_FORK or conf.getboolean(
@@ -2520,6 +2520,7 @@ export class TaskInstanceService {
      * @param data.fullContent
      * @param data.mapIndex
      * @param data.token
+     * @param data.tailLines
      * @param data.accept
      * @returns TaskInstancesLogResponse Successful Response
      * @throws ApiError
@@ -2540,7 +2541,8 @@ export class TaskInstanceService {
             query: {
                 full_content: data.fullContent,
                 map_index: data.mapIndex,
-                token: data.token
+                token: data.token,
+                tail_lines: data.tailLines
             },
             errors: {
                 401: 'Unauthorized',
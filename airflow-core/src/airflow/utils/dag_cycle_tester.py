@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from airflow.exceptions import AirflowDagCycleException
@@ -35,35 +36,36 @@ def check_cycle(dag: DAG) -> None:
     """
     Check to see if there are any cycles in the DAG.
 
+    This is a depth-first search that visits every task and every dependency once, so it takes linear time
+    even for very large or very wide DAGs.
+
     :raises AirflowDagCycleException: If cycle is found in the DAG.
     """
     # default of int is 0 which corresponds to CYCLE_NEW
     visited: dict[str, int] = defaultdict(int)
-    path_stack: deque[str] = deque()
+    # The path to the current task, with the downstream tasks of each task on it that are still to be checked,
+    # so that coming back to a task resumes where it left off rather than checking its downstream tasks again
+    path_stack: deque[tuple[str, Iterator[str]]] = deque()
     task_dict = dag.task_dict
 
-    def _check_adjacent_tasks(task_id, current_task):
-        """Return first untraversed child task, else None if all tasks traversed."""
-        for adjacent_task in current_task.get_direct_relative_ids():
-            if visited[adjacent_task] == CYCLE_IN_PROGRESS:
-                msg = f"Cycle detected in DAG: {dag.dag_id}. Faulty task: {task_id}"
-                raise AirflowDagCycleException(msg)
-            if visited[adjacent_task] == CYCLE_NEW:
-                return adjacent_task
-        return None
-
-    for dag_task_id in dag.task_dict.keys():
+    for dag_task_id in task_dict:
         if visited[dag_task_id] == CYCLE_DONE:
             continue
-        path_stack.append(dag_task_id)
+        visited[dag_task_id] = CYCLE_IN_PROGRESS
+        path_stack.append((dag_task_id, iter(task_dict[dag_task_id].get_direct_relative_ids())))
         while path_stack:
-            current_task_id = path_stack[-1]
-            if visited[current_task_id] == CYCLE_NEW:
-                visited[current_task_id] = CYCLE_IN_PROGRESS
-            task = task_dict[current_task_id]
-            child_to_check = _check_adjacent_tasks(current_task_id, task)
-            if not child_to_check:
+            current_task_id, adjacent_tasks = path_stack[-1]
+            for adjacent_task in adjacent_tasks:
+                if visited[adjacent_task] == CYCLE_IN_PROGRESS:
+                    msg = f"Cycle detected in DAG: {dag.dag_id}. Faulty task: {current_task_id}"
+                    raise AirflowDagCycleException(msg)
+                if visited[adjacent_task] == CYCLE_NEW:
+                    visited[adjacent_task] = CYCLE_IN_PROGRESS
+                    path_stack.append(
+                        (adjacent_task, iter(task_dict[adjacent_task].get_direct_relative_ids()))
+                    )
+                    break
+            else:
+                # All the downstream tasks have been traversed
                 visited[current_task_id] = CYCLE_DONE
                 path_stack.pop()
-            else:
-                path_stack.append(child_to_check)
@@ -24,13 +24,18 @@ See:
 from __future__ import annotations
 
 import csv
+import itertools
 import logging
+import math
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, column, func, inspect, select, table, text
+from sqlalchemy import and_, column, false, func, inspect, literal_column, or_, select, table, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
@@ -42,18 +47,22 @@ from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.utils.db import reflect_tables
 from airflow.utils.helpers import ask_yesno
-from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
     from pendulum import DateTime
+    from sqlalchemy import Row, Table
     from sqlalchemy.orm import Query, Session
+    from sqlalchemy.sql.expression import ColumnElement, TableClause
 
     from airflow.models import Base
 
 logger = logging.getLogger(__name__)
 
 ARCHIVE_TABLE_PREFIX = "_airflow_deleted__"
+# Alias of the table to clean up in the query of the rows to delete
+BASE_TABLE_ALIAS = "base"
 # Archived tables created by DB migrations
 ARCHIVED_TABLES_FROM_DB_MIGRATIONS = [
     "_xcom_archive"  # Table created by the AF 2 -> 3.0.0 migration when the XComs had pickled values
@@ -192,80 +201,362 @@ def _dump_table_to_file(*, target_table: str, file_path: str, export_format: str
 
 
 def _do_delete(
-    *, query: Query, orm_model: Base, skip_archive: bool, session: Session, batch_size: int | None
+    *,
+    query: Query,
+    orm_model: Base,
+    recency_column,
+    keep_last: bool,
+    clean_before_timestamp: DateTime,
+    skip_archive: bool,
+    session: Session,
+    batch_size: int | None,
+    workers: int = 1,
+    resume: bool = False,
 ) -> None:
-    import itertools
-    import re
+    if batch_size:
+        _do_delete_in_batches(
+            query=query,
+            orm_model=orm_model,
+            recency_column=recency_column,
+            keep_last=keep_last,
+            clean_before_timestamp=clean_before_timestamp,
+            skip_archive=skip_archive,
+            session=session,
+            batch_size=batch_size,
+            workers=workers,
+            resume=resume,
+        )
+        return
 
     bind = session.get_bind()
     dialect_name = bind.dialect.name
-    batch_counter = itertools.count(1)
-
-    while True:
-        limited_query = query.limit(batch_size) if batch_size else query
-        if limited_query.count() == 0:  # nothing left to delete
-            break
 
-        batch_no = next(batch_counter)
-        suffix = f"__b{batch_no}" if batch_size else ""
+    print("Performing Delete...")
+    # using bulk delete
+    # create a new table and copy the rows there
+    target_table_name = _archive_table_name(orm_model.name)
+    print(f"Moving data to table {target_table_name}")
+    target_table = None
 
-        if batch_size:
-            print(f"Performing Delete (batch {batch_no}, max {batch_size} rows)...")
+    try:
+        if dialect_name == "mysql":
+            # MySQL with replication needs this split into two queries, so just do it for all MySQL
+            # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
+            session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
+            metadata = reflect_tables([target_table_name], session)
+            target_table = metadata.tables[target_table_name]
+            insert_stm = target_table.insert().from_select(target_table.c, query)
+            logger.debug("insert statement:\n%s", insert_stm.compile())
+            session.execute(insert_stm)
+        else:
+            stmt = CreateTableAs(target_table_name, query.selectable)
+            logger.debug("ctas query:\n%s", stmt.compile())
+            session.execute(stmt)
+        session.commit()
+
+        # delete the rows from the old table
+        metadata = reflect_tables([orm_model.name, target_table_name], session)
+        source_table = metadata.tables[orm_model.name]
+        target_table = metadata.tables[target_table_name]
+        logger.debug("rows moved; purging from %s", source_table.name)
+        if dialect_name == "sqlite":
+            pk_cols = source_table.primary_key.columns
+            delete = source_table.delete().where(
+                tuple_(*pk_cols).in_(
+                    select(*[target_table.c[x.name] for x in source_table.primary_key.columns])
+                )
+            )
         else:
-            print("Performing Delete...")
+            delete = source_table.delete().where(
+                and_(col == target_table.c[col.name] for col in source_table.primary_key.columns)
+            )
+        logger.debug("delete statement:\n%s", delete.compile())
+        session.execute(delete)
+        session.commit()
+
+    except BaseException as e:
+        raise e
+    finally:
+        if target_table is not None and skip_archive:
+            bind = session.get_bind()
+            target_table.drop(bind=bind)
+            session.commit()
+
+    print("Finished Performing Delete")
+
+
+def _archive_table_name(table_name: str) -> str:
+    timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
+    return f"{ARCHIVE_TABLE_PREFIX}{table_name}__{timestamp_str}"
+
+
+def _latest_archive_table_name(table_name: str, session: Session) -> str | None:
+    """Get the archive table the last cleanup of a table moved its rows to, if there is one."""
+    # Batched cleanups used to archive each batch to its own table, with the batch number as a suffix
+    pattern = re.compile(rf"{ARCHIVE_TABLE_PREFIX}{re.escape(table_name)}__\d{{14}}")
+    names = [name for name in inspect(session.bind).get_table_names() if pattern.fullmatch(name)]
+    return max(names, default=None)
 
-        # using bulk delete
-        # create a new table and copy the rows there
-        timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
-        target_table_name = f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}{suffix}"
+
+def _get_archive_table(source_table: Table, *, resume: bool, session: Session) -> TableClause:
+    """Create the table to move the rows of a cleanup to, or get the last one when resuming."""
+    target_table_name = _latest_archive_table_name(source_table.name, session) if resume else None
+    if target_table_name:
+        print(f"Resuming, moving data to existing table {target_table_name}")
+    else:
+        target_table_name = _archive_table_name(source_table.name)
         print(f"Moving data to table {target_table_name}")
-        target_table = None
-
-        try:
-            if dialect_name == "mysql":
-                # MySQL with replication needs this split into two queries, so just do it for all MySQL
-                # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
-                session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
-                metadata = reflect_tables([target_table_name], session)
-                target_table = metadata.tables[target_table_name]
-                insert_stm = target_table.insert().from_select(target_table.c, limited_query)
-                logger.debug("insert statement:\n%s", insert_stm.compile())
-                session.execute(insert_stm)
-            else:
-                stmt = CreateTableAs(target_table_name, limited_query.selectable)
-                logger.debug("ctas query:\n%s", stmt.compile())
-                session.execute(stmt)
-            session.commit()
+        if session.get_bind().dialect.name == "mysql":
+            # See _do_delete, MySQL with replication does not allow CREATE TABLE ... SELECT
+            session.execute(text(f"CREATE TABLE {target_table_name} LIKE {source_table.name}"))
+        else:
+            session.execute(CreateTableAs(target_table_name, select(source_table).where(false())))
+        session.commit()
+    return table(target_table_name, *[column(col.name) for col in source_table.columns])
 
-            # delete the rows from the old table
-            metadata = reflect_tables([orm_model.name, target_table_name], session)
-            source_table = metadata.tables[orm_model.name]
-            target_table = metadata.tables[target_table_name]
-            logger.debug("rows moved; purging from %s", source_table.name)
-            if dialect_name == "sqlite":
-                pk_cols = source_table.primary_key.columns
-                delete = source_table.delete().where(
-                    tuple_(*pk_cols).in_(
-                        select(*[target_table.c[x.name] for x in source_table.primary_key.columns])
-                    )
-                )
+
+def _compare_key(key_columns: list, key: tuple, *, after: bool) -> ColumnElement:
+    """
+    Filter the rows after ``key`` in the order of ``key_columns``, or the rows up to and including it.
+
+    Expanded rather than a row value comparison, and with a redundant bound on the first column, so that
+    every database can seek an index on it.
+    """
+    first_column, *other_columns = key_columns
+    first_value, *other_values = key
+    if not other_columns:
+        return first_column > first_value if after else first_column <= first_value
+    return and_(
+        first_column >= first_value if after else first_column <= first_value,
+        or_(
+            first_column > first_value if after else first_column < first_value,
+            and_(first_column == first_value, _compare_key(other_columns, tuple(other_values), after=after)),
+        ),
+    )
+
+
+def _batch_filter(key_columns: list, *, after: tuple | None, up_to: tuple | None) -> list[ColumnElement]:
+    conditions = []
+    if after is not None:
+        conditions.append(_compare_key(key_columns, after, after=True))
+    if up_to is not None:
+        conditions.append(_compare_key(key_columns, up_to, after=False))
+    return conditions
+
+
+def _recency_filter(recency_column, *, start: DateTime | None, end: DateTime | None) -> list[ColumnElement]:
+    conditions = []
+    if start is not None:
+        conditions.append(recency_column >= start)
+    if end is not None:
+        conditions.append(recency_column < end)
+    return conditions
+
+
+def _batch_key_columns(source_table: Table, recency_column, session: Session) -> tuple[list, list]:
+    """
+    Get the columns to walk the rows to delete by, the recency column then the primary key.
+
+    :return: the columns in the query of ``_build_query``, and the same columns in the table to clean up.
+    """
+    quote = session.get_bind().dialect.identifier_preparer.quote
+    source_columns = [source_table.c[recency_column.name], *source_table.primary_key]
+    return [literal_column(f"{BASE_TABLE_ALIAS}.{quote(col.name)}") for col in source_columns], source_columns
+
+
+def _batch_end_key(*, query: Query, key_columns: list, after: tuple | None, batch_size: int) -> tuple | None:
+    """Get the key of the last row of the next batch, or None if less than a full batch of rows is left."""
+    batch_query = query.with_entities(*key_columns).filter(
+        *_batch_filter(key_columns, after=after, up_to=None)
+    )
+    row = batch_query.order_by(*key_columns).offset(batch_size - 1).first()
+    return tuple(row) if row else None
+
+
+def _primary_key_in(source_table: Table, primary_keys: list[Row]) -> ColumnElement:
+    pk_cols = list(source_table.primary_key.columns)
+    if len(pk_cols) == 1:
+        return pk_cols[0].in_([pk[0] for pk in primary_keys])
+    return tuple_(*pk_cols).in_([tuple(pk) for pk in primary_keys])
+
+
+def _move_rows(
+    *, source_table: Table, archive_table: TableClause | None, where: list[ColumnElement], session: Session
+) -> int:
+    """Move the rows of a table to its archive table, or just delete them without one."""
+    delete = source_table.delete().where(*where)
+    if archive_table is None:
+        return session.execute(delete).rowcount
+    column_names = [col.name for col in source_table.columns]
+    if session.get_bind().dialect.name == "postgresql":
+        # Deleted and archived in one statement, which reads the rows once and archives exactly those deleted
+        moved = delete.returning(*source_table.columns).cte("moved")
+        return session.execute(archive_table.insert().from_select(column_names, select(moved))).rowcount
+    # Rows written between an archiving and a deleting by the same filter would be deleted unarchived, so the
+    # rows are picked by primary key first
+    primary_keys = session.execute(select(*source_table.primary_key.columns).where(*where)).all()
+    if not primary_keys:
+        return 0
+    where = [_primary_key_in(source_table, primary_keys)]
+    session.execute(archive_table.insert().from_select(column_names, select(source_table).where(*where)))
+    return session.execute(source_table.delete().where(*where)).rowcount
+
+
+def _delete_batches(
+    *,
+    query: Query,
+    key_columns: list,
+    source_table: Table,
+    source_key_columns: list,
+    start: DateTime | None,
+    end: DateTime,
+    keep_last: bool,
+    archive_table: TableClause | None,
+    batch_size: int,
+    session: Session,
+) -> int:
+    """
+    Archive and delete the rows of a query, a batch at a time.
+
+    The batches are ranges of the recency column and the primary key, each starting where the last one
+    stopped, so that none of them scans the rows kept or deleted before it again, and none needs to count the
+    rows left. Each batch is moved to the archive table in its own transaction, so that a cleanup stopped
+    halfway leaves every row either in its table or in the archive table.
+
+    :param start: the oldest recency of the rows of the query, if it has a lower bound.
+    :param end: the recency the rows of the query are older than.
+    """
+    deleted = 0
+    last_key = None
+    for batch_no in itertools.count(1):
+        end_key = _batch_end_key(query=query, key_columns=key_columns, after=last_key, batch_size=batch_size)
+        if keep_last:
+            # The rows kept are in the range of the batch too, so the rows to move are picked by primary key
+            primary_keys = (
+                query.with_entities(*key_columns[1:])
+                .filter(*_batch_filter(key_columns, after=last_key, up_to=end_key))
+                .all()
+            )
+            where = [_primary_key_in(source_table, primary_keys)]
+        else:
+            # Only bounded by the range of the query where the batch has no key to start or end at, as more bounds
+            # on the recency column can keep databases from using the tightest ones to seek its index
+            recency_column = source_key_columns[0]
+            if last_key is None:
+                where = _recency_filter(recency_column, start=start, end=None)
             else:
-                delete = source_table.delete().where(
-                    and_(col == target_table.c[col.name] for col in source_table.primary_key.columns)
-                )
-            logger.debug("delete statement:\n%s", delete.compile())
-            session.execute(delete)
-            session.commit()
+                where = _batch_filter(source_key_columns, after=last_key, up_to=None)
+            if end_key is None:
+                where.append(recency_column < end)
+            else:
+                where.extend(_batch_filter(source_key_columns, after=None, up_to=end_key))
+        moved = _move_rows(
+            source_table=source_table, archive_table=archive_table, where=where, session=session
+        )
+        session.commit()
+        deleted += moved
+        print(f"Deleted batch {batch_no} of {moved} rows from {source_table.name} ({deleted} rows so far)")
+        if end_key is None:
+            return deleted
+        last_key = end_key
+    return deleted
+
+
+def _recency_ranges(
+    *, orm_model: Base, recency_column, clean_before_timestamp: DateTime, workers: int, session: Session
+) -> list[tuple[DateTime | None, DateTime | None]]:
+    """Split the rows to delete into ranges of the recency column of about the same length."""
+    oldest = session.scalar(
+        select(func.min(orm_model.c[recency_column.name])).where(
+            orm_model.c[recency_column.name] < clean_before_timestamp
+        )
+    )
+    if oldest is None:
+        return [(None, None)]
+    # Airflow stores timestamps in UTC, which drivers of databases without time zones give back as naive
+    step = (clean_before_timestamp - timezone.coerce_datetime(oldest, timezone.utc)) / workers
+    bounds = [None, *(clean_before_timestamp - step * idx for idx in reversed(range(1, workers))), None]
+    return list(itertools.pairwise(bounds))
 
-        except BaseException as e:
-            raise e
-        finally:
-            if target_table is not None and skip_archive:
-                bind = session.get_bind()
-                target_table.drop(bind=bind)
-                session.commit()
 
-    print("Finished Performing Delete")
+def _do_delete_in_batches(
+    *,
+    query: Query,
+    orm_model: Base,
+    recency_column,
+    keep_last: bool,
+    clean_before_timestamp: DateTime,
+    skip_archive: bool,
+    session: Session,
+    batch_size: int,
+    workers: int,
+    resume: bool,
+) -> None:
+    source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+    key_columns, source_key_columns = _batch_key_columns(source_table, recency_column, session)
+    archive_table = None if skip_archive else _get_archive_table(source_table, resume=resume, session=session)
+
+    def delete_range(start: DateTime | None, end: DateTime | None, range_session: Session) -> int:
+        return _delete_batches(
+            query=query.with_session(range_session).filter(
+                *_recency_filter(key_columns[0], start=start, end=end)
+            ),
+            key_columns=key_columns,
+            source_table=source_table,
+            source_key_columns=source_key_columns,
+            start=start,
+            end=end or clean_before_timestamp,
+            keep_last=keep_last,
+            archive_table=archive_table,
+            batch_size=batch_size,
+            session=range_session,
+        )
+
+    if workers > 1 and session.get_bind().dialect.name == "sqlite":
+        logger.warning(
+            "SQLite only allows one writer at a time, cleaning up %s with a single worker", orm_model.name
+        )
+        workers = 1
+    if workers == 1:
+        print(f"Performing Delete (batches of max {batch_size} rows)...")
+        deleted = delete_range(None, None, session)
+        print(f"Finished Performing Delete of {deleted} rows")
+        return
+
+    def delete_range_in_worker(bounds: tuple[DateTime | None, DateTime | None]) -> int:
+        with create_session() as worker_session:
+            return delete_range(*bounds, worker_session)
+
+    ranges = _recency_ranges(
+        orm_model=orm_model,
+        recency_column=recency_column,
+        clean_before_timestamp=clean_before_timestamp,
+        workers=workers,
+        session=session,
+    )
+    print(f"Performing Delete (batches of max {batch_size} rows, {len(ranges)} workers)...")
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        deleted = sum(executor.map(delete_range_in_worker, ranges))
+    print(f"Finished Performing Delete of {deleted} rows")
+
+
+def _print_batch_estimate(
+    *, query: Query, orm_model: Base, recency_column, num_rows: int, batch_size: int, session: Session
+) -> None:
+    """Time reading the first batch of rows to delete, to estimate how long deleting all of them takes."""
+    source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+    key_columns, _ = _batch_key_columns(source_table, recency_column, session)
+    start = time.monotonic()
+    end_key = _batch_end_key(query=query, key_columns=key_columns, after=None, batch_size=batch_size)
+    batch_query = query.filter(*_batch_filter(key_columns, after=None, up_to=end_key))
+    rows = session.connection().execute(batch_query.statement).all()
+    elapsed = time.monotonic() - start
+    num_batches = math.ceil(num_rows / batch_size)
+    print(
+        f"Reading the first batch of {len(rows)} rows took {elapsed:.3f} seconds. "
+        f"Deleting {num_rows} rows takes {num_batches} batches, "
+        f"so at least {num_batches * elapsed:.0f} seconds at this rate."
+    )
 
 
 def _subquery_keep_last(
@@ -309,9 +600,8 @@ def _build_query(
     session: Session,
     **kwargs,
 ) -> Query:
-    base_table_alias = "base"
-    base_table = aliased(orm_model, name=base_table_alias)
-    query = session.query(base_table).with_entities(text(f"{base_table_alias}.*"))
+    base_table = aliased(orm_model, name=BASE_TABLE_ALIAS)
+    query = session.query(base_table).with_entities(text(f"{BASE_TABLE_ALIAS}.*"))
     base_table_recency_col = base_table.c[recency_column.name]
     conditions = [base_table_recency_col < clean_before_timestamp]
     if keep_last:
@@ -349,6 +639,8 @@ def _cleanup_table(
     skip_archive: bool = False,
     session: Session,
     batch_size: int | None = None,
+    workers: int = 1,
+    resume: bool = False,
     **kwargs,
 ) -> None:
     print()
@@ -367,13 +659,27 @@ def _cleanup_table(
     print(f"Checking table {orm_model.name}")
     num_rows = _check_for_rows(query=query, print_rows=False)
 
+    if num_rows and dry_run and batch_size:
+        _print_batch_estimate(
+            query=query,
+            orm_model=orm_model,
+            recency_column=recency_column,
+            num_rows=num_rows,
+            batch_size=batch_size,
+            session=session,
+        )
     if num_rows and not dry_run:
         _do_delete(
             query=query,
             orm_model=orm_model,
+            recency_column=recency_column,
+            keep_last=keep_last,
+            clean_before_timestamp=clean_before_timestamp,
             skip_archive=skip_archive,
             session=session,
             batch_size=batch_size,
+            workers=workers,
+            resume=resume,
         )
 
     session.commit()
@@ -502,6 +808,8 @@ def run_cleanup(
     skip_archive: bool = False,
     session: Session = NEW_SESSION,
     batch_size: int | None = None,
+    workers: int = 1,
+    resume: bool = False,
 ) -> None:
     """
     Purges old records in airflow metadata database.
@@ -521,7 +829,15 @@ def run_cleanup(
     :param confirm: Require user input to confirm before processing deletions.
     :param skip_archive: Set to True if you don't want the purged rows preservied in an archive table.
     :param session: Session representing connection to the metadata database.
+    :param batch_size: Maximum number of rows to delete or archive in a single transaction. The rows of each
+        table are then moved to one archive table, a batch at a time in the order of the recency column.
+    :param workers: Number of workers deleting the rows of each table in parallel, each from its own range of
+        the recency column. Requires ``batch_size``.
+    :param resume: Move the rows of each table to the archive table of its last cleanup, to carry on with a
+        cleanup that was stopped halfway. Requires ``batch_size``.
     """
+    if (workers > 1 or resume) and not batch_size:
+        raise SystemExit("Cleaning up with several workers or resuming a cleanup requires a batch size.")
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
 
     # Get all tables to clean (root + dependents)
@@ -548,6 +864,8 @@ def run_cleanup(
                     skip_archive=skip_archive,
                     session=session,
                     batch_size=batch_size,
+                    workers=workers,
+                    resume=resume,
                 )
                 session.commit()
         else:
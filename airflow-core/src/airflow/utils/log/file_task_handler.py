@@ -23,11 +23,13 @@ import heapq
 import io
 import logging
 import os
+from collections import deque
 from collections.abc import Callable, Generator, Iterator
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 from types import GeneratorType
 from typing import IO, TYPE_CHECKING, TypedDict, cast
@@ -40,7 +42,6 @@ from typing_extensions import NotRequired
 from airflow.configuration import conf
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.helpers import parse_template_string, render_template
-from airflow.utils.log.log_stream_accumulator import LogStreamAccumulator
 from airflow.utils.log.logging_mixin import SetContextPropagate
 from airflow.utils.log.non_caching_file_handler import NonCachingRotatingFileHandler
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -56,6 +57,10 @@ if TYPE_CHECKING:
     from airflow.models.taskinstancehistory import TaskInstanceHistory
 
 CHUNK_SIZE = 1024 * 1024 * 5  # 5MB
+TAIL_CHUNK_SIZE = 64 * 1024
+"""How many bytes are read at a time, going backwards from the end of a log file, to find its last lines."""
+TAIL_BYTES_PER_LINE = 256
+"""Guess of the size of a log line, used to size the first HTTP range request for the last lines of a log."""
 DEFAULT_SORT_DATETIME = pendulum.datetime(2000, 1, 1)
 DEFAULT_SORT_TIMESTAMP = int(DEFAULT_SORT_DATETIME.timestamp() * 1000)
 SORT_KEY_OFFSET = 10000000
@@ -63,8 +68,6 @@ SORT_KEY_OFFSET = 10000000
 
 Assuming 50 characters per line, an offset of 10,000,000 can represent approximately 500 MB of file data, which is sufficient for use as a constant.
 """
-HEAP_DUMP_SIZE = 5000
-HALF_HEAP_DUMP_SIZE = HEAP_DUMP_SIZE // 2
 
 # These types are similar, but have distinct names to make processing them less error prone
 LogMessages: TypeAlias = list[str]
@@ -111,6 +114,8 @@ class LogMetadata(TypedDict):
     # https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Number/MAX_SAFE_INTEGER
     last_log_timestamp: NotRequired[str]
     max_offset: NotRequired[str]
+    # only read the last lines of the log
+    tail_lines: NotRequired[int]
 
 
 class StructuredLogMessage(BaseModel):
@@ -164,7 +169,16 @@ def _set_task_deferred_context_var():
         h.ctx_task_deferred = True
 
 
-def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
+def _fetch_logs_from_service(url: str, log_relative_path: str, tail_lines: int | None = None) -> Response:
+    """
+    Fetch a log from the log server of a worker or triggerer.
+
+    :param url: URL of the log
+    :param log_relative_path: path of the log, relative to the base log folder
+    :param tail_lines: if set, only fetch (at least) the last ``tail_lines`` lines of the log, with HTTP range
+        requests. The response is then a ``206 Partial Content`` one if the log is longer than that, starting
+        at the beginning of a line, and its content has been read already. Otherwise it is the whole log.
+    """
     # Import occurs in function scope for perf. Ref: https://github.com/apache/airflow/pull/21438
     import requests
 
@@ -179,14 +193,33 @@ def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
         valid_for=conf.getint("webserver", "log_request_clock_grace", fallback=30),
         audience="task-instance-logs",
     )
-    response = requests.get(
-        url,
-        timeout=timeout,
-        headers={"Authorization": generator.generate({"filename": log_relative_path})},
-        stream=True,
-    )
-    response.encoding = "utf-8"
-    return response
+    headers = {"Authorization": generator.generate({"filename": log_relative_path})}
+    if not tail_lines:
+        response = requests.get(url, timeout=timeout, headers=headers, stream=True)
+        response.encoding = "utf-8"
+        return response
+
+    # We can't know how many bytes the last lines take up, so ask for more until we have enough of them
+    tail_bytes = tail_lines * TAIL_BYTES_PER_LINE
+    while True:
+        response = requests.get(
+            url, timeout=timeout, headers={**headers, "Range": f"bytes=-{tail_bytes}"}, stream=True
+        )
+        response.encoding = "utf-8"
+        if response.status_code == 416:
+            # The log server rejects ranges longer than the log, which is then short enough to fetch whole
+            response.close()
+            return _fetch_logs_from_service(url, log_relative_path)
+        # Anything but 206 is the whole log (if the server ignores ranges) or an error
+        if response.status_code != 206 or response.headers.get("Content-Range", "").startswith("bytes 0-"):
+            return response
+        # The first line is most likely cut, and the last one ends with a newline
+        _, _, content = response.content.partition(b"\n")
+        if content.count(b"\n") >= tail_lines:
+            response._content = content
+            response.headers["Content-Length"] = str(len(content))
+            return response
+        tail_bytes *= 2
 
 
 _parse_timestamp = conf.getimport("logging", "interleave_timestamp_parser", fallback=None)
@@ -195,26 +228,66 @@ if not _parse_timestamp:
 
     def _parse_timestamp(line: str):
         timestamp_str, _ = line.split(" ", 1)
-        return pendulum.parse(timestamp_str.strip("[]"))
+        timestamp_str = timestamp_str.strip("[]")
+        if not timestamp_str[:1].isdigit():
+            # Most lines without a timestamp are rejected here, without the cost of a failed parse
+            raise ValueError(f"No timestamp at the start of the line: {line!r}")
+        try:
+            # Much faster than pendulum, and handles the timestamps Airflow itself writes
+            timestamp = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            return pendulum.parse(timestamp_str)
+        # Like pendulum, read a timestamp without an offset as UTC, so that it can be compared to the others
+        return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+def _find_tail_offset(log_io: IO[bytes], num_lines: int) -> int:
+    """
+    Find where the last lines of a file start, reading it backwards from the end.
+
+    :param log_io: A seekable binary file-like IO object.
+    :param num_lines: The number of lines to find at the end of the file.
+    :return: The byte offset of the first of the last ``num_lines`` lines, or 0 if the file has fewer lines.
+    """
+    end = log_io.seek(0, os.SEEK_END)
+    # A newline at the very end of the file ends the last line rather than starting another one
+    newlines_to_skip = 1
+    pos = end
+    while pos > 0:
+        read_size = min(TAIL_CHUNK_SIZE, pos)
+        pos -= read_size
+        log_io.seek(pos)
+        chunk = log_io.read(read_size)
+        idx = len(chunk)
+        while (idx := chunk.rfind(b"\n", 0, idx)) != -1:
+            if pos + idx == end - 1 and newlines_to_skip:
+                newlines_to_skip = 0
+                continue
+            num_lines -= 1
+            if num_lines == 0:
+                return pos + idx + 1
+    return 0
 
 
 def _stream_lines_by_chunk(
     log_io: IO[str],
+    start: int = 0,
 ) -> RawLogStream:
     """
     Stream lines from a file-like IO object.
 
     :param log_io: A file-like IO object to read from.
+    :param start: The position to start reading from, if the IO object is seekable.
     :return: A generator that yields individual lines within the specified range.
     """
     # Skip processing if file is already closed
     if log_io.closed:
         return
 
-    # Seek to beginning if possible
+    # Seek to the start if possible
     if log_io.seekable():
         try:
-            log_io.seek(0)
+            log_io.seek(start)
         except Exception as e:
             logger.error("Error seeking in log stream: %s", e)
             return
@@ -258,9 +331,12 @@ def _log_stream_to_parsed_log_stream(
     idx = 0
     for line in log_stream:
         if line:
-            try:
-                log = StructuredLogMessage.model_validate_json(line)
-            except ValidationError:
+            log = None
+            # Only JSON lines can be structured log messages; don't pay for a failed validation on the others
+            if line.startswith("{"):
+                with suppress(ValidationError):
+                    log = StructuredLogMessage.model_validate_json(line)
+            if log is None:
                 with suppress(Exception):
                     # If we can't parse the timestamp, don't attach one to the row
                     if isinstance(line, str):
@@ -298,97 +374,41 @@ def _is_sort_key_with_default_timestamp(sort_key: int) -> bool:
     return timestamp_part == DEFAULT_SORT_TIMESTAMP
 
 
-def _add_log_from_parsed_log_streams_to_heap(
-    heap: list[tuple[int, StructuredLogMessage]],
-    parsed_log_streams: dict[int, ParsedLogStream],
-) -> None:
-    """
-    Add one log record from each parsed log stream to the heap, and will remove empty log stream from the dict after iterating.
+def _sort_keyed_log_stream(
+    parsed_log_stream: ParsedLogStream,
+) -> Generator[tuple[int, StructuredLogMessage], None, None]:
+    for timestamp, line_num, line in parsed_log_stream:
+        yield _create_sort_key(timestamp, line_num), line
 
-    :param heap: heap to store log records
-    :param parsed_log_streams: dict of parsed log streams
-    """
-    # We intend to initialize the list lazily, as in most cases we don't need to remove any log streams.
-    # This reduces memory overhead, since this function is called repeatedly until all log streams are empty.
-    log_stream_to_remove: list[int] | None = None
-    for idx, log_stream in parsed_log_streams.items():
-        record: ParsedLog | None = next(log_stream, None)
-        if record is None:
-            if log_stream_to_remove is None:
-                log_stream_to_remove = []
-            log_stream_to_remove.append(idx)
-            continue
-        timestamp, line_num, line = record
-        # take int as sort key to avoid overhead of memory usage
-        heapq.heappush(heap, (_create_sort_key(timestamp, line_num), line))
-    # remove empty log stream from the dict
-    if log_stream_to_remove is not None:
-        for idx in log_stream_to_remove:
-            del parsed_log_streams[idx]
-
-
-def _flush_logs_out_of_heap(
-    heap: list[tuple[int, StructuredLogMessage]],
-    flush_size: int,
-    last_log_container: list[StructuredLogMessage | None],
-) -> Generator[StructuredLogMessage, None, None]:
+
+def _interleave_logs(*log_streams: RawLogStream) -> StructuredLogStream:
     """
-    Flush logs out of the heap, deduplicating them based on the last log.
+    Merge log streams using a streaming K-way merge.
+
+    Each stream is in order already: lines without a timestamp sort with the line before them. So the merge
+    only holds the next record of each stream, and yields the first record as soon as every stream has
+    produced one, however big the logs are. Consecutive identical records with a timestamp, such as the same
+    line read from both the local file and the log server, are yielded only once.
 
-    :param heap: heap to flush logs from
-    :param flush_size: number of logs to flush
-    :param last_log_container: a container to store the last log, to avoid duplicate logs
-    :return: a generator that yields deduplicated logs
+    :param log_streams: raw log streams
+    :return: interleaved log stream
     """
-    last_log = last_log_container[0]
-    for _ in range(flush_size):
-        sort_key, line = heapq.heappop(heap)
+    merged = heapq.merge(
+        *(_sort_keyed_log_stream(_log_stream_to_parsed_log_stream(stream)) for stream in log_streams),
+        key=itemgetter(0),
+    )
+    last_log: StructuredLogMessage | None = None
+    for sort_key, line in merged:
         if line != last_log or _is_sort_key_with_default_timestamp(sort_key):  # dedupe
             yield line
         last_log = line
-    # update the last log container with the last log
-    last_log_container[0] = last_log
-
-
-def _interleave_logs(*log_streams: RawLogStream) -> StructuredLogStream:
-    """
-    Merge parsed log streams using K-way merge.
 
-    By yielding HALF_CHUNK_SIZE records when heap size exceeds CHUNK_SIZE, we can reduce the chance of messing up the global order.
-    Since there are multiple log streams, we can't guarantee that the records are in global order.
 
-    e.g.
-
-    log_stream1: ----------
-    log_stream2:   ----
-    log_stream3:     --------
-
-    The first record of log_stream3 is later than the fourth record of log_stream1 !
-    :param parsed_log_streams: parsed log streams
-    :return: interleaved log stream
-    """
-    # don't need to push whole tuple into heap, which increases too much overhead
-    # push only sort_key and line into heap
-    heap: list[tuple[int, StructuredLogMessage]] = []
-    # to allow removing empty streams while iterating, also turn the str stream into parsed log stream
-    parsed_log_streams: dict[int, ParsedLogStream] = {
-        idx: _log_stream_to_parsed_log_stream(log_stream) for idx, log_stream in enumerate(log_streams)
-    }
-
-    # keep adding records from logs until all logs are empty
-    last_log_container: list[StructuredLogMessage | None] = [None]
-    while parsed_log_streams:
-        _add_log_from_parsed_log_streams_to_heap(heap, parsed_log_streams)
-
-        # yield HALF_HEAP_DUMP_SIZE records when heap size exceeds HEAP_DUMP_SIZE
-        if len(heap) >= HEAP_DUMP_SIZE:
-            yield from _flush_logs_out_of_heap(heap, HALF_HEAP_DUMP_SIZE, last_log_container)
-
-    # yield remaining records
-    yield from _flush_logs_out_of_heap(heap, len(heap), last_log_container)
-    # free memory
-    del heap
-    del parsed_log_streams
+def _track_log_pos(log_stream: StructuredLogStream, metadata: LogMetadata) -> StructuredLogStream:
+    """Yield the records of a log stream, keeping ``log_pos`` in the metadata at the number read so far."""
+    for line in log_stream:
+        metadata["log_pos"] += 1
+        yield line
 
 
 def _is_logs_stream_like(log) -> bool:
@@ -586,21 +606,26 @@ class FileTaskHandler(logging.Handler):
         :param metadata: log metadata,
                          can be used for steaming log reading and auto-tailing.
                          Following attributes are used:
-                         log_pos: (absolute) Char position to which the log
-                                  which was retrieved in previous calls, this
-                                  part will be skipped and only following test
+                         log_pos: (absolute) number of log lines which were
+                                  retrieved in previous calls, these lines
+                                  will be skipped and only the following ones
                                   returned to be added to tail.
+                         tail_lines: if set, only the last lines of the log
+                                     are returned, and the log ends there.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
-                 log_pos: (absolute) Char position to which the log is retrieved
+                 log_pos: (absolute) number of log lines retrieved. The logs are
+                          streamed, so it is only final once the returned
+                          stream has been consumed.
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
         # is needed to get correct log path.
         worker_log_rel_path = self._render_filename(ti, try_number)
+        tail_lines = metadata.get("tail_lines") if metadata else None
         sources: LogSourceInfo = []
         source_list: list[str] = []
         remote_logs: list[RawLogStream] = []
@@ -639,16 +664,16 @@ class FileTaskHandler(logging.Handler):
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
-            sources, local_logs = self._read_from_local(worker_log_full_path)
+            sources, local_logs = self._read_from_local(worker_log_full_path, tail_lines=tail_lines)
             source_list.extend(sources)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_k8s_exec_pod:
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, tail_lines=tail_lines)
             source_list.extend(sources)
         elif ti.state not in State.unfinished and not (local_logs or remote_logs):
             # ordinarily we don't check served logs, with the assumption that users set up
             # remote logging or shared drive for logs for persistence, but that's not always true
             # so even if task is done, if no local logs or remote logs are found, we'll check the worker
-            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path)
+            sources, served_logs = self._read_from_logs_server(ti, worker_log_rel_path, tail_lines=tail_lines)
             source_list.extend(sources)
 
         out_stream: LogHandlerOutputStream = _interleave_logs(
@@ -669,21 +694,22 @@ class FileTaskHandler(logging.Handler):
             TaskInstanceState.DEFERRED,
         )
 
-        with LogStreamAccumulator(out_stream, HEAP_DUMP_SIZE) as stream_accumulator:
-            log_pos = stream_accumulator.total_lines
-            out_stream = stream_accumulator.stream
+        if tail_lines:
+            # Only the ends of the local and served logs were read, but other sources are read in full. The
+            # position in the whole log is not known then, so there is nothing to resume reading from: the
+            # tail is a snapshot, and following the log needs reading it without tail_lines.
+            return chain(header, deque(out_stream, maxlen=tail_lines)), {"end_of_log": True}
 
-            # skip log stream until the last position
-            if metadata and "log_pos" in metadata:
-                islice(out_stream, metadata["log_pos"])
-            else:
-                # first time reading log, add messages before interleaved log stream
-                out_stream = chain(header, out_stream)
+        # The logs are streamed rather than counted up front, so log_pos is only final once they are consumed
+        log_pos = metadata.get("log_pos", 0) if metadata else 0
+        out_metadata: LogMetadata = {"end_of_log": end_of_log, "log_pos": log_pos}
+        # skip log stream until the last position
+        out_stream = _track_log_pos(islice(out_stream, log_pos, None), out_metadata)
+        if not metadata or "log_pos" not in metadata:
+            # first time reading log, add messages before interleaved log stream
+            out_stream = chain(header, out_stream)
 
-            return out_stream, {
-                "end_of_log": end_of_log,
-                "log_pos": log_pos,
-            }
+        return out_stream, out_metadata
 
     @staticmethod
     @staticmethod
@@ -847,6 +873,7 @@ class FileTaskHandler(logging.Handler):
     @staticmethod
     def _read_from_local(
         worker_log_path: Path,
+        tail_lines: int | None = None,
     ) -> LogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
@@ -857,20 +884,28 @@ class FileTaskHandler(logging.Handler):
         for path in paths:
             sources.append(os.fspath(path))
             # Read the log file and yield lines
-            log_streams.append(_stream_lines_by_chunk(open(path, encoding="utf-8")))
+            if tail_lines:
+                log_file = open(path, "rb")
+                start = _find_tail_offset(log_file, tail_lines)
+                log_streams.append(
+                    _stream_lines_by_chunk(io.TextIOWrapper(log_file, encoding="utf-8"), start)
+                )
+            else:
+                log_streams.append(_stream_lines_by_chunk(open(path, encoding="utf-8")))
         return sources, log_streams
 
     def _read_from_logs_server(
         self,
         ti: TaskInstance,
         worker_log_rel_path: str,
+        tail_lines: int | None = None,
     ) -> LogResponse:
         sources: LogSourceInfo = []
         log_streams: list[RawLogStream] = []
         try:
             log_type = LogType.TRIGGER if ti.triggerer_job else LogType.WORKER
             url, rel_path = self._get_log_retrieval_url(ti, worker_log_rel_path, log_type=log_type)
-            response = _fetch_logs_from_service(url, rel_path)
+            response = _fetch_logs_from_service(url, rel_path, tail_lines=tail_lines)
             if response.status_code == 403:
                 sources.append(
                     "!!!! Please make sure that all your Airflow components (e.g. "
@@ -885,9 +920,13 @@ class FileTaskHandler(logging.Handler):
                 response.raise_for_status()
                 if int(response.headers.get("Content-Length", 0)) > 0:
                     sources.append(url)
-                    log_streams.append(
-                        _stream_lines_by_chunk(io.TextIOWrapper(cast("IO[bytes]", response.raw)))
-                    )
+                    if response.status_code == 206:
+                        # Only the tail of the log was fetched, and it has been read already
+                        log_streams.append(_stream_lines_by_chunk(io.StringIO(response.text)))
+                    else:
+                        log_streams.append(
+                            _stream_lines_by_chunk(io.TextIOWrapper(cast("IO[bytes]", response.raw)))
+                        )
         except Exception as e:
             from requests.exceptions import InvalidURL
 
@@ -36,6 +36,7 @@ from airflow.providers_manager import (
     PluginInfo,
     ProviderInfo,
     ProvidersManager,
+    _ProvidersDiscoveryCache,
 )
 
 from tests_common.test_utils.markers import skip_if_force_lowest_dependencies_marker, skip_if_not_on_main
@@ -318,6 +319,41 @@ class TestProviderManager:
         assert len(dialect_class_names) == 3
         assert dialect_class_names == ["default", "mssql", "postgresql"]
 
+    def test_providers_discovery_cache(self, tmp_path, monkeypatch):
+        cache_path = tmp_path / "providers.json"
+        providers_manager = ProvidersManager()
+        monkeypatch.setattr(providers_manager, "_discovery_cache", _ProvidersDiscoveryCache(str(cache_path)))
+        providers_manager.initialize_providers_list()
+        providers = dict(providers_manager.providers)
+        assert cache_path.exists()
+
+        providers_manager._cleanup()
+        with patch.object(_ProvidersDiscoveryCache, "set_providers") as mock_set_providers:
+            providers_manager.initialize_providers_list()
+        mock_set_providers.assert_not_called()
+        assert providers_manager.providers == providers
+
+    def test_providers_discovery_cache_ignored_when_packages_changed(self, tmp_path):
+        cache = _ProvidersDiscoveryCache(str(tmp_path / "providers.json"))
+        cache.load("fingerprint")
+        cache.set_providers(
+            {"test-package": ProviderInfo(version="0.0.1", data={"package-name": "test-package"})}
+        )
+        cache.add_checked_class("test.Class")
+        cache.save()
+
+        cache = _ProvidersDiscoveryCache(str(tmp_path / "providers.json"))
+        cache.load("fingerprint")
+        assert cache.providers == {
+            "test-package": ProviderInfo(version="0.0.1", data={"package-name": "test-package"})
+        }
+        assert cache.checked_classes == {"test.Class"}
+
+        cache = _ProvidersDiscoveryCache(str(tmp_path / "providers.json"))
+        cache.load("other-fingerprint")
+        assert cache.providers is None
+        assert cache.checked_classes == set()
+
     @patch("airflow.providers_manager.import_string")
     def test_optional_feature_no_warning(self, mock_importlib_import_string):
         with self._caplog.at_level(logging.WARNING):
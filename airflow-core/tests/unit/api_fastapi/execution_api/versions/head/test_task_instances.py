@@ -27,7 +27,7 @@ from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.auth.tokens import JWTValidator
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.execution_api.app import lifespan
 from airflow.models import RenderedTaskInstanceFields, TaskReschedule, Trigger
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetEvent, AssetModel
@@ -1304,6 +1304,150 @@ class TestTIHealthEndpoint:
         assert ti.last_heartbeat_at == time_now.add(minutes=10)
 
 
+class TestTIBulkHeartbeat:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    def _create_tis(self, dag_maker, session, states):
+        with dag_maker("bulk_heartbeat_dag", session=session):
+            for idx in range(len(states)):
+                EmptyOperator(task_id=f"t{idx}")
+        dr = dag_maker.create_dagrun(run_id="run")
+        tis = [dr.get_task_instance(f"t{idx}", session=session) for idx in range(len(states))]
+        for ti, state in zip(tis, states):
+            ti.state = state
+            ti.hostname = "random-hostname"
+            ti.pid = 1789
+        session.commit()
+        return tis
+
+    def test_ti_bulk_heartbeat(self, client, session, dag_maker, time_machine):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+        tis = self._create_tis(dag_maker, session, [State.RUNNING, State.RUNNING])
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    {"id": str(ti.id), "hostname": "random-hostname", "pid": 1789, "token": "fake"}
+                    for ti in tis
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [
+                {"id": str(ti.id), "status_code": 204, "detail": None, "refreshed_token": None} for ti in tis
+            ]
+        }
+        for ti in tis:
+            session.refresh(ti)
+            assert ti.last_heartbeat_at == time_now
+
+    def test_ti_bulk_heartbeat_mixed_results(self, client, session, dag_maker, time_machine):
+        """Each heartbeat gets what the TI heartbeat endpoint would respond, without failing the others."""
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+        running, elsewhere, finished = self._create_tis(
+            dag_maker, session, [State.RUNNING, State.RUNNING, State.SUCCESS]
+        )
+        missing_id = "0182e924-0f1e-77e6-ab50-e977118bc139"
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    {"id": str(running.id), "hostname": "random-hostname", "pid": 1789, "token": "fake"},
+                    {"id": str(elsewhere.id), "hostname": "random-hostname", "pid": 1054, "token": "fake"},
+                    {"id": str(finished.id), "hostname": "random-hostname", "pid": 1789, "token": "fake"},
+                    {"id": missing_id, "hostname": "random-hostname", "pid": 1789, "token": "fake"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status_code"] for result in results] == [204, 409, 409, 404]
+        assert results[1]["detail"] == {
+            "reason": "running_elsewhere",
+            "message": "TI is already running elsewhere",
+            "current_hostname": "random-hostname",
+            "current_pid": 1789,
+        }
+        assert results[2]["detail"] == {
+            "reason": "not_running",
+            "message": "TI is no longer in the running state and task should terminate",
+            "current_state": State.SUCCESS,
+        }
+        assert results[3]["detail"] == {"reason": "not_found", "message": "Task Instance not found"}
+
+        session.refresh(running)
+        session.refresh(elsewhere)
+        session.refresh(finished)
+        assert running.last_heartbeat_at == time_now
+        assert elsewhere.last_heartbeat_at is None
+        assert finished.last_heartbeat_at is None
+
+    def test_ti_bulk_heartbeat_checks_token_of_each_ti(self, client, session, dag_maker):
+        ti, other = self._create_tis(dag_maker, session, [State.RUNNING, State.RUNNING])
+
+        validator = mock.AsyncMock(spec=JWTValidator)
+
+        def side_effect(cred, validators=None):
+            if validators and validators["sub"]["value"] != cred:
+                raise RuntimeError("Fake auth denied")
+            return {"sub": cred, "exp": 9999999999}
+
+        validator.avalidated_claims.side_effect = side_effect
+        lifespan.registry.register_value(JWTValidator, validator)
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    {"id": str(ti.id), "hostname": "random-hostname", "pid": 1789, "token": str(ti.id)},
+                    {"id": str(other.id), "hostname": "random-hostname", "pid": 1789, "token": str(ti.id)},
+                ]
+            },
+            headers={"Authorization": f"Bearer {ti.id}"},
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status_code"] for result in results] == [204, 403]
+        assert results[1]["detail"]["reason"] == "invalid_token"
+        session.refresh(other)
+        assert other.last_heartbeat_at is None
+
+    def test_ti_bulk_heartbeat_refreshes_tokens(self, client, session, dag_maker):
+        (ti,) = self._create_tis(dag_maker, session, [State.RUNNING])
+
+        with mock.patch(
+            "airflow.api_fastapi.execution_api.routes.task_instances._token_reissuer.needs_refresh",
+            return_value=True,
+        ):
+            generator = mock.Mock(spec=JWTGenerator)
+            generator.generate.return_value = "refreshed"
+            lifespan.registry.register_value(JWTGenerator, generator)
+
+            response = client.put(
+                "/execution/task-instances/heartbeats",
+                json={
+                    "heartbeats": [
+                        {"id": str(ti.id), "hostname": "random-hostname", "pid": 1789, "token": "fake"}
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["refreshed_token"] == "refreshed"
+
+
 class TestTIPutRTIF:
     def setup_method(self):
         clear_db_runs()
@@ -25,6 +25,7 @@ import httpx
 import pytest
 from fastapi import FastAPI, HTTPException, Path, Request, status
 
+from airflow._shared.timezones import timezone
 from airflow.api_fastapi.execution_api.datamodels.xcom import XComResponse
 from airflow.models.dagrun import DagRun
 from airflow.models.taskmap import TaskMap
@@ -274,6 +275,97 @@ class TestXComsGetEndpoint:
         assert response.json() == ["f", "o", "b"][key]
 
 
+class TestXComsBulkPullEndpoint:
+    def test_xcom_bulk_pull(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task_a")
+            EmptyOperator.partial(task_id="task_b").expand_kwargs([{}, {}, {}])
+        dag_run = dag_maker.create_dagrun(run_id="runid")
+
+        for ti in dag_run.task_instances:
+            session.add(
+                XComModel(
+                    key="xcom_1",
+                    value=f"{ti.task_id}_{ti.map_index}",
+                    dag_run_id=ti.dag_run.id,
+                    run_id=ti.run_id,
+                    task_id=ti.task_id,
+                    dag_id=ti.dag_id,
+                    map_index=ti.map_index,
+                )
+            )
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/runid/pull",
+            json={
+                "xcoms": [
+                    {"task_id": "task_a", "key": "xcom_1"},
+                    {"task_id": "task_b", "key": "xcom_1", "map_index": 1},
+                    {"task_id": "task_b", "key": "xcom_1", "map_index": None},
+                    {"task_id": "task_a", "key": "xcom_2"},
+                    {"task_id": "task_b", "key": "xcom_1", "map_index": 5},
+                    {"task_id": "missing", "key": "xcom_1", "map_index": None},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "values": [
+                ["task_a_-1"],
+                ["task_b_1"],
+                ["task_b_0", "task_b_1", "task_b_2"],
+                [],
+                [],
+                [],
+            ]
+        }
+
+    def test_xcom_bulk_pull_include_prior_dates(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task_a")
+            EmptyOperator(task_id="task_b")
+        prior_run = dag_maker.create_dagrun(run_id="prior", logical_date=timezone.datetime(2025, 1, 1))
+        dag_run = dag_maker.create_dagrun(run_id="runid", logical_date=timezone.datetime(2025, 1, 2))
+
+        for run, task_ids in [(prior_run, ["task_a", "task_b"]), (dag_run, ["task_a"])]:
+            for task_id in task_ids:
+                session.add(
+                    XComModel(
+                        key="xcom_1",
+                        value=f"{task_id}_{run.run_id}",
+                        dag_run_id=run.id,
+                        run_id=run.run_id,
+                        task_id=task_id,
+                        dag_id=run.dag_id,
+                        map_index=-1,
+                    )
+                )
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/runid/pull",
+            json={
+                "xcoms": [
+                    {"task_id": "task_a", "key": "xcom_1", "map_index": -1},
+                    {"task_id": "task_b", "key": "xcom_1", "map_index": -1},
+                ],
+                "include_prior_dates": True,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"values": [["task_a_runid"], ["task_b_prior"]]}
+
+    def test_xcom_bulk_pull_rejects_unknown_fields(self, client):
+        response = client.post(
+            "/execution/xcoms/dag/runid/pull",
+            json={"xcoms": [{"task_id": "task_a", "key": "xcom_1", "offset": 1}]},
+        )
+        assert response.status_code == 422
+
+
 class TestXComsSetEndpoint:
     @pytest.mark.parametrize(
         ("value", "expected_value"),
@@ -377,6 +377,8 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("timezone", ["UTC", "Europe/Berlin", "America/Los_Angeles"])
@@ -398,6 +400,8 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("confirm_arg, expected", [(["-y"], False), ([], True)])
@@ -425,6 +429,8 @@ class TestCLIDBClean:
             confirm=expected,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("extra_arg, expected", [(["--skip-archive"], True), ([], False)])
@@ -452,6 +458,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=expected,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("dry_run_arg, expected", [(["--dry-run"], True), ([], False)])
@@ -479,6 +487,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize(
@@ -508,6 +518,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("extra_args, expected", [(["--verbose"], True), ([], False)])
@@ -535,6 +547,8 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            workers=1,
+            resume=False,
         )
 
     @pytest.mark.parametrize("extra_args, expected", [(["--batch-size", "1234"], 1234), ([], None)])
@@ -562,6 +576,42 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=expected,
+            workers=1,
+            resume=False,
+        )
+
+    @pytest.mark.parametrize(
+        "extra_args, expected_workers, expected_resume",
+        [(["--workers", "4", "--resume"], 4, True), ([], 1, False)],
+    )
+    @patch("airflow.cli.commands.db_command.run_cleanup")
+    def test_workers_and_resume(self, run_cleanup_mock, extra_args, expected_workers, expected_resume):
+        """
+        workers and resume should be forwarded to run_cleanup.
+        """
+        args = self.parser.parse_args(
+            [
+                "db",
+                "clean",
+                "--clean-before-timestamp",
+                "2021-01-01",
+                "--batch-size",
+                "1000",
+                *extra_args,
+            ]
+        )
+        db_command.cleanup_tables(args)
+
+        run_cleanup_mock.assert_called_once_with(
+            table_names=None,
+            dry_run=False,
+            clean_before_timestamp=pendulum.parse("2021-01-01 00:00:00Z"),
+            verbose=False,
+            confirm=True,
+            skip_archive=False,
+            batch_size=1000,
+            workers=expected_workers,
+            resume=expected_resume,
         )
 
     @patch("airflow.cli.commands.db_command.export_archived_records")
@@ -575,6 +575,50 @@ key2 = airflow
         test_conf.remove_option("test", "key2")
         assert not test_conf.has_option("test", "key2")
 
+    def test_value_cache(self):
+        test_conf = AirflowConfigParser()
+        test_conf.read_string("[test]\nkey1 = hello\n")
+        test_conf.enable_value_cache()
+
+        assert test_conf.get("test", "key1") == "hello"
+        with mock.patch.object(test_conf, "_get_uncached") as mock_get_uncached:
+            assert test_conf.get("test", "key1") == "hello"
+            mock_get_uncached.assert_not_called()
+
+        assert test_conf.get("test", "missing", fallback="a") == "a"
+        assert test_conf.get("test", "missing", fallback="b") == "b"
+
+        test_conf.set("test", "key1", "world")
+        assert test_conf.get("test", "key1") == "world"
+        test_conf.read_string("[test]\nkey1 = again\n")
+        assert test_conf.get("test", "key1") == "again"
+        test_conf.remove_section("test")
+        assert test_conf.get("test", "key1", fallback="removed") == "removed"
+        test_conf.add_section("test")
+        test_conf.set("test", "key1", "added")
+        assert test_conf.get("test", "key1") == "added"
+
+        test_conf.disable_value_cache()
+        test_conf.set("test", "key1", "done")
+        assert test_conf.get("test", "key1") == "done"
+
+    @mock.patch("airflow.configuration.time.monotonic")
+    @mock.patch("airflow.configuration.run_command")
+    def test_value_cache_expires_sensitive_values(self, mock_run_command, mock_monotonic):
+        test_conf = AirflowConfigParser()
+        test_conf.read_string("[test]\nkey1_cmd = printf key1_result\n")
+        test_conf.sensitive_config_values = test_conf.sensitive_config_values | {("test", "key1")}
+        test_conf.enable_value_cache(sensitive_ttl=10)
+        mock_monotonic.return_value = 100
+        mock_run_command.return_value = "first"
+
+        assert test_conf.get("test", "key1") == "first"
+        mock_run_command.return_value = "second"
+        mock_monotonic.return_value = 105
+        assert test_conf.get("test", "key1") == "first"
+        mock_monotonic.return_value = 111
+        assert test_conf.get("test", "key1") == "second"
+
     def test_getsection(self):
         test_config = """
 [test]
@@ -774,6 +818,15 @@ key3 = value3
         )
         assert message == exception
 
+    def test_enum_task_selection_strategy(self):
+        test_conf = AirflowConfigParser(default_config="")
+        test_conf.read_dict({"scheduler": {"task_selection_strategy": "windowed"}})
+        with pytest.raises(AirflowConfigException) as ctx:
+            test_conf.validate()
+        assert str(ctx.value) == (
+            "`[scheduler] task_selection_strategy` should not be 'windowed'. Possible values: loop, window."
+        )
+
     def test_as_dict_works_without_sensitive_cmds(self):
         conf_materialize_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=True)
         conf_maintain_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=False)
@@ -49,13 +49,19 @@ from airflow.dag_processing.manager import (
     DagFileProcessorManager,
     DagFileStat,
 )
-from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParserWorker,
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    file_fingerprint,
+)
 from airflow.models import DAG, DagBag, DagModel, DbCallbackRequest
 from airflow.models.asset import TaskOutletAssetReference
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagcode import DagCode
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedDAG
 from airflow.utils.net import get_hostname
 from airflow.utils.session import create_session
 
@@ -549,6 +555,27 @@ class TestDagFileProcessorManager:
             manager._kill_timed_out_processors()
         mock_kill.assert_not_called()
 
+    def test_recycled_parser_worker_is_reaped_without_waiting(self):
+        manager = DagFileProcessorManager(max_runs=1, parser_worker_max_parses=1)
+        worker = MagicMock(spec=DagFileParserWorker)
+        worker.should_recycle.return_value = True
+        worker.poll.return_value = None
+
+        manager._release_worker(worker)
+
+        worker.stop.assert_called_once_with(signal.SIGTERM)
+        worker.kill.assert_not_called()
+        manager._reap_stopping_workers()
+        assert [w for w, _ in manager._stopping_workers] == [worker]
+
+        # Killed once it took too long to exit, and forgotten once it has
+        manager._stopping_workers = [(worker, 0.0)]
+        manager._reap_stopping_workers()
+        worker.stop.assert_called_with(signal.SIGKILL)
+        worker.poll.return_value = -signal.SIGKILL
+        manager._reap_stopping_workers()
+        assert manager._stopping_workers == []
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     @pytest.mark.parametrize(
         ["callbacks", "path", "expected_body"],
@@ -634,6 +661,34 @@ class TestDagFileProcessorManager:
         with create_session() as session:
             assert session.get(DagModel, dag_id) is not None
 
+    @conf_vars(
+        {
+            ("dag_processor", "parser_worker_max_parses"): "2",
+            ("dag_processor", "parsing_processes"): "1",
+        }
+    )
+    @pytest.mark.execution_timeout(30)
+    def test_dag_with_system_exit_parser_workers(self, configure_testing_dag_bundle):
+        """The files are parsed by a parser worker, which is replaced after every two files."""
+        dag_directory = TEST_DAG_FOLDER.parent / "dags_with_system_exit"
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+        with configure_testing_dag_bundle(dag_directory):
+            manager = DagFileProcessorManager(max_runs=1)
+            with mock.patch.object(
+                DagFileParserWorker, "start", side_effect=DagFileParserWorker.start
+            ) as mock_start:
+                manager.run()
+
+        assert sum(stat.run_count for stat in manager._file_stats.values()) == 3
+        assert sum(stat.num_dags for stat in manager._file_stats.values()) == 1
+        assert mock_start.call_count == 2
+        assert manager._idle_workers == []
+
+        with create_session() as session:
+            assert session.get(DagModel, "exit_test_dag") is not None
+
     @conf_vars({("core", "load_examples"): "False"})
     @mock.patch("airflow.dag_processing.manager.Stats.timing")
     @pytest.mark.skip("AIP-66: stats are not implemented yet")
@@ -742,6 +797,79 @@ class TestDagFileProcessorManager:
         # and the DAG from test_dag2.py is deactivated
         assert dagbag.get_dag("test_dag2").get_is_active() is False
 
+    @pytest.mark.parametrize(
+        ("import_errors", "requested_external_state"),
+        [
+            pytest.param({}, False, id="cacheable"),
+            pytest.param({"dag.py": "error"}, False, id="import-errors"),
+            pytest.param({}, True, id="external-state"),
+        ],
+    )
+    @conf_vars({("dag_processor", "parse_result_cache_ttl"): "600"})
+    def test_parse_result_cache(self, import_errors, requested_external_state, tmp_path, dag_maker, session):
+        with dag_maker("cached_dag"):
+            pass
+        dag_maker.sync_dagbag_to_db()
+        dag_path = tmp_path / "dag.py"
+        dag_path.write_text("from util import NAME")
+        util_path = tmp_path / "util.py"
+        util_path.write_text("NAME = 'cached_dag'")
+
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._bundle_versions["testing"] = "v1"
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        assert manager._reuse_parse_result(file) is False
+
+        processor, _ = self.mock_processor()
+        processor.parsing_result = DagFileParsingResult(
+            fileloc=str(dag_path),
+            serialized_dags=[LazyDeserializedDAG(data=SerializedDAG.to_dict(dag_maker.dag))],
+            import_errors=import_errors,
+            module_fingerprints={str(util_path): file_fingerprint(util_path)},
+        )
+        processor.requested_external_state = requested_external_state
+        manager._update_parse_result_cache(file, processor)
+
+        cacheable = not import_errors and not requested_external_state
+        with time_machine.travel(timezone.utcnow() + timedelta(minutes=1), tick=False):
+            assert manager._reuse_parse_result(file) is cacheable
+        if cacheable:
+            dag_model = session.get(DagModel, "cached_dag")
+            assert dag_model.last_parsed_time == manager._file_stats[file].last_finish_time
+            assert manager._file_stats[file].run_count == 1
+
+            # A change to an imported module of the bundle invalidates the cached result
+            util_path.write_text("NAME = 'other_dag'")
+            assert manager._reuse_parse_result(file) is False
+        assert file not in manager._parse_result_cache
+
+    @conf_vars({("dag_processor", "parse_result_cache_ttl"): "600"})
+    def test_parse_result_cache_invalidated_by_bundle_version(self, tmp_path, dag_maker):
+        with dag_maker("cached_dag"):
+            pass
+        dag_maker.sync_dagbag_to_db()
+        dag_path = tmp_path / "dag.py"
+        dag_path.write_text("dag = 'cached_dag'")
+
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._bundle_versions["testing"] = "v1"
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        assert manager._reuse_parse_result(file) is False
+        processor, _ = self.mock_processor()
+        processor.parsing_result = DagFileParsingResult(
+            fileloc=str(dag_path),
+            serialized_dags=[LazyDeserializedDAG(data=SerializedDAG.to_dict(dag_maker.dag))],
+            module_fingerprints={},
+        )
+        processor.requested_external_state = False
+        manager._update_parse_result_cache(file, processor)
+        assert manager._reuse_parse_result(file) is True
+
+        # The file is the same in the new version, but its DAGs have to be recorded against it
+        manager._bundle_versions["testing"] = "v2"
+        assert manager._reuse_parse_result(file) is False
+        assert file not in manager._parse_result_cache
+
     @conf_vars({("core", "load_examples"): "False"})
     def test_fetch_callbacks_from_database(self, configure_testing_dag_bundle):
         dag_filepath = TEST_DAG_FOLDER / "test_on_failure_callback_dag.py"
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import inspect
 import pathlib
+import signal
 import sys
 import textwrap
 import uuid
@@ -47,12 +48,14 @@ from airflow.callbacks.callback_requests import (
 )
 from airflow.dag_processing.processor import (
     DagFileParseRequest,
+    DagFileParserWorker,
     DagFileParsingResult,
     DagFileProcessorProcess,
     _execute_dag_callbacks,
     _execute_task_callbacks,
     _parse_file,
     _pre_import_airflow_modules,
+    file_fingerprint,
 )
 from airflow.models import DagBag, DagRun
 from airflow.models.baseoperator import BaseOperator
@@ -190,6 +193,7 @@ class TestDagFileProcessor:
         assert result.import_errors != {}
         if result.import_errors:
             assert "VARIABLE_NOT_FOUND" in next(iter(result.import_errors.values()))
+        assert proc.requested_external_state
 
     def test_top_level_variable_set(self, tmp_path: pathlib.Path, inprocess_client):
         from airflow.models.variable import Variable as VariableORM
@@ -363,6 +367,62 @@ class TestDagFileProcessor:
         assert result is not None
         assert result.import_errors == {}
         assert result.serialized_dags[0].dag_id == "dag_name"
+        util_path = str(tmp_path / "util.py")
+        assert result.module_fingerprints == {util_path: file_fingerprint(util_path)}
+        assert not proc.requested_external_state
+
+    def test_parser_worker_parses_multiple_files(self, tmp_path: pathlib.Path, inprocess_client):
+        tmp_path.joinpath("util.py").write_text("NAME = 'dag_name'")
+        dag1_path = tmp_path.joinpath("dag1.py")
+        dag1_path.write_text(
+            "from util import NAME\nfrom airflow.sdk import DAG\nwith DAG(NAME):\n    pass\n"
+        )
+
+        def parse(worker):
+            worker.parse_file(
+                path=dag1_path,
+                bundle_path=tmp_path,
+                callbacks=[],
+                logger=MagicMock(spec=FilteringBoundLogger),
+                logger_filehandle=MagicMock(spec=BinaryIO),
+            )
+            while not worker.is_ready:
+                worker._service_subprocess(0.1)
+            worker.release_logger(MagicMock(spec=FilteringBoundLogger))
+            return worker.parsing_result
+
+        worker = DagFileParserWorker.start(
+            id=1,
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+        )
+        try:
+            result = parse(worker)
+            assert result is not None
+            assert result.serialized_dags[0].dag_id == "dag_name"
+
+            # The bundle modules are imported again for the next file
+            tmp_path.joinpath("util.py").write_text("NAME = 'other_name'")
+            result = parse(worker)
+            assert result is not None
+            assert result.serialized_dags[0].dag_id == "other_name"
+
+            assert worker.parse_count == 2
+
+            # What a file adds to sys.path is gone by the time the next one is parsed
+            dag1_path.write_text(
+                "import sys\nsys.path.append('extra')\nfrom airflow.sdk import DAG\n"
+                "with DAG(f\"dag_{sys.path.count('extra')}\"):\n    pass\n"
+            )
+            assert parse(worker).serialized_dags[0].dag_id == "dag_1"
+            assert parse(worker).serialized_dags[0].dag_id == "dag_1"
+            assert not worker.should_recycle(max_parses=5, max_memory_mb=0)
+            assert worker.should_recycle(max_parses=4, max_memory_mb=0)
+            assert worker.should_recycle(max_parses=5, max_memory_mb=1)
+        finally:
+            worker.kill(signal.SIGTERM)
+        assert worker.should_recycle(max_parses=5, max_memory_mb=0)
 
     def test__pre_import_airflow_modules_when_disabled(self):
         logger = MagicMock(spec=FilteringBoundLogger)
@@ -17,8 +17,12 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import logging
+import pickle
+import random
 from datetime import timedelta
+from types import SimpleNamespace
 from unittest import mock
 from uuid import UUID
 
@@ -31,7 +35,7 @@ from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.cli.cli_config import DefaultHelpParser, GroupCommand
 from airflow.cli.cli_parser import AirflowHelpFormatter
 from airflow.executors import workloads
-from airflow.executors.base_executor import BaseExecutor, RunningRetryAttemptType
+from airflow.executors.base_executor import BaseExecutor, QueuedTasks, RunningRetryAttemptType
 from airflow.executors.local_executor import LocalExecutor
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
@@ -243,6 +247,90 @@ def test_trigger_running_tasks(dag_maker):
     executor._process_workloads.assert_called_once()
 
 
+def make_queued_workload(priority_weight):
+    workload = mock.Mock(spec=workloads.ExecuteTask)
+    workload.ti = mock.Mock(priority_weight=priority_weight)
+    return workload
+
+
+def test_queued_tasks_items_by_priority_matches_sort():
+    """The heap order is the order of a stable sort of the dict by descending priority_weight."""
+    rng = random.Random(42)
+    queued_tasks = QueuedTasks()
+    for i in range(2000):
+        key = f"task_{rng.randrange(500)}"
+        action = rng.random()
+        if action < 0.6:
+            queued_tasks[key] = make_queued_workload(rng.randrange(5))
+        elif action < 0.8:
+            queued_tasks.pop(key, None)
+        elif action < 0.9:
+            queued_tasks.setdefault(key, make_queued_workload(rng.randrange(5)))
+        elif key in queued_tasks:
+            del queued_tasks[key]
+
+        if i % 100 == 0:
+            expected = sorted(dict(queued_tasks).items(), key=lambda x: x[1].ti.priority_weight, reverse=True)
+            assert queued_tasks.items_by_priority() == expected
+            assert queued_tasks.items_by_priority(10) == expected[:10]
+            assert len(queued_tasks._heap) <= 2 * len(queued_tasks) + 64
+
+
+def test_queued_tasks_overwrite_keeps_insertion_order():
+    queued_tasks = QueuedTasks(a=make_queued_workload(1), b=make_queued_workload(1))
+    queued_tasks["a"] = make_queued_workload(2)
+    queued_tasks["a"] = make_queued_workload(1)
+    assert [key for key, _ in queued_tasks.items_by_priority()] == ["a", "b"]
+
+    # Re-adding a removed key puts it after the other tasks with the same priority_weight
+    del queued_tasks["a"]
+    queued_tasks["a"] = make_queued_workload(1)
+    assert [key for key, _ in queued_tasks.items_by_priority()] == ["b", "a"]
+
+    queued_tasks.clear()
+    assert queued_tasks.items_by_priority() == []
+
+
+@pytest.mark.parametrize(
+    "copy_queued_tasks",
+    [
+        pytest.param(lambda queued_tasks: pickle.loads(pickle.dumps(queued_tasks)), id="pickle"),
+        pytest.param(copy.deepcopy, id="deepcopy"),
+    ],
+)
+def test_queued_tasks_copy(copy_queued_tasks):
+    def workload(priority_weight):
+        return SimpleNamespace(ti=SimpleNamespace(priority_weight=priority_weight))
+
+    queued_tasks = QueuedTasks(a=workload(1), b=workload(3), c=workload(1))
+    queued_tasks["a"] = workload(1)
+
+    copied = copy_queued_tasks(queued_tasks)
+
+    assert isinstance(copied, QueuedTasks)
+    assert [key for key, _ in copied.items_by_priority()] == ["b", "a", "c"]
+    copied["d"] = workload(2)
+    assert [key for key, _ in copied.items_by_priority()] == ["b", "d", "a", "c"]
+
+
+def test_trigger_tasks_by_priority():
+    executor = BaseExecutor()
+    executor.active_spans = None
+    executor._process_workloads = mock.Mock(spec=lambda workloads: None)
+    for i, priority_weight in enumerate([1, 3, 2, 3, 1]):
+        executor.queued_tasks[f"task_{i}"] = make_queued_workload(priority_weight)
+    expected = [executor.queued_tasks[key] for key in ("task_1", "task_3", "task_2")]
+
+    executor.trigger_tasks(open_slots=3)
+    executor._process_workloads.assert_called_once_with(expected)
+
+    # Plain dicts assigned to queued_tasks are still ordered
+    executor._process_workloads.reset_mock()
+    executor.queued_tasks = dict(executor.queued_tasks)
+    executor.trigger_tasks(open_slots=3)
+    executor._process_workloads.assert_called_once_with(expected)
+
+
 def test_debug_dump(caplog):
     executor = BaseExecutor()
     with caplog.at_level(logging.INFO):
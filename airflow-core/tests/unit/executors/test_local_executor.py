@@ -86,7 +86,7 @@ class TestLocalExecutor:
         executor = LocalExecutor(parallelism=parallelism)
         executor.start()
 
-        assert executor.result_queue.empty()
+        assert not executor._pending_workloads
 
         with spy_on(executor._spawn_worker) as spawn_worker:
             for ti in success_tis:
@@ -116,9 +116,9 @@ class TestLocalExecutor:
             # Depending on how quickly the tasks run, we might not need to create all the workers we could
             assert 1 <= len(spawn_worker.calls) <= expected
 
-        # By that time Queues are already shutdown so we cannot check if they are empty
         assert len(executor.running) == 0
-        assert executor._unread_messages.value == 0
+        assert not executor._pending_workloads
+        assert not executor._worker_conns
 
         for ti in success_tis:
             assert executor.event_buffer[ti.key][0] == State.SUCCESS
@@ -127,7 +127,7 @@ class TestLocalExecutor:
     @skip_spawn_mp_start
     @pytest.mark.parametrize(
         ("parallelism",),
-        [pytest.param(2, id="limited")],
+        [pytest.param(1, id="single"), pytest.param(2, id="limited")],
     )
     def test_execution(self, parallelism: int):
         self._test_execute(parallelism=parallelism)
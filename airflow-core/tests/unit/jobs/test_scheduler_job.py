@@ -49,7 +49,7 @@ from airflow.executors.executor_constants import MOCK_EXECUTOR
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import ConcurrencyMap, SchedulerDagBag, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -77,7 +77,7 @@ from airflow.timetables.base import DataInterval
 from airflow.traces.tracer import Trace
 from airflow.utils.session import create_session, provide_session
 from airflow.utils.span_status import SpanStatus
-from airflow.utils.state import DagRunState, State, TaskInstanceState
+from airflow.utils.state import DagRunState, JobState, State, TaskInstanceState
 from airflow.utils.thread_safe_dict import ThreadSafeDict
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
@@ -681,7 +681,8 @@ class TestSchedulerJob:
         assert {x.key for x in queued_tis} == {ti_non_backfill.key, ti_backfill.key}
         session.rollback()
 
-    def test_find_executable_task_instances_pool(self, dag_maker):
+    @pytest.mark.parametrize("task_selection_strategy", ["loop", "window"])
+    def test_find_executable_task_instances_pool(self, dag_maker, task_selection_strategy):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_pool"
         task_id_1 = "dummy"
         task_id_2 = "dummydummy"
@@ -691,7 +692,8 @@ class TestSchedulerJob:
             EmptyOperator(task_id=task_id_2, pool="b", priority_weight=1)
 
         scheduler_job = Job()
-        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        with conf_vars({("scheduler", "task_selection_strategy"): task_selection_strategy}):
+            self.job_runner = SchedulerJobRunner(job=scheduler_job)
 
         dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
         dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
@@ -1127,8 +1129,96 @@ class TestSchedulerJob:
         assert ti1.state == State.SCHEDULED
         assert ti2.state == State.QUEUED
 
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "3600"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map", max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(executor=executor))
+        dr = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 2
+        session.commit()
+
+        # The tasks finished, but the scheduler has not been told yet, so they still count.
+        finished_ti = dr.get_task_instance(queued_tis[0].task_id, session=session)
+        finished_ti.state = State.SUCCESS
+        session.commit()
+        assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+
+        executor.event_buffer[finished_ti.key] = State.SUCCESS, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+        queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued_tis) == 1
+
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "30"})
+    @mock.patch("airflow.jobs.scheduler_job_runner.Stats.incr")
+    def test_incremental_concurrency_map_reconciles_drift(self, mock_stats_incr, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map_drift", session=session):
+            EmptyOperator(task_id="task_1")
+        dr = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        ti = dr.get_task_instance("task_1", session=session)
+        ti.state = State.RUNNING
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 1
+
+        ti.state = State.SUCCESS
+        session.flush()
+        # Pretend the reconcile interval has passed.
+        concurrency_map._last_reconciled -= 60
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 0
+        mock_stats_incr.assert_any_call("scheduler.concurrency_map.drift")
+
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "3600"})
+    def test_incremental_concurrency_map_reloaded_with_other_schedulers(self, dag_maker, session):
+        with dag_maker(dag_id="incremental_concurrency_map_ha", session=session):
+            EmptyOperator(task_id="task_1")
+        dr = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert concurrency_map is self.job_runner._concurrency_map
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 0
+
+        other_scheduler = Job(job_type="SchedulerJob", state=JobState.RUNNING)
+        session.add(other_scheduler)
+        # Queued by the other scheduler, so not added to the map of this one
+        ti = dr.get_task_instance("task_1", session=session)
+        ti.state = State.QUEUED
+        session.flush()
+
+        # Other schedulers are only looked for once per heartbeat
+        assert self.job_runner._get_concurrency_map(session=session) is self.job_runner._concurrency_map
+        self.job_runner._other_schedulers_checked_at -= self.job_runner.job.heartrate
+
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert type(concurrency_map) is ConcurrencyMap
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 1
+
+        other_scheduler.state = JobState.SUCCESS
+        session.flush()
+        self.job_runner._other_schedulers_checked_at -= self.job_runner.job.heartrate
+
+        concurrency_map = self.job_runner._get_concurrency_map(session=session)
+        assert concurrency_map is self.job_runner._concurrency_map
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "task_1")] == 1
+
+    @pytest.mark.parametrize("task_selection_strategy", ["loop", "window"])
     @pytest.mark.parametrize("active_state", [TaskInstanceState.RUNNING, TaskInstanceState.QUEUED])
-    def test_find_executable_task_instances_concurrency(self, dag_maker, active_state, session):
+    def test_find_executable_task_instances_concurrency(
+        self, dag_maker, active_state, task_selection_strategy, session
+    ):
         """
         We verify here that, with varying amounts of queued / running / scheduled tasks,
         the correct number of TIs are queued
@@ -1140,7 +1230,8 @@ class TestSchedulerJob:
             EmptyOperator(task_id="task_3")
 
         scheduler_job = Job()
-        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        with conf_vars({("scheduler", "task_selection_strategy"): task_selection_strategy}):
+            self.job_runner = SchedulerJobRunner(job=scheduler_job)
 
         dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, run_id="run_1", session=session)
         dr2 = dag_maker.create_dagrun_after(
@@ -1335,9 +1426,13 @@ class TestSchedulerJob:
 
         session.rollback()
 
-    def test_find_executable_task_instances_not_enough_dag_concurrency_for_first(self, dag_maker):
+    @pytest.mark.parametrize("task_selection_strategy", ["loop", "window"])
+    def test_find_executable_task_instances_not_enough_dag_concurrency_for_first(
+        self, dag_maker, task_selection_strategy
+    ):
         scheduler_job = Job()
-        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        with conf_vars({("scheduler", "task_selection_strategy"): task_selection_strategy}):
+            self.job_runner = SchedulerJobRunner(job=scheduler_job)
         session = settings.Session()
 
         dag_id_1 = (
@@ -1401,6 +1496,40 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @pytest.mark.parametrize("task_selection_strategy", ["loop", "window"])
+    def test_find_executable_task_instances_task_concurrency_does_not_block_pool(
+        self, dag_maker, task_selection_strategy, session
+    ):
+        """A task at its max_active_tis_per_dag must not keep the open pool slots from lower priority tasks."""
+        scheduler_job = Job()
+        with conf_vars({("scheduler", "task_selection_strategy"): task_selection_strategy}):
+            self.job_runner = SchedulerJobRunner(job=scheduler_job)
+
+        dag_id = "SchedulerJobTest.test_find_executable_task_instances_task_concurrency_does_not_block_pool"
+        session.add(Pool(pool="limited", slots=2, description="", include_deferred=False))
+        with dag_maker(dag_id=dag_id, session=session):
+            op1a = EmptyOperator(
+                task_id="dummy1-a", priority_weight=2, max_active_tis_per_dag=1, pool="limited"
+            )
+            op1b = EmptyOperator(task_id="dummy1-b", priority_weight=1, pool="limited")
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+
+        ti1a = dr1.get_task_instance(op1a.task_id, session)
+        ti1b = dr1.get_task_instance(op1b.task_id, session)
+        ti2a = dr2.get_task_instance(op1a.task_id, session)
+        ti1a.state = State.RUNNING
+        ti1b.state = State.SCHEDULED
+        ti2a.state = State.SCHEDULED
+        session.flush()
+
+        # The one open slot of the pool goes to the lower priority ti, as the higher priority one is
+        # limited by its task concurrency
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.key for ti in res] == [ti1b.key]
+
+        session.rollback()
+
     def test_find_executable_task_instances_task_concurrency_per_dagrun_for_first(self, dag_maker):
         scheduler_job = Job()
         self.job_runner = SchedulerJobRunner(job=scheduler_job)
@@ -6939,3 +7068,68 @@ def test_mark_backfills_completed(dag_maker, session):
     runner._mark_backfills_complete()
     b = session.get(Backfill, b.id)
     assert b.completed_at.timestamp() > 0
+
+
+def test_scheduler_dag_bag_evicts_least_recently_used(dag_maker, session):
+    clear_db_dags()
+    clear_db_runs()
+    dag_runs = []
+    for dag_id in ("dag_bag_lru_1", "dag_bag_lru_2", "dag_bag_lru_3"):
+        with dag_maker(dag_id=dag_id, serialized=True, session=session):
+            EmptyOperator(task_id="empty")
+        dag_runs.append(dag_maker.create_dagrun(session=session))
+
+    dag_bag = SchedulerDagBag(max_size=2, max_bytes=0)
+    with mock.patch("airflow.jobs.scheduler_job_runner.Stats.incr") as mock_incr:
+        dag_bag.get_dag(dag_runs[0], session=session)
+        dag_bag.get_dag(dag_runs[1], session=session)
+        # Touch the first dag so that the second one becomes the least recently used.
+        dag_bag.get_dag(dag_runs[0], session=session)
+        dag_bag.get_dag(dag_runs[2], session=session)
+
+    assert len(dag_bag) == 2
+    assert {dag.dag_id for dag in dag_bag._dags.values()} == {"dag_bag_lru_1", "dag_bag_lru_3"}
+    mock_incr.assert_has_calls(
+        [
+            mock.call("scheduler.dag_bag.cache_hits"),
+            mock.call("scheduler.dag_bag.cache_evictions", 1),
+        ],
+        any_order=True,
+    )
+
+
+def test_scheduler_dag_bag_max_bytes(dag_maker, session):
+    clear_db_dags()
+    clear_db_runs()
+    dag_runs = []
+    for dag_id in ("dag_bag_bytes_1", "dag_bag_bytes_2"):
+        with dag_maker(dag_id=dag_id, serialized=True, session=session):
+            EmptyOperator(task_id="empty")
+        dag_runs.append(dag_maker.create_dagrun(session=session))
+
+    dag_bag = SchedulerDagBag(max_size=0, max_bytes=1)
+    for dag_run in dag_runs:
+        assert dag_bag.get_dag(dag_run, session=session) is not None
+        # The most recently loaded dag is always kept, even if it alone exceeds the limit.
+        assert len(dag_bag) == 1
+    assert next(iter(dag_bag._dags.values())).dag_id == "dag_bag_bytes_2"
+
+
+def test_scheduler_dag_bag_evict_unreferenced(dag_maker, session):
+    clear_db_dags()
+    clear_db_runs()
+    with dag_maker(dag_id="dag_bag_running", serialized=True, session=session):
+        EmptyOperator(task_id="empty")
+    running_dr = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+    with dag_maker(dag_id="dag_bag_finished", serialized=True, session=session):
+        EmptyOperator(task_id="empty")
+    finished_dr = dag_maker.create_dagrun(state=DagRunState.SUCCESS, session=session)
+    session.flush()
+
+    dag_bag = SchedulerDagBag(max_size=0, max_bytes=0)
+    dag_bag.get_dag(running_dr, session=session)
+    dag_bag.get_dag(finished_dr, session=session)
+    assert len(dag_bag) == 2
+
+    assert dag_bag.evict_unreferenced(session=session) == 1
+    assert [dag.dag_id for dag in dag_bag._dags.values()] == ["dag_bag_running"]
@@ -21,6 +21,7 @@ import asyncio
 import datetime
 import os
 import selectors
+import signal
 import time
 from collections.abc import AsyncIterator
 from socket import socket
@@ -36,6 +37,7 @@ from airflow._shared.timezones import timezone
 from airflow.executors import workloads
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import (
+    NewTriggerListener,
     TriggerCommsDecoder,
     TriggererJobRunner,
     TriggerRunner,
@@ -161,6 +163,14 @@ def test_capacity_decode():
             TriggererJobRunner(job=job, capacity=input_str)
 
 
+def test_runner_processes_decode():
+    assert TriggererJobRunner(Job(), runner_processes=3).runner_processes == 3
+    assert TriggererJobRunner(Job()).runner_processes == 1
+    for invalid in (0, -1, 1.5, "2"):
+        with pytest.raises(ValueError, match="Number of runner processes"):
+            TriggererJobRunner(Job(), runner_processes=invalid)
+
+
 @pytest.fixture
 def supervisor_builder(mocker, session):
     def builder(job=None):
@@ -197,6 +207,124 @@ def supervisor_builder(mocker, session):
     return builder
 
 
+def test_update_triggers_spreads_triggers_across_shards(session, supervisor_builder):
+    triggers = [Trigger(classpath="fake.classpath", kwargs={}) for _ in range(8)]
+    session.add_all(triggers)
+    session.flush()
+    trigger_ids = {trigger.id for trigger in triggers}
+
+    supervisor = supervisor_builder()
+    secondary = supervisor_builder(supervisor.job)
+    supervisor.secondary_shards.append(secondary)
+    supervisor.capacity = 8
+
+    supervisor.update_triggers(trigger_ids)
+
+    primary_ids = {t.id for t in supervisor.creating_triggers}
+    secondary_ids = {t.id for t in secondary.creating_triggers}
+    assert primary_ids | secondary_ids == trigger_ids
+    assert not primary_ids & secondary_ids
+    # Each shard is bounded by its share of the capacity
+    assert len(primary_ids) == len(secondary_ids) == 4
+
+    # Known triggers are not created again, and triggers no longer requested are cancelled in their shard
+    supervisor.running_triggers.update(primary_ids)
+    supervisor.creating_triggers.clear()
+    secondary.running_triggers.update(secondary_ids)
+    secondary.creating_triggers.clear()
+    removed_id = next(iter(secondary_ids))
+
+    supervisor.update_triggers(trigger_ids - {removed_id})
+
+    assert not supervisor.creating_triggers
+    assert not secondary.creating_triggers
+    assert supervisor.cancelling_triggers == set()
+    assert secondary.cancelling_triggers == {removed_id}
+
+
+def test_exit_code_of_dead_secondary_shard(supervisor_builder):
+    import psutil
+
+    supervisor = supervisor_builder()
+    secondary = supervisor_builder(supervisor.job)
+    supervisor.secondary_shards.append(secondary)
+    supervisor._process.wait.side_effect = psutil.TimeoutExpired(0)
+    assert supervisor.exit_code is None
+
+    secondary._process.wait.return_value = -9
+
+    assert not supervisor.is_alive()
+    assert supervisor.exit_code == -9
+
+
+def test_exit_code_of_secondary_shard_exiting_cleanly_is_failure(supervisor_builder):
+    supervisor = supervisor_builder()
+    secondary = supervisor_builder(supervisor.job)
+    supervisor.secondary_shards.append(secondary)
+    secondary._process.wait.return_value = 0
+
+    assert not supervisor.is_alive()
+    assert supervisor.exit_code == 1
+
+
+def test_shard_assignment_is_stable(supervisor_builder):
+    supervisor = supervisor_builder()
+    supervisor.secondary_shards.extend([supervisor_builder(supervisor.job) for _ in range(2)])
+    supervisor.capacity = 300
+
+    assignments = {
+        trigger_id: supervisor._shard_index_for(trigger_id, [0, 0, 0]) for trigger_id in range(300)
+    }
+
+    assert set(assignments.values()) == {0, 1, 2}
+    # A shard at capacity overflows to the next shard on the ring, without moving any other trigger
+    full_shard = assignments[0]
+    loads = [0, 0, 0]
+    loads[full_shard] = supervisor.shard_capacity
+    for trigger_id, shard_index in assignments.items():
+        new_index = supervisor._shard_index_for(trigger_id, loads)
+        if shard_index == full_shard:
+            assert new_index != full_shard
+        else:
+            assert new_index == shard_index
+
+
+def test_trigger_load_due(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+
+    assert supervisor.trigger_load_due()
+    assert not supervisor.trigger_load_due(), "Triggers are polled at most every trigger_poll_interval"
+
+    listener = mocker.Mock(spec=NewTriggerListener, closed=False)
+    listener.consume.return_value = True
+    supervisor.new_trigger_listener = listener
+    assert supervisor.trigger_load_due(), "Announced triggers are loaded straight away"
+
+    listener.consume.return_value = False
+    assert not supervisor.trigger_load_due()
+
+
+def test_update_triggers_wakes_up_runner(session, supervisor_builder):
+    first, second = (
+        Trigger(classpath="fake.classpath", kwargs={}),
+        Trigger(classpath="fake.classpath", kwargs={}),
+    )
+    session.add_all([first, second])
+    session.flush()
+
+    supervisor = supervisor_builder()
+    supervisor.update_triggers({first.id})
+    # The runner can't be signalled before it has reported in, as it has no signal handler until then
+    supervisor.process.send_signal.assert_not_called()
+
+    supervisor._handle_request(messages.TriggerStateChanges(events=None), req_id=1, log=MagicMock())
+    supervisor.update_triggers({first.id})
+    supervisor.process.send_signal.assert_not_called()
+
+    supervisor.update_triggers({first.id, second.id})
+    supervisor.process.send_signal.assert_called_once_with(signal.SIGUSR2)
+
+
 def test_trigger_lifecycle(spy_agency: SpyAgency, session):
     """
     Checks that the triggerer will correctly see a new Trigger in the database
@@ -386,6 +514,31 @@ class TestTriggerRunner:
         trigger_instance.cancel()
         await runner.cleanup_finished_triggers()
 
+    @pytest.mark.asyncio
+    async def test_fired_trigger_wakes_up_runner(self, session):
+        trigger_orm = Trigger.from_object(SuccessTrigger())
+        session.add(trigger_orm)
+        session.commit()
+
+        runner = TriggerRunner()
+        runner.to_create.append(
+            workloads.RunTrigger.model_construct(
+                id=trigger_orm.id,
+                ti=None,
+                classpath=trigger_orm.classpath,
+                encrypted_kwargs=trigger_orm.encrypted_kwargs,
+            )
+        )
+        await runner.create_triggers()
+        assert not runner.wakeup.is_set()
+
+        # Well before the runner would sync on its own
+        await asyncio.wait_for(runner.wakeup.wait(), timeout=runner.sync_interval / 2)
+        assert [trigger_id for trigger_id, _ in runner.events] == [trigger_orm.id]
+
+        await runner.triggers[trigger_orm.id]["task"]
+        assert await runner.cleanup_finished_triggers() == [trigger_orm.id]
+
 
 @pytest.mark.asyncio
 async def test_trigger_create_race_condition_38599(session, supervisor_builder):
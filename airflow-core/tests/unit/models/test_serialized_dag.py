@@ -30,7 +30,7 @@ from airflow.models.asset import AssetActive, AssetAliasModel, AssetModel
 from airflow.models.dag import DAG as SchedulerDAG, DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbag import DagBag
-from airflow.models.serialized_dag import SerializedDagModel as SDM
+from airflow.models.serialized_dag import SerializedDagModel as SDM, _DeserializedDagCache
 from airflow.providers.standard.operators.bash import BashOperator
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
@@ -190,6 +190,29 @@ class TestSerializedDagModel:
             assert serialized_dag.dag_id == dag.dag_id
             assert set(serialized_dag.task_dict) == set(dag.task_dict)
 
+    def test_deserialized_dags_are_cached_by_hash(self, dag_maker, session):
+        with dag_maker("test_deserialized_dags_cache"):
+            EmptyOperator(task_id="task1")
+        with dag_maker("test_deserialized_dags_cache_2"):
+            EmptyOperator(task_id="task1")
+
+        with (
+            mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CACHE_SIZE", 1),
+            mock.patch("airflow.models.serialized_dag._deserialized_dag_cache", _DeserializedDagCache()),
+            mock.patch.object(SerializedDAG, "from_dict", wraps=SerializedDAG.from_dict) as from_dict,
+        ):
+            # Each load from the database gives a new model instance, but the DAG is unchanged.
+            dag = SDM.get("test_deserialized_dags_cache", session=session).dag
+            session.expunge_all()
+            assert SDM.get("test_deserialized_dags_cache", session=session).dag is dag
+            assert from_dict.call_count == 1
+
+            # The second DAG evicts the first one.
+            SDM.get("test_deserialized_dags_cache_2", session=session).dag
+            session.expunge_all()
+            assert SDM.get("test_deserialized_dags_cache", session=session).dag is not dag
+            assert from_dict.call_count == 3
+
     def test_read_all_dags_only_picks_the_latest_serdags(self, session):
         example_dags = self._write_example_dags()
         serialized_dags = SDM.read_all_dags()
@@ -371,6 +394,14 @@ class TestSerializedDagModel:
             sorted_dag = SDM._sort_serialized_dag_dict(dag)
             assert sorted_dag == dag
 
+    def test_hash_matches_fully_sorted_dag(self):
+        """The dag_hash must not change for existing DAGs, or every DAG would get a new version."""
+        for dag in make_example_dags(example_dags_module).values():
+            dag_data = SerializedDAG.to_dict(dag)
+            dag_data["dag"]["tags"] = sorted(dag_data["dag"].get("tags", []), reverse=True)
+            sorted_json = json.dumps(SDM._sort_serialized_dag_dict(dag_data), sort_keys=True)
+            assert SDM.hash(dag_data) == md5(sorted_json.encode("utf-8")).hexdigest()
+
     def test_get_dependencies(self, session):
         self._write_example_dags()
         dag_id = "consumes_asset_decorator"
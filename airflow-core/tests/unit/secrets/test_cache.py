@@ -18,6 +18,9 @@ from __future__ import annotations
 
 import datetime
 import multiprocessing
+import os
+import subprocess
+from unittest import mock
 
 import pytest
 
@@ -71,6 +74,43 @@ class TestSecretCache:
         assert val is not None
         assert val == "secret_val"
 
+    def test_reset_removes_the_store(self):
+        SecretCache.save_variable("key", "secret_val")
+        path = SecretCache._cache.path
+
+        SecretCache.reset()
+
+        assert not os.path.exists(path)
+
+    @conf_vars({("secrets", "use_cache"): "true"})
+    def test_kept_in_memory_without_shared_memory(self):
+        SecretCache.reset()
+        with mock.patch("airflow.sdk.execution_time.cache._shared_memory_dir", return_value=None):
+            SecretCache.init()
+
+        SecretCache.save_variable("key", "secret_val")
+
+        # Never written to disk
+        assert isinstance(SecretCache._cache, dict)
+        assert SecretCache.get_variable("key") == "secret_val"
+
+    @conf_vars({("secrets", "use_cache"): "true"})
+    def test_init_removes_stale_stores(self, tmp_path):
+        SecretCache.reset()
+        exited = subprocess.Popen(["true"])
+        exited.wait()
+        stale = tmp_path / f"airflow-secret-cache-{exited.pid}-abcd1234"
+        running = tmp_path / f"airflow-secret-cache-{os.getpid()}-abcd1234"
+        stale.mkdir()
+        running.mkdir()
+
+        with mock.patch("airflow.sdk.execution_time.cache._shared_memory_dir", return_value=str(tmp_path)):
+            SecretCache.init()
+
+        assert not stale.exists()
+        assert running.exists()
+        assert os.path.dirname(SecretCache._cache.path).startswith(f"{tmp_path}/airflow-secret-cache-")
+
     def test_returns_none_when_not_init(self):
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_variable("whatever")
@@ -244,7 +244,23 @@ class TestSerializers:
             assert serialize(np.float64(3.14)) == (float(np.float64(3.14)), "numpy.float64", 1, True)
         else:
             assert serialize(np.float32(3.14)) == (float(np.float32(3.14)), "numpy.float32", 1, True)
-        assert serialize(np.array([1, 2, 3])) == ("", "", 0, False)
+        assert serialize(np.array([1, "a", None], dtype=object)) == ("", "", 0, False)
+
+    @pytest.mark.parametrize(
+        "array",
+        [
+            np.array([1, 2, 3]),
+            np.arange(12, dtype=np.float32).reshape(3, 4),
+            np.array([[True, False]]),
+            np.array(["a", "bc"]),
+            np.arange(10)[::2],
+        ],
+    )
+    def test_numpy_ndarray(self, array):
+        e = serialize(array)
+        d = deserialize(e)
+        assert d.dtype == array.dtype
+        np.testing.assert_array_equal(d, array)
 
     @pytest.mark.parametrize(
         ("klass", "ver", "value", "msg"),
@@ -273,6 +289,19 @@ class TestSerializers:
         d = deserialize(e)
         assert i.equals(d)
 
+    def test_pandas_deserialize_hex_encoded(self):
+        """DataFrames serialized by version 1 are hex encoded."""
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        from airflow.serialization.serializers.pandas import deserialize
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        buf = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(i), buf)
+
+        assert i.equals(deserialize(pd.DataFrame, 1, buf.getvalue().hex().decode("utf-8")))
+
     def test_pandas_serializers(self):
         from airflow.serialization.serializers.pandas import serialize
 
@@ -281,7 +310,7 @@ class TestSerializers:
     @pytest.mark.parametrize(
         ("klass", "version", "data", "msg"),
         [
-            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 1"),  # version too new
+            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 2"),  # version too new
             (
                 pd.DataFrame,
                 1,
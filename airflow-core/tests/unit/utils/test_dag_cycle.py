@@ -131,6 +131,20 @@ class TestCycleTester:
         with pytest.raises(AirflowDagCycleException):
             assert not check_cycle(dag)
 
+    def test_cycle_wide_fan_out(self):
+        dag = DAG("dag", schedule=None, start_date=DEFAULT_DATE, default_args={"owner": "owner1"})
+
+        # start -> task_0 .. task_9999 -> end -> start
+        # Each downstream task of start is only checked once
+        with dag:
+            start = EmptyOperator(task_id="start")
+            end = EmptyOperator(task_id="end")
+            start >> [EmptyOperator(task_id=f"task_{i}") for i in range(10000)] >> end
+            end >> start
+
+        with pytest.raises(AirflowDagCycleException, match="Faulty task: end"):
+            check_cycle(dag)
+
     def test_cycle_arbitrary_loop(self):
         # test arbitrary loop
         dag = DAG("dag", schedule=None, start_date=DEFAULT_DATE, default_args={"owner": "owner1"})
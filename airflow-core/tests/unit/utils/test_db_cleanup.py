@@ -26,9 +26,10 @@ from uuid import uuid4
 
 import pendulum
 import pytest
-from sqlalchemy import inspect, text
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, inspect, select, text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy.orm import Session
 
 from airflow import DAG
 from airflow._shared.timezones import timezone
@@ -45,6 +46,7 @@ from airflow.utils.db_cleanup import (
     _confirm_drop_archives,
     _dump_table_to_file,
     _get_archived_table_names,
+    _move_rows,
     config_dict,
     drop_archived_tables,
     export_archived_records,
@@ -416,6 +418,134 @@ class TestDBCleanup:
         archived_table_names = _get_archived_table_names(["dag_run"], session)
         assert len(archived_table_names) == 0
 
+    @pytest.mark.parametrize("batch_size", [1, 3, 100])
+    @pytest.mark.parametrize(
+        "table_name, date_add_kwargs, expected_to_delete, run_type",
+        [
+            pytest.param("task_instance", dict(days=6), 6, DagRunType.SCHEDULED, id="middle"),
+            pytest.param(
+                "dag_run", dict(days=9, microseconds=1), 9, DagRunType.SCHEDULED, id="beyond_end_dr"
+            ),
+            pytest.param(
+                "dag_run", dict(days=9, microseconds=1), 10, DagRunType.MANUAL, id="beyond_end_dr_external"
+            ),
+        ],
+    )
+    def test__cleanup_table_in_batches(
+        self, table_name, date_add_kwargs, expected_to_delete, run_type, batch_size
+    ):
+        """
+        Verify that deleting in batches deletes the same rows as deleting at once, and moves them all to a
+        single archive table.
+
+        The last scheduled dag run is kept, although it is older than ``clean_before_timestamp``.
+        """
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        num_tis = 10
+        create_tis(base_date=base_date, num_tis=num_tis, run_type=run_type)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict[table_name].__dict__,
+                clean_before_timestamp=base_date.add(**date_add_kwargs),
+                dry_run=False,
+                session=session,
+                batch_size=batch_size,
+            )
+            model = config_dict[table_name].orm_model
+            assert len(session.query(model).all()) == num_tis - expected_to_delete
+            (archive_table_name,) = _get_archived_table_names([table_name], session)
+            archived = session.execute(text(f"SELECT COUNT(1) FROM {archive_table_name}")).scalar()
+            assert archived == expected_to_delete
+
+    def test__cleanup_table_in_batches_resume(self):
+        """Verify that resuming a cleanup moves the rows to the archive table of the last cleanup."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            for days, resume in ((3, False), (6, True)):
+                _cleanup_table(
+                    **config_dict["task_instance"].__dict__,
+                    clean_before_timestamp=base_date.add(days=days),
+                    dry_run=False,
+                    session=session,
+                    batch_size=2,
+                    resume=resume,
+                )
+            assert len(session.query(TaskInstance).all()) == 4
+            (archive_table_name,) = _get_archived_table_names(["task_instance"], session)
+            archived = session.execute(text(f"SELECT COUNT(1) FROM {archive_table_name}")).scalar()
+            assert archived == 6
+
+    def test__cleanup_table_in_batches_skip_archive(self):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+                batch_size=2,
+                skip_archive=True,
+            )
+            assert len(session.query(TaskInstance).all()) == 5
+            assert _get_archived_table_names(["task_instance"], session) == []
+
+    def test__move_rows_only_deletes_archived_rows(self):
+        """Verify that rows written while a batch is moved are neither archived nor deleted."""
+        engine = create_engine("sqlite://")
+        metadata = MetaData()
+        source_table = Table(
+            "log", metadata, Column("id", Integer, primary_key=True), Column("dttm", Integer)
+        )
+        archive_table = Table("archive_log", metadata, Column("id", Integer), Column("dttm", Integer))
+        metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(source_table.insert(), [{"id": idx, "dttm": idx} for idx in range(5)])
+            execute = session.execute
+            statements = []
+
+            def execute_after_write(statement, *args, **kwargs):
+                if len(statements) == 1:
+                    # A row written after the first statement picked the rows to move
+                    execute(source_table.insert(), {"id": 10, "dttm": 1})
+                statements.append(statement)
+                return execute(statement, *args, **kwargs)
+
+            session.execute = execute_after_write
+            moved = _move_rows(
+                source_table=source_table,
+                archive_table=archive_table,
+                where=[source_table.c.dttm < 3],
+                session=session,
+            )
+            assert moved == 3
+            assert session.scalars(select(source_table.c.id)).all() == [3, 4, 10]
+            assert sorted(session.scalars(select(archive_table.c.id))) == [0, 1, 2]
+
+    def test__cleanup_table_dry_run_batch_estimate(self, capsys):
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["task_instance"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=True,
+                session=session,
+                batch_size=2,
+            )
+            assert len(session.query(TaskInstance).all()) == 10
+        out = capsys.readouterr().out
+        assert "Reading the first batch of 2 rows took" in out
+        assert "Deleting 5 rows takes 3 batches" in out
+
+    @pytest.mark.parametrize("kwargs", [dict(workers=2), dict(resume=True)])
+    @patch("airflow.utils.db_cleanup._cleanup_table")
+    def test_run_cleanup_requires_batch_size(self, cleanup_table_mock, kwargs):
+        with pytest.raises(SystemExit, match="requires a batch size"):
+            run_cleanup(clean_before_timestamp=None, table_names=["log"], confirm=False, **kwargs)
+        cleanup_table_mock.assert_not_called()
+
     def test_no_models_missing(self):
         """
         1. Verify that for all tables in `airflow.models`, we either have them enabled in db cleanup,
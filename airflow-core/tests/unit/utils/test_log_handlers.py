@@ -17,7 +17,6 @@
 # under the License.
 from __future__ import annotations
 
-import heapq
 import io
 import itertools
 import logging
@@ -27,7 +26,6 @@ import re
 from http import HTTPStatus
 from importlib import reload
 from pathlib import Path
-from typing import cast
 from unittest import mock
 from unittest.mock import patch
 
@@ -52,12 +50,10 @@ from airflow.utils.log.file_task_handler import (
     DEFAULT_SORT_DATETIME,
     FileTaskHandler,
     LogType,
-    ParsedLogStream,
     StructuredLogMessage,
-    _add_log_from_parsed_log_streams_to_heap,
     _create_sort_key,
     _fetch_logs_from_service,
-    _flush_logs_out_of_heap,
+    _find_tail_offset,
     _interleave_logs,
     _is_logs_stream_like,
     _is_sort_key_with_default_timestamp,
@@ -74,7 +70,6 @@ from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.file_task_handler import (
     convert_list_to_stream,
     extract_events,
-    mock_parsed_logs_factory,
 )
 from tests_common.test_utils.markers import skip_if_force_lowest_dependencies_marker
 
@@ -469,6 +464,23 @@ class TestFileTaskLogHandler:
         assert extract_events(log_handler_output_stream) == ["the log"]
         assert metadata == {"end_of_log": True, "log_pos": 1}
 
+    @patch("airflow.utils.log.file_task_handler.FileTaskHandler._read_from_local")
+    def test__read_resumes_from_log_pos(self, mock_read_local, create_task_instance):
+        mock_read_local.return_value = (["the messages"], [convert_list_to_stream(["one", "two", "three"])])
+        ti = create_task_instance(
+            dag_id="dag_for_testing_local_log_read",
+            task_id="task_for_testing_local_log_read",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+        )
+        fth = FileTaskHandler("")
+        log_handler_output_stream, metadata = fth._read(ti=ti, try_number=1, metadata={"log_pos": 2})
+        # The position is only moved on as the stream is read
+        assert metadata == {"end_of_log": True, "log_pos": 2}
+        # No source details header when resuming
+        assert extract_events(log_handler_output_stream, False) == ["three"]
+        assert metadata == {"end_of_log": True, "log_pos": 3}
+
     def test__read_from_local(self, tmp_path):
         """Tests the behavior of method _read_from_local"""
         path1 = tmp_path / "hello1.log"
@@ -482,6 +494,30 @@ class TestFileTaskLogHandler:
         assert list(log_streams[0]) == ["file1 content", "file1 content2"]
         assert list(log_streams[1]) == ["file2 content", "file2 content2"]
 
+    def test__read_from_local_tail_lines(self, tmp_path):
+        path = tmp_path / "hello1.log"
+        path.write_text("".join(f"line {i}\n" for i in range(10)))
+        fth = FileTaskHandler("")
+        log_source_info, log_streams = fth._read_from_local(path, tail_lines=3)
+        assert log_source_info == [str(path)]
+        assert list(log_streams[0]) == ["line 7", "line 8", "line 9"]
+
+    @patch("airflow.utils.log.file_task_handler.FileTaskHandler._read_from_local")
+    def test__read_tail_lines(self, mock_read_local, create_task_instance):
+        mock_read_local.return_value = (["the messages"], [convert_list_to_stream(["one", "two", "three"])])
+        ti = create_task_instance(
+            dag_id="dag_for_testing_local_log_read",
+            task_id="task_for_testing_local_log_read",
+            run_type=DagRunType.SCHEDULED,
+            logical_date=DEFAULT_DATE,
+        )
+        fth = FileTaskHandler("")
+        log_handler_output_stream, metadata = fth._read(ti=ti, try_number=1, metadata={"tail_lines": 2})
+        assert mock_read_local.call_args.kwargs == {"tail_lines": 2}
+        assert extract_events(log_handler_output_stream) == ["two", "three"]
+        # The tail cannot be resumed from, so the log ends there even for running tasks
+        assert metadata == {"end_of_log": True}
+
     @pytest.mark.parametrize(
         "remote_logs, local_logs, served_logs_checked",
         [
@@ -980,151 +1016,6 @@ def test__is_logs_stream_like(log_stream, expected):
     assert _is_logs_stream_like(log_stream) == expected
 
 
-def test__add_log_from_parsed_log_streams_to_heap():
-    """
-    Test cases:
-
-    Timestamp: 26 27 28 29 30 31
-    Source 1:     --
-    Source 2:           -- --
-    Source 3:        -- -- --
-    """
-    heap: list[tuple[int, StructuredLogMessage]] = []
-    input_parsed_log_streams: dict[int, ParsedLogStream] = {
-        0: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 1", pendulum.parse("2022-11-16T00:05:54.270000-08:00"), 1)
-        ),
-        1: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 2", pendulum.parse("2022-11-16T00:05:54.290000-08:00"), 2)
-        ),
-        2: convert_list_to_stream(
-            mock_parsed_logs_factory("Source 3", pendulum.parse("2022-11-16T00:05:54.380000-08:00"), 3)
-        ),
-    }
-
-    # Check that we correctly get the first line of each non-empty log stream
-
-    # First call: should add log records for all log streams
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 3
-    assert len(heap) == 3
-    # Second call: source 1 is empty, should add log records for source 2 and source 3
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 2  # Source 1 should be removed
-    assert len(heap) == 5
-    # Third call: source 1 and source 2 are empty, should add log records for source 3
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 1  # Source 2 should be removed
-    assert len(heap) == 6
-    # Fourth call: source 1, source 2, and source 3 are empty, should not add any log records
-    _add_log_from_parsed_log_streams_to_heap(heap, input_parsed_log_streams)
-    assert len(input_parsed_log_streams) == 0  # Source 3 should be removed
-    assert len(heap) == 6
-    # Fifth call: all sources are empty, should not add any log records
-    assert len(input_parsed_log_streams) == 0  # remains empty
-    assert len(heap) == 6  # no change in heap size
-    # Check heap
-    expected_logs: list[str] = [
-        "Source 1 Event 0",
-        "Source 2 Event 0",
-        "Source 3 Event 0",
-        "Source 2 Event 1",
-        "Source 3 Event 1",
-        "Source 3 Event 2",
-    ]
-    actual_logs: list[str] = []
-    for _ in range(len(heap)):
-        _, log = heapq.heappop(heap)
-        actual_logs.append(log.event)
-    assert actual_logs == expected_logs
-
-
-@pytest.mark.parametrize(
-    "heap_setup, flush_size, last_log, expected_events",
-    [
-        pytest.param(
-            [("msg1", "2023-01-01"), ("msg2", "2023-01-02")],
-            2,
-            None,
-            ["msg1", "msg2"],
-            id="exact_size_flush",
-        ),
-        pytest.param(
-            [
-                ("msg1", "2023-01-01"),
-                ("msg2", "2023-01-02"),
-                ("msg3", "2023-01-03"),
-                ("msg3", "2023-01-03"),
-                ("msg5", "2023-01-05"),
-            ],
-            5,
-            None,
-            ["msg1", "msg2", "msg3", "msg5"],  # msg3 is deduplicated, msg5 has default timestamp
-            id="flush_with_duplicates",
-        ),
-        pytest.param(
-            [("msg1", "2023-01-01"), ("msg1", "2023-01-01"), ("msg2", "2023-01-02")],
-            3,
-            "msg1",
-            ["msg2"],  # The last_log is "msg1", so any duplicates of "msg1" should be skipped
-            id="flush_with_last_log",
-        ),
-        pytest.param(
-            [("msg1", "DEFAULT"), ("msg1", "DEFAULT"), ("msg2", "DEFAULT")],
-            3,
-            "msg1",
-            [
-                "msg1",
-                "msg1",
-                "msg2",
-            ],  # All messages have default timestamp, so they should be flushed even if last_log is "msg1"
-            id="flush_with_default_timestamp_and_last_log",
-        ),
-        pytest.param(
-            [("msg1", "2023-01-01"), ("msg2", "2023-01-02"), ("msg3", "2023-01-03")],
-            2,
-            None,
-            ["msg1", "msg2"],  # Only the first two messages should be flushed
-            id="flush_size_smaller_than_heap",
-        ),
-    ],
-)
-def test__flush_logs_out_of_heap(heap_setup, flush_size, last_log, expected_events):
-    """Test the _flush_logs_out_of_heap function with different scenarios."""
-
-    # Create structured log messages from the test setup
-    heap = []
-    messages = {}
-    for i, (event, timestamp_str) in enumerate(heap_setup):
-        if timestamp_str == "DEFAULT":
-            timestamp = DEFAULT_SORT_DATETIME
-        else:
-            timestamp = pendulum.parse(timestamp_str)
-
-        msg = StructuredLogMessage(event=event, timestamp=timestamp)
-        messages[event] = msg
-        heapq.heappush(heap, (_create_sort_key(msg.timestamp, i), msg))
-
-    # Set last_log if specified in the test case
-    last_log_obj = messages.get(last_log) if last_log is not None else None
-    last_log_container = [last_log_obj]
-
-    # Run the function under test
-    result = list(_flush_logs_out_of_heap(heap, flush_size, last_log_container))
-
-    # Verify the results
-    assert len(result) == len(expected_events)
-    assert len(heap) == (len(heap_setup) - flush_size)
-    for i, expected_event in enumerate(expected_events):
-        assert result[i].event == expected_event, f"result = {result}, expected_event = {expected_events}"
-
-    # verify that the last log is updated correctly
-    last_log_obj = last_log_container[0]
-    assert last_log_obj is not None
-    last_log_obj = cast("StructuredLogMessage", last_log_obj)
-    assert last_log_obj.event == expected_events[-1]
-
-
 def test_interleave_interleaves():
     log_sample1 = [
         "[2022-11-16T00:05:54.278-0800] {taskinstance.py:1258} INFO - Starting attempt 1 of 1",
@@ -1278,6 +1169,51 @@ def test_interleave_logs_correct_dedupe():
     assert sample_without_dupe == "\n".join(logs)
 
 
+def test_interleave_logs_naive_timestamps_are_utc():
+    naive = ["[2023-01-17T20:00:01] naive"]
+    aware = ["[2023-01-17T12:00:00.000-0800] aware", "[2023-01-17T12:00:02.000-0800] aware later"]
+
+    logs = extract_events(_interleave_logs(convert_list_to_stream(naive), convert_list_to_stream(aware)))
+
+    assert logs == [aware[0], naive[0], aware[1]]
+
+
+def test_interleave_logs_streams_lines():
+    read_lines = [0, 0]
+
+    def endless_log(stream_idx: int, start: int):
+        for second in itertools.count(start, 2):
+            read_lines[stream_idx] += 1
+            yield f"[2023-01-17T12:{second // 60 % 60:02}:{second % 60:02}.000-0800] stream {stream_idx}"
+
+    logs = _interleave_logs(endless_log(0, 1), endless_log(1, 0))
+
+    assert [next(logs).event for _ in range(4)] == [
+        "[2023-01-17T12:00:00.000-0800] stream 1",
+        "[2023-01-17T12:00:01.000-0800] stream 0",
+        "[2023-01-17T12:00:02.000-0800] stream 1",
+        "[2023-01-17T12:00:03.000-0800] stream 0",
+    ]
+    # The streams are read no further than one record ahead of what was yielded
+    assert all(count <= 3 for count in read_lines)
+
+
+@pytest.mark.parametrize(
+    "content, num_lines, expected",
+    [
+        pytest.param(b"", 2, 0, id="empty"),
+        pytest.param(b"a\nb\nc\n", 2, 2, id="trailing-newline"),
+        pytest.param(b"a\nb\nc", 2, 2, id="no-trailing-newline"),
+        pytest.param(b"a\nb\nc\n", 3, 0, id="exactly-all-lines"),
+        pytest.param(b"a\nb\nc\n", 5, 0, id="fewer-lines"),
+        pytest.param(b"a" * 100 + b"\n" + b"b" * 100 + b"\n", 1, 101, id="across-chunks"),
+    ],
+)
+def test__find_tail_offset(content, num_lines, expected):
+    with mock.patch("airflow.utils.log.file_task_handler.TAIL_CHUNK_SIZE", 16):
+        assert _find_tail_offset(io.BytesIO(content), num_lines) == expected
+
+
 def test_permissions_for_new_directories(tmp_path):
     # Set umask to 0o027: owner rwx, group rx-w, other -rwx
     old_umask = os.umask(0o027)
@@ -1340,3 +1276,62 @@ def test_fetch_logs_from_service_with_cidr_no_proxy(mock_send, monkeypatch):
     proxies = kwargs["proxies"]
     assert "http" not in proxies.keys()
     assert "no" not in proxies.keys()
+
+
+def _serve_log_with_ranges(log: bytes):
+    """Answer requests for a log the way the log server does, rejecting suffix ranges longer than the log."""
+
+    def send(request, **kwargs):
+        response = Response()
+        if "Range" not in request.headers:
+            response.status_code = HTTPStatus.OK
+            response._content = log
+            return response
+        tail_bytes = int(request.headers["Range"].removeprefix("bytes=-"))
+        if tail_bytes > len(log):
+            response.status_code = HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            response._content = b""
+            return response
+        start = len(log) - tail_bytes
+        response.status_code = HTTPStatus.PARTIAL_CONTENT
+        response.headers["Content-Range"] = f"bytes {start}-{len(log) - 1}/{len(log)}"
+        response._content = log[start:]
+        return response
+
+    return send
+
+
+@mock.patch("requests.adapters.HTTPAdapter.send")
+def test_fetch_logs_from_service_tail_lines(mock_send):
+    log = b"".join(b"line %d\n" % i for i in range(100))
+    mock_send.side_effect = _serve_log_with_ranges(log)
+
+    with mock.patch("airflow.utils.log.file_task_handler.TAIL_BYTES_PER_LINE", 2):
+        response = _fetch_logs_from_service(log_url, log_location, tail_lines=10)
+
+    # The range doubles until there are 10 lines left after dropping the first (maybe partial) one
+    assert [call.args[0].headers["Range"] for call in mock_send.call_args_list] == [
+        "bytes=-20",
+        "bytes=-40",
+        "bytes=-80",
+        "bytes=-160",
+    ]
+    assert response.text.splitlines()[-10:] == [f"line {i}" for i in range(90, 100)]
+    assert not response.text.startswith("ine")
+
+
+@mock.patch("requests.adapters.HTTPAdapter.send")
+def test_fetch_logs_from_service_tail_lines_short_log(mock_send):
+    log = b"".join(b"line %d\n" % i for i in range(3))
+    mock_send.side_effect = _serve_log_with_ranges(log)
+
+    with mock.patch("airflow.utils.log.file_task_handler.TAIL_BYTES_PER_LINE", 2):
+        response = _fetch_logs_from_service(log_url, log_location, tail_lines=10)
+
+    # The range gets longer than the log, which is then fetched whole
+    assert [call.args[0].headers.get("Range") for call in mock_send.call_args_list] == [
+        "bytes=-20",
+        None,
+    ]
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == log.decode()
@@ -22,7 +22,7 @@ from datetime import timedelta
 import pendulum
 import pytest
 
-from airflow.exceptions import TaskAlreadyInTaskGroup
+from airflow.exceptions import AirflowDagCycleException, TaskAlreadyInTaskGroup
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.dag import DAG
 from airflow.models.xcom_arg import XComArg
@@ -1299,6 +1299,34 @@ def test_topological_sort2():
     assert topological_list[4] == op3
 
 
+def test_topological_sort_sweeps_in_insertion_order():
+    dag = DAG("dag", schedule=None, start_date=DEFAULT_DATE, default_args={"owner": "owner1"})
+
+    # C -> B -> A, D
+    # Tasks come after every task added before them that is sorted in the same sweep through the tasks
+    with dag:
+        op1 = EmptyOperator(task_id="D")
+        op2 = EmptyOperator(task_id="A")
+        op3 = EmptyOperator(task_id="B")
+        op4 = EmptyOperator(task_id="C")
+        op4 >> op3 >> op2
+
+    assert dag.task_group.topological_sort() == [op1, op4, op3, op2]
+
+
+def test_topological_sort_cycle():
+    dag = DAG("dag", schedule=None, start_date=DEFAULT_DATE, default_args={"owner": "owner1"})
+
+    with dag:
+        with TaskGroup("group") as group:
+            EmptyOperator(task_id="A")
+        op1 = EmptyOperator(task_id="B")
+        group >> op1 >> group
+
+    with pytest.raises(AirflowDagCycleException, match="A cyclic dependency occurred in dag: dag"):
+        dag.task_group.topological_sort()
+
+
 def test_topological_nested_groups():
     logical_date = pendulum.parse("20200101")
     with DAG("test_dag_edges", schedule=None, start_date=logical_date) as dag:
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import rich_click as click
+
+DEFAULT_COMMANDS = ["--help", "providers list", "tasks run --help"]
+
+
+def time_command(args, env, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "airflow", *args],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+@click.command()
+@click.option("--command", "commands", default=DEFAULT_COMMANDS, multiple=True, help="airflow CLI arguments")
+@click.option("--repeat", default=5, help="Number of runs of each command, the median is reported")
+def main(commands, repeat):
+    """Compare the start-up time of airflow CLI commands with and without the providers discovery cache."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "providers_discovery_cache.json")
+        without_cache = {**os.environ, "AIRFLOW__CORE__PROVIDERS_DISCOVERY_CACHE_PATH": ""}
+        with_cache = {**os.environ, "AIRFLOW__CORE__PROVIDERS_DISCOVERY_CACHE_PATH": cache_path}
+        # Fill the cache, including the classes checked by "providers list"
+        subprocess.run([sys.executable, "-m", "airflow", "providers", "list"], env=with_cache, check=True)
+        for command in commands:
+            args = shlex.split(command)
+            uncached = time_command(args, without_cache, repeat)
+            cached = time_command(args, with_cache, repeat)
+            print(
+                f"airflow {command:<20}: {uncached * 1000:8.1f} ms without cache, "
+                f"{cached * 1000:8.1f} ms with cache"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+
+# Options read in the scheduler loop, by the executors and by SecretCache
+OPTIONS = [
+    ("scheduler", "use_job_schedule", "getboolean"),
+    ("scheduler", "max_tis_per_query", "getint"),
+    ("scheduler", "scheduler_heartbeat_sec", "getfloat"),
+    ("core", "parallelism", "getint"),
+    ("core", "executor", "get"),
+    ("secrets", "use_cache", "getboolean"),
+    ("secrets", "cache_ttl_seconds", "getint"),
+    ("database", "sql_alchemy_conn", "get"),
+]
+
+
+def time_lookups(conf, num_calls):
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        for section, key, method in OPTIONS:
+            getattr(conf, method)(section, key)
+    return (time.perf_counter() - start) / (num_calls * len(OPTIONS))
+
+
+@click.command()
+@click.option("--num-calls", default=10000, help="Number of times each option is read")
+def main(num_calls):
+    """Compare the per-call cost of reading config options with and without the value cache."""
+    from airflow.configuration import conf
+
+    conf.disable_value_cache()
+    uncached = time_lookups(conf, num_calls)
+    conf.enable_value_cache()
+    cached = time_lookups(conf, num_calls)
+    conf.disable_value_cache()
+    print(f"uncached: {uncached * 1e6:8.2f} us per call")
+    print(f"cached:   {cached * 1e6:8.2f} us per call ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import itertools
+import time
+
+import rich_click as click
+
+SHAPES = ("fan-out", "chain", "layers")
+
+
+def make_dag(shape: str, size: int):
+    """Generate a DAG of about ``size`` tasks, in task groups of 100 tasks."""
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG, TaskGroup
+
+    with DAG(f"{shape}_{size}", schedule=None) as dag:
+        groups = [TaskGroup(f"group_{idx}") for idx in range(max(1, size // 100))]
+        # Added in reverse, so that tasks come before their upstream tasks in the DAG
+        tasks = [
+            EmptyOperator(task_id=f"task_{idx}", task_group=groups[idx % len(groups)])
+            for idx in reversed(range(size))
+        ][::-1]
+        if shape == "fan-out":
+            # One task with all the others downstream of it, which all have one last task downstream
+            tasks[0] >> tasks[1:-1] >> tasks[-1]
+        elif shape == "chain":
+            for upstream, downstream in itertools.pairwise(tasks):
+                upstream >> downstream
+        else:
+            # Layers of 100 tasks, each depending on 3 tasks of the layer before
+            for idx in range(100, size):
+                layer_start = (idx // 100 - 1) * 100
+                for offset in (0, 37, 71):
+                    tasks[layer_start + (idx + offset) % 100] >> tasks[idx]
+    return dag
+
+
+def time_validation(dag) -> tuple[float, float]:
+    from airflow.sdk.definitions.taskgroup import TaskGroup
+    from airflow.utils.dag_cycle_tester import check_cycle
+
+    start = time.perf_counter()
+    check_cycle(dag)
+    cycle = time.perf_counter() - start
+
+    def nested_topo(group):
+        for node in group.topological_sort():
+            if isinstance(node, TaskGroup):
+                yield from nested_topo(node)
+
+    start = time.perf_counter()
+    for _ in nested_topo(dag.task_group):
+        pass
+    topo = time.perf_counter() - start
+    return cycle, topo
+
+
+@click.command()
+@click.option(
+    "--sizes", default="10000,20000,50000,100000", help="Comma separated numbers of tasks in the DAGs"
+)
+@click.option("--shapes", default=",".join(SHAPES), help=f"Comma separated shapes of DAGs, from {SHAPES}")
+def main(sizes, shapes):
+    """Time cycle detection and topological sorting of synthetic DAGs with many tasks."""
+    print(f"{'shape':<10}{'tasks':>10}{'check_cycle':>14}{'topological':>14}")
+    for shape in shapes.split(","):
+        for size in map(int, sizes.split(",")):
+            cycle, topo = time_validation(make_dag(shape, size))
+            print(f"{shape:<10}{size:>10}{cycle:>12.3f} s{topo:>12.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import time
+
+import rich_click as click
+
+
+def fill_log_table(engine, rows: int) -> datetime.datetime:
+    """Create a ``log`` table with one row a minute, and return the timestamp in the middle of them."""
+    from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+
+    metadata = MetaData()
+    log = Table(
+        "log",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("dttm", DateTime, index=True),
+        Column("dag_id", String(250)),
+        Column("event", String(60)),
+        Column("extra", String(500)),
+    )
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    start = datetime.datetime(2020, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, 10_000):
+            conn.execute(
+                log.insert(),
+                [
+                    {
+                        "id": idx + 1,
+                        "dttm": start + datetime.timedelta(minutes=idx),
+                        "dag_id": f"dag_{idx % 100}",
+                        "event": "cli_task_run",
+                        "extra": "x" * 200,
+                    }
+                    for idx in range(offset, min(offset + 10_000, rows))
+                ],
+            )
+    return (start + datetime.timedelta(minutes=rows // 2)).replace(tzinfo=datetime.timezone.utc)
+
+
+@click.command()
+@click.option(
+    "--sql-alchemy-conn",
+    default=None,
+    help="Database to create the log table in, a temporary SQLite database by default. Never the metadata DB!",
+)
+@click.option("--rows", default=200_000, help="Number of rows in the log table, half of which are cleaned up")
+@click.option("--batch-sizes", default="1000,5000,20000", help="Comma separated batch sizes to clean up with")
+@click.option("--workers", default=1, help="Number of workers to clean up with, not used with SQLite")
+def main(sql_alchemy_conn, rows, batch_sizes, workers):
+    """Time cleaning up half of a synthetic log table a batch at a time, as ``airflow db clean`` does."""
+    from sqlalchemy import create_engine, inspect, text
+    from sqlalchemy.orm import Session
+
+    from airflow.utils import db_cleanup
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(sql_alchemy_conn or f"sqlite:///{os.path.join(tmp_dir, 'cleanup.db')}")
+        print(f"{'batch size':>12}{'seconds':>10}{'rows/s':>10}{'archive tables':>16}")
+        for batch_size in map(int, batch_sizes.split(",")):
+            clean_before_timestamp = fill_log_table(engine, rows)
+            with Session(engine) as session, contextlib.redirect_stdout(io.StringIO()):
+                for name in inspect(engine).get_table_names():
+                    if name.startswith(db_cleanup.ARCHIVE_TABLE_PREFIX):
+                        session.execute(text(f"DROP TABLE {name}"))
+                start = time.perf_counter()
+                db_cleanup._cleanup_table(
+                    **db_cleanup.config_dict["log"].__dict__,
+                    clean_before_timestamp=clean_before_timestamp,
+                    dry_run=False,
+                    session=session,
+                    batch_size=batch_size,
+                    workers=workers,
+                )
+                elapsed = time.perf_counter() - start
+            archives = [
+                name
+                for name in inspect(engine).get_table_names()
+                if name.startswith(db_cleanup.ARCHIVE_TABLE_PREFIX)
+            ]
+            print(f"{batch_size:>12}{elapsed:>10.2f}{rows // 2 / elapsed:>10.0f}{len(archives):>16}")
+
+
+if __name__ == "__main__":
+    main()
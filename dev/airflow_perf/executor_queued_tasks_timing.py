@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+import rich_click as click
+
+
+def make_workloads(num_tasks, num_priorities):
+    rng = random.Random(0)
+    return {
+        f"task_{i}": SimpleNamespace(ti=SimpleNamespace(priority_weight=rng.randrange(num_priorities)))
+        for i in range(num_tasks)
+    }
+
+
+def legacy_trigger(queued_tasks, open_slots):
+    """The previous ``trigger_tasks`` ordering: sort every queued task, then ``pop(0)`` for each open slot."""
+    sorted_queue = sorted(queued_tasks.items(), key=lambda x: x[1].ti.priority_weight, reverse=True)
+    triggered = []
+    for _ in range(min(open_slots, len(queued_tasks))):
+        key, _ = sorted_queue.pop(0)
+        triggered.append(key)
+    for key in triggered:
+        del queued_tasks[key]
+    return triggered
+
+
+def heap_trigger(queued_tasks, open_slots):
+    """The ``QueuedTasks`` ordering: only read the top of the heap."""
+    triggered = [key for key, _ in queued_tasks.items_by_priority(min(open_slots, len(queued_tasks)))]
+    for key in triggered:
+        del queued_tasks[key]
+    return triggered
+
+
+def time_heartbeats(queued_tasks, trigger, open_slots, refill):
+    """Run heartbeats until the queue is empty, queueing ``refill`` new tasks on every heartbeat."""
+    workloads = list(queued_tasks.values())
+    new_tasks = 0
+    heartbeats = 0
+    start = time.perf_counter()
+    while queued_tasks:
+        trigger(queued_tasks, open_slots)
+        for workload in workloads[new_tasks : new_tasks + refill]:
+            queued_tasks[f"new_{new_tasks}"] = workload
+            new_tasks += 1
+        heartbeats += 1
+    return (time.perf_counter() - start) / heartbeats
+
+
+@click.command()
+@click.option("--num-tasks", default=20000, help="Number of tasks queued in the executor")
+@click.option("--open-slots", default=32, help="Number of tasks triggered per heartbeat")
+@click.option(
+    "--refill", default=16, help="Number of tasks queued per heartbeat, until --num-tasks are added"
+)
+@click.option("--num-priorities", default=10, help="Number of distinct priority weights")
+@click.option("--repeat", default=3, help="Number of times to measure each implementation")
+def main(num_tasks, open_slots, refill, num_priorities, repeat):
+    """Compare the time per heartbeat that ``BaseExecutor.trigger_tasks`` spends ordering queued tasks."""
+    from airflow.executors.base_executor import QueuedTasks
+
+    workloads = make_workloads(num_tasks, num_priorities)
+    expected = legacy_trigger(dict(workloads), num_tasks)
+    if heap_trigger(QueuedTasks(workloads), num_tasks) != expected:
+        raise SystemExit("QueuedTasks order differs from the sorted order")
+
+    for name, make_queue, trigger in (
+        ("sort + pop(0)", dict, legacy_trigger),
+        ("QueuedTasks", QueuedTasks, heap_trigger),
+    ):
+        durations = [
+            time_heartbeats(make_queue(workloads), trigger, open_slots, refill) for _ in range(repeat)
+        ]
+        print(f"{name:>13}: {statistics.mean(durations) * 1000:8.3f} ms per heartbeat")
+
+
+if __name__ == "__main__":
+    main()
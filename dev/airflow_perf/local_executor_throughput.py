@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import ctypes
+import multiprocessing
+import statistics
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+import rich_click as click
+
+
+def make_workloads(num_tasks):
+    from uuid6 import uuid7
+
+    from airflow.executors import workloads
+
+    return [
+        workloads.ExecuteTask(
+            token="x" * 200,
+            ti=workloads.TaskInstance(
+                id=uuid7(),
+                dag_version_id=uuid7(),
+                task_id=f"task_{i}",
+                dag_id="perf_local_executor",
+                run_id="perf",
+                try_number=1,
+                state="queued",
+                pool_slots=1,
+                queue="default",
+                priority_weight=1,
+                map_index=-1,
+                start_date=datetime.now(tz=timezone.utc),
+            ),
+            dag_rel_path="perf_local_executor.py",
+            log_path="perf_local_executor/task.log",
+            bundle_info=dict(name="perf", version=None),
+        )
+        for i in range(num_tasks)
+    ]
+
+
+def _legacy_worker(input, output, unread_messages):
+    """The worker loop of the ``SimpleQueue`` based LocalExecutor, without running the workload."""
+    from airflow.utils.state import TaskInstanceState
+
+    while True:
+        workload = input.get()
+        if workload is None:
+            return
+        with unread_messages:
+            unread_messages.value -= 1
+        output.put((workload.ti.key, TaskInstanceState.SUCCESS, None))
+
+
+def time_legacy_transport(workloads, parallelism):
+    """Send ``workloads`` through the previous transport: one shared queue each way and a locked counter."""
+    activity_queue = multiprocessing.SimpleQueue()
+    result_queue = multiprocessing.SimpleQueue()
+    unread_messages = multiprocessing.Value(ctypes.c_uint)
+    workers = [
+        multiprocessing.Process(target=_legacy_worker, args=(activity_queue, result_queue, unread_messages))
+        for _ in range(parallelism)
+    ]
+    for worker in workers:
+        worker.start()
+
+    start = time.perf_counter()
+    num_results = 0
+    for workload in workloads:
+        activity_queue.put(workload)
+        with unread_messages:
+            unread_messages.value += 1
+        # Like LocalExecutor.sync, read the results as they come in
+        while not result_queue.empty():
+            result_queue.get()
+            num_results += 1
+    for _ in range(num_results, len(workloads)):
+        result_queue.get()
+    duration = time.perf_counter() - start
+
+    for _ in workers:
+        activity_queue.put(None)
+    for worker in workers:
+        worker.join()
+    return duration
+
+
+def time_local_executor(workloads, parallelism):
+    """Run ``workloads`` through ``LocalExecutor``, with workers that do not actually run the tasks."""
+    from airflow.executors.local_executor import LocalExecutor
+
+    executor = LocalExecutor(parallelism=parallelism)
+    with mock.patch("airflow.executors.local_executor._execute_work"):
+        executor.start()
+        # Start the workers up front, like the workers of the legacy transport
+        for _ in range(parallelism):
+            executor._spawn_worker()
+
+        start = time.perf_counter()
+        for workload in workloads:
+            executor.queue_workload(workload, session=None)
+            executor._read_results()
+        while len(executor.event_buffer) < len(workloads):
+            executor._read_results(timeout=1.0)
+            executor._send_pending_workloads()
+        duration = time.perf_counter() - start
+
+        executor.end()
+    return duration
+
+
+@click.command()
+@click.option("--num-tasks", default=20000, help="Number of workloads to send through each transport")
+@click.option(
+    "--parallelism", "parallelism_list", default=[8, 64], multiple=True, help="Number of worker processes"
+)
+@click.option("--repeat", default=3, help="Number of times to measure each transport")
+def main(num_tasks, parallelism_list, repeat):
+    """
+    Compare the workload/result transport of ``LocalExecutor`` with the previous ``SimpleQueue`` transport.
+
+    The workers do not run the tasks, so this only measures how many workloads per second can be sent to the
+    workers and how many results can be read back. Needs the ``fork`` multiprocessing start method.
+    """
+    multiprocessing.set_start_method("fork", force=True)
+    workloads = make_workloads(num_tasks)
+
+    for parallelism in parallelism_list:
+        for name, time_transport in (
+            ("SimpleQueue", time_legacy_transport),
+            ("LocalExecutor", time_local_executor),
+        ):
+            durations = [time_transport(workloads, parallelism) for _ in range(repeat)]
+            print(
+                f"parallelism {parallelism:>3} {name:>13}: "
+                f"{num_tasks / statistics.mean(durations):10.0f} tasks/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import rich_click as click
+
+LINE = "[{}] {{taskinstance.py:1258}} INFO - Some log message from the task, padded to a typical length"
+
+
+def write_log(path: Path, size_mb: int, offset_ms: int) -> None:
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    target = size_mb * 1024 * 1024
+    with path.open("w") as f:
+        i = 0
+        while f.tell() < target:
+            lines = (
+                LINE.format((start + datetime.timedelta(milliseconds=offset_ms + 2 * n)).isoformat())
+                for n in range(i, i + 10000)
+            )
+            f.write("\n".join(lines) + "\n")
+            i += 10000
+
+
+@click.command()
+@click.option("--size-mb", default=1024, help="Total size of the logs to merge, split between the sources")
+@click.option("--sources", default=2, help="Number of log files to interleave")
+def main(size_mb, sources):
+    """Measure time to first line, total time and peak memory of merging task logs from several files."""
+    from airflow.utils.log.file_task_handler import _interleave_logs, _stream_lines_by_chunk
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [Path(tmp_dir, f"{idx}.log") for idx in range(sources)]
+        for idx, path in enumerate(paths):
+            write_log(path, size_mb // sources, offset_ms=idx)
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        stream = _interleave_logs(*(_stream_lines_by_chunk(path.open()) for path in paths))
+        next(stream)
+        first_line = time.perf_counter() - start
+        count = 1 + sum(1 for _ in stream)
+        total = time.perf_counter() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"merged {count} lines from {sources} files of {size_mb // sources} MB")
+    print(f"time to first line: {first_line * 1000:10.1f} ms")
+    print(f"total time:         {total:10.1f} s")
+    print(f"peak RSS growth:    {(rss_after - rss_before) / 1024:10.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
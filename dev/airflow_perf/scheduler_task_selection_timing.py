@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+
+import rich_click as click
+
+BUNDLE_NAME = "perf_task_selection"
+DAG_ID_PREFIX = "perf_task_selection_"
+
+
+def create_workload(num_dags, num_tasks, num_pools, pool_slots, max_active_tasks, saturated_dags, session):
+    """
+    Create ``num_dags`` DAGs with one running DAG run each, all of their tasks in the scheduled state.
+
+    The first ``saturated_dags`` DAGs have the highest priorities but already run ``max_active_tasks``
+    task instances, so the ``loop`` strategy has to query again for each of them before it finds task
+    instances it can queue. Tasks are spread round-robin over ``num_pools`` pools of ``pool_slots`` slots.
+    """
+    from sqlalchemy import update
+
+    from airflow.models.dag import DAG, DagModel
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.pool import Pool
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    session.merge(DagBundleModel(name=BUNDLE_NAME))
+    for pool_index in range(num_pools):
+        session.merge(Pool(pool=f"perf_pool_{pool_index}", slots=pool_slots, include_deferred=False))
+    session.flush()
+
+    logical_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    dags = []
+    for dag_index in range(num_dags):
+        with DAG(
+            f"{DAG_ID_PREFIX}{dag_index}",
+            schedule=None,
+            start_date=logical_date,
+            max_active_tasks=max_active_tasks,
+        ) as dag:
+            for task_index in range(num_tasks):
+                EmptyOperator(
+                    task_id=f"task_{task_index}",
+                    pool=f"perf_pool_{(dag_index + task_index) % num_pools}",
+                    priority_weight=num_dags - dag_index,
+                )
+        dags.append(dag)
+    DAG.bulk_write_to_db(BUNDLE_NAME, None, dags, session=session)
+    session.execute(
+        update(DagModel)
+        .where(DagModel.dag_id.startswith(DAG_ID_PREFIX))
+        .values(is_paused=False)
+        .execution_options(synchronize_session=False)
+    )
+    session.flush()
+
+    for dag_index, dag in enumerate(dags):
+        SerializedDagModel.write_dag(dag, bundle_name=BUNDLE_NAME, session=session)
+        session.flush()
+        serialized_dag = SerializedDagModel.get_dag(dag.dag_id, session=session)
+        dag_run = serialized_dag.create_dagrun(
+            run_id="perf",
+            logical_date=logical_date,
+            data_interval=(logical_date, logical_date),
+            run_after=logical_date,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+        num_running = max_active_tasks if dag_index < saturated_dags else 0
+        for ti_index, ti in enumerate(dag_run.task_instances):
+            ti.state = TaskInstanceState.RUNNING if ti_index < num_running else TaskInstanceState.SCHEDULED
+    session.commit()
+
+
+def delete_workload(session):
+    from sqlalchemy import delete
+
+    from airflow.models.dag import DagModel
+    from airflow.models.dagrun import DagRun
+    from airflow.models.pool import Pool
+
+    for model, column in ((DagRun, DagRun.dag_id), (DagModel, DagModel.dag_id), (Pool, Pool.pool)):
+        prefix = "perf_pool_" if model is Pool else DAG_ID_PREFIX
+        session.execute(
+            delete(model).where(column.startswith(prefix)).execution_options(synchronize_session=False)
+        )
+    session.commit()
+
+
+def time_selection(strategy, max_tis, repeat):
+    """Run the critical section selection ``repeat`` times, rolling back after each run."""
+    from sqlalchemy import event
+
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.settings import engine
+    from airflow.utils.session import create_session
+
+    os.environ["AIRFLOW__SCHEDULER__TASK_SELECTION_STRATEGY"] = strategy
+    job_runner = SchedulerJobRunner(job=Job())
+
+    num_queries = 0
+
+    def count_query(*args, **kwargs):
+        nonlocal num_queries
+        num_queries += 1
+
+    times, queued, queries = [], [], []
+    event.listen(engine, "before_cursor_execute", count_query)
+    try:
+        for _ in range(repeat):
+            num_queries = 0
+            with create_session() as session:
+                start = time.perf_counter()
+                tis = job_runner._executable_task_instances_to_queued(max_tis=max_tis, session=session)
+                times.append(time.perf_counter() - start)
+                session.rollback()
+            queued.append(len(tis))
+            queries.append(num_queries)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_query)
+    return times, queued, queries
+
+
+@click.command()
+@click.option("--num-dags", default=200, help="Number of DAGs, each with one running DAG run")
+@click.option("--num-tasks", default=50, help="Number of scheduled tasks per DAG run")
+@click.option("--num-pools", default=20, help="Number of pools the tasks are spread over")
+@click.option("--pool-slots", default=128, help="Slots of each pool")
+@click.option("--max-active-tasks", default=2, help="max_active_tasks of each DAG")
+@click.option(
+    "--saturated-dags",
+    default=100,
+    help="Number of highest priority DAGs that already run max_active_tasks task instances",
+)
+@click.option("--max-tis", default=32, help="Maximum number of task instances to queue per selection")
+@click.option("--repeat", default=5, help="Number of times to run each strategy")
+def main(num_dags, num_tasks, num_pools, pool_slots, max_active_tasks, saturated_dags, max_tis, repeat):
+    """
+    Compare the ``loop`` and ``window`` scheduler task selection strategies.
+
+    A synthetic set of scheduled task instances is written to the configured metadata database, then
+    ``SchedulerJobRunner._executable_task_instances_to_queued`` is timed with each value of
+    ``[scheduler] task_selection_strategy``. Every selection is rolled back, so all runs see the same
+    workload. The workload is removed at the end.
+
+    Point ``AIRFLOW__DATABASE__SQL_ALCHEMY_CONN`` at the database you want to measure; the numbers are
+    only meaningful on PostgreSQL or MySQL.
+    """
+    os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+
+    from airflow.utils.session import create_session
+
+    with create_session() as session:
+        delete_workload(session)
+        create_workload(num_dags, num_tasks, num_pools, pool_slots, max_active_tasks, saturated_dags, session)
+
+    try:
+        for strategy in ("loop", "window"):
+            times, queued, queries = time_selection(strategy, max_tis, repeat)
+            print(
+                f"{strategy:>6}: {statistics.mean(times):.4f}s"
+                f" (±{statistics.stdev(times) if len(times) > 1 else 0:.4f}s),"
+                f" {statistics.mean(queries):.0f} queries, {queued[-1]} task instances queued"
+            )
+    finally:
+        with create_session() as session:
+            delete_workload(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import tempfile
+import time
+
+import rich_click as click
+
+
+class ManagerStore:
+    """The previous store: a dict served by a multiprocessing.Manager server process."""
+
+    def __init__(self):
+        self.manager = multiprocessing.Manager()
+        self.dict = self.manager.dict()
+
+    def get(self, key):
+        return self.dict.get(key)
+
+    def __setitem__(self, key, value):
+        self.dict[key] = value
+
+    def close(self):
+        self.manager.shutdown()
+
+
+def time_store(create_store, num_keys, num_gets):
+    from airflow.sdk.execution_time.cache import SecretCache
+
+    start = time.perf_counter()
+    store = create_store()
+    init_duration = time.perf_counter() - start
+
+    keys = [f"__v_variable_{i}" for i in range(num_keys)]
+    start = time.perf_counter()
+    for key in keys:
+        store[key] = SecretCache._CacheValue("value")
+    save_duration = (time.perf_counter() - start) / num_keys
+
+    start = time.perf_counter()
+    for i in range(num_gets):
+        store.get(keys[i % num_keys])
+    get_duration = (time.perf_counter() - start) / num_gets
+
+    # Like a DAG file processor forked after SecretCache.init
+    def child(conn):
+        start = time.perf_counter()
+        for i in range(num_gets):
+            store.get(keys[i % num_keys])
+        conn.send((time.perf_counter() - start) / num_gets)
+
+    ctx = multiprocessing.get_context("fork")
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=child, args=(sender,))
+    process.start()
+    child_get_duration = receiver.recv()
+    process.join()
+
+    if isinstance(store, ManagerStore):
+        store.close()
+    else:
+        store.remove()
+    return init_duration, save_duration, get_duration, child_get_duration
+
+
+@click.command()
+@click.option("--num-keys", default=1000, help="Number of Variables saved in the cache")
+@click.option("--num-gets", default=20000, help="Number of cache lookups")
+def main(num_keys, num_gets):
+    """Compare the latencies of the SecretCache store with a multiprocessing.Manager dict."""
+    from airflow.sdk.execution_time.cache import _shared_memory_dir, _SharedCacheStore
+
+    # The values are not secret, so the store may be on disk when there is no shared memory
+    parent = _shared_memory_dir() or tempfile.gettempdir()
+    for name, create_store in (
+        ("Manager dict", ManagerStore),
+        ("_SharedCacheStore", functools.partial(_SharedCacheStore, parent)),
+    ):
+        init_duration, save_duration, get_duration, child_get_duration = time_store(
+            create_store, num_keys, num_gets
+        )
+        print(
+            f"{name:>18}: init {init_duration * 1000:7.1f} ms, save {save_duration * 1e6:7.1f} us, "
+            f"get {get_duration * 1e6:7.1f} us, get in forked process {child_get_duration * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import timeit
+from datetime import datetime
+
+import rich_click as click
+
+
+def make_serialized_dag(num_tasks, fan_out):
+    """Serialize a generated DAG of ``num_tasks`` BashOperators, each with up to ``fan_out`` upstreams."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG
+    from airflow.serialization.serialized_objects import SerializedDAG
+
+    with DAG("perf_dag_hash", schedule=None, start_date=datetime(2025, 1, 1), tags=["b", "a"]) as dag:
+        tasks = [
+            BashOperator(
+                task_id=f"task_{i}",
+                bash_command=f"echo {{{{ ds }}}} {i}",
+                env={"INDEX": str(i), "NAME": f"task_{i}"},
+                retries=i % 3,
+            )
+            for i in range(num_tasks)
+        ]
+        for i, task in enumerate(tasks[1:], start=1):
+            for upstream in tasks[max(0, i - fan_out) : i]:
+                upstream >> task
+    return SerializedDAG.to_dict(dag)
+
+
+def legacy_hash(dag_data):
+    """The ``SerializedDagModel.hash`` implementation before the list-only canonicalization."""
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.settings import json
+    from airflow.utils.hashlib_wrapper import md5
+
+    dag_data = SerializedDagModel._sort_serialized_dag_dict(dag_data)
+    return md5(json.dumps(dag_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@click.command()
+@click.option(
+    "--num-tasks", "num_tasks_list", default=[100, 1000, 3000], multiple=True, help="DAG sizes to hash"
+)
+@click.option("--fan-out", default=3, help="Number of upstream tasks of each task")
+@click.option("--repeat", default=5, help="Number of times to hash each DAG")
+def main(num_tasks_list, fan_out, repeat):
+    """
+    Compare ``SerializedDagModel.hash`` with the previous implementation on generated DAGs.
+
+    Both must produce the same hash, otherwise existing dag versions would be considered changed.
+    """
+    from airflow.models.serialized_dag import SerializedDagModel
+
+    for num_tasks in num_tasks_list:
+        dag_data = make_serialized_dag(num_tasks, fan_out)
+        expected = legacy_hash(dag_data)
+        if SerializedDagModel.hash(dag_data) != expected:
+            raise SystemExit(f"Hash mismatch for a DAG with {num_tasks} tasks!")
+
+        legacy = timeit.repeat(lambda: legacy_hash(dag_data), number=1, repeat=repeat)
+        current = timeit.repeat(lambda: SerializedDagModel.hash(dag_data), number=1, repeat=repeat)
+        print(
+            f"{num_tasks:>6} tasks: legacy {statistics.mean(legacy) * 1000:8.2f}ms,"
+            f" current {statistics.mean(current) * 1000:8.2f}ms"
+            f" ({statistics.mean(legacy) / statistics.mean(current):.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+import rich_click as click
+
+DAG_FILE = """
+{imports}
+import time
+
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+# Stands in for expensive top level code, on top of the imports
+time.sleep({parse_time})
+
+with DAG("startup_timing"):
+    BaseOperator(task_id="task")
+"""
+
+
+def time_forked_parse(what, runs: int) -> list[float]:
+    """Time how long a forked process takes to have its task, from the fork to the end of ``parse()``."""
+    import structlog
+
+    from airflow.sdk.execution_time.task_runner import parse
+
+    log = structlog.get_logger()
+    timings = []
+    for _ in range(runs):
+        read_fd, write_fd = os.pipe()
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            parse(what, log)
+            os.write(write_fd, b"x")
+            os._exit(0)
+        os.close(write_fd)
+        os.read(read_fd, 1)
+        timings.append(time.perf_counter() - start)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+    return timings
+
+
+@click.command()
+@click.option("--runs", default=10, help="Number of task processes to start with each strategy")
+@click.option(
+    "--imports",
+    default="",
+    help="Comma separated modules for the DAG file to import, e.g. pandas,airflow.providers.http.hooks.http",
+)
+@click.option("--parse-time", default=0.0, help="Seconds of extra top level code in the DAG file")
+def main(runs, imports, parse_time):
+    """Compare the startup latency of task processes forked from the supervisor and from a DAG zygote."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        imports_code = "\n".join(f"import {module}" for module in imports.split(",") if module)
+        Path(tmp_dir, "startup_timing.py").write_text(
+            textwrap.dedent(DAG_FILE.format(imports=imports_code, parse_time=parse_time))
+        )
+        os.environ["AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST"] = json.dumps(
+            [
+                {
+                    "name": "timing",
+                    "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                    "kwargs": {"path": tmp_dir, "refresh_interval": 1},
+                }
+            ]
+        )
+
+        from uuid6 import uuid7
+
+        from airflow.sdk import timezone
+        from airflow.sdk.api.datamodels._generated import BundleInfo, TaskInstance
+        from airflow.sdk.execution_time.comms import StartupDetails
+        from airflow.sdk.execution_time.task_runner import preload_dag_file
+
+        what = StartupDetails.model_construct(
+            ti=TaskInstance(
+                id=uuid7(),
+                task_id="task",
+                dag_id="startup_timing",
+                run_id="run",
+                try_number=1,
+                dag_version_id=uuid7(),
+            ),
+            dag_rel_path="startup_timing.py",
+            bundle_info=BundleInfo(name="timing", version=None),
+            start_date=timezone.utcnow(),
+        )
+
+        # Forked from the supervisor: every task process parses the DAG file
+        supervisor = time_forked_parse(what, runs)
+
+        # Forked from a zygote: the DAG file is parsed once, before forking
+        start = time.perf_counter()
+        preload_dag_file(what.bundle_info, what.dag_rel_path)
+        preload = time.perf_counter() - start
+        zygote = time_forked_parse(what, runs)
+
+    print(f"{'':<22}{'median':>12}{'p95':>12}")
+    for name, timings in (("forked by supervisor", supervisor), ("forked by zygote", zygote)):
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        print(f"{name:<22}{statistics.median(timings) * 1000:>10.1f}ms{p95 * 1000:>10.1f}ms")
+    print(f"zygote parse, once:   {preload * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
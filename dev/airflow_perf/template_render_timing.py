@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+
+# The template fields of a typical operator: a command, its environment and a few paths
+TEMPLATE_FIELDS = {
+    "bash_command": (
+        "python /opt/jobs/export.py --date {{ ds }} --shard {{ map_index }} "
+        "{% if params.full %}--full{% endif %} --out {{ params.bucket }}/{{ ds_nodash }}/{{ map_index }}"
+    ),
+    "env": {
+        "RUN_ID": "{{ run_id }}",
+        "LOGICAL_DATE": "{{ logical_date | ts }}",
+        "TABLES": "{{ params.tables | join(',') }}",
+    },
+    "append_env": "{{ params.append_env }}",
+    "output_paths": ["{{ params.bucket }}/{{ ds_nodash }}/part-{{ '%05d' % map_index }}.parquet"],
+}
+
+
+def render_mapped(map_indexes: int) -> float:
+    """Render the template fields once per map index, each with the environment of its task instance."""
+    import datetime
+
+    from airflow.sdk import DAG
+    from airflow.sdk.definitions._internal.templater import Templater
+
+    dag = DAG(dag_id="template_render_timing", schedule=None)
+    templater = Templater()
+    templater.template_ext = (".sh", ".bash")
+    logical_date = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    params = {"full": True, "bucket": "s3://bucket", "tables": ["a", "b", "c"], "append_env": False}
+
+    start = time.perf_counter()
+    for map_index in range(map_indexes):
+        context = {
+            "ds": "2025-01-01",
+            "ds_nodash": "20250101",
+            "logical_date": logical_date,
+            "run_id": "scheduled__2025-01-01T00:00:00+00:00",
+            "map_index": map_index,
+            "params": params,
+        }
+        templater.render_template(TEMPLATE_FIELDS, context, templater.get_template_env(dag))
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--map-indexes", default=5000, help="Number of map indexes to render the template fields for")
+def main(map_indexes):
+    """Compare rendering the template fields of a mapped task with and without the compiled template cache."""
+    from airflow.sdk.definitions._internal import templater
+
+    cache = templater._compiled_templates
+    max_size = cache.max_size
+
+    cache.max_size = 0
+    uncached = render_mapped(map_indexes)
+    cache.max_size = max_size or 1024
+    cache.clear()
+    cached = render_mapped(map_indexes)
+
+    print(f"rendered {len(TEMPLATE_FIELDS)} template fields for {map_indexes} map indexes")
+    print(f"without cache: {uncached:8.2f} s ({uncached / map_indexes * 1e6:8.1f} us per map index)")
+    print(f"with cache:    {cached:8.2f} s ({cached / map_indexes * 1e6:8.1f} us per map index)")
+    print(f"compiled templates cached: {len(cache)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import time
+
+import rich_click as click
+
+
+def make_dataframe(num_rows):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "value": rng.random(num_rows),
+            "category": rng.choice(["a", "b", "c", "d"], num_rows),
+            "payload": [f"row-{i}-{rng.integers(1 << 30)}" for i in range(num_rows)],
+        }
+    )
+
+
+def hex_serialize(df):
+    """The version 1 pandas serializer, hex encoding the Parquet data."""
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+
+    buf = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df), buf, compression="snappy")
+    return {
+        "__classname__": "pandas.core.frame.DataFrame",
+        "__version__": 1,
+        "__data__": buf.getvalue().hex().decode("utf-8"),
+    }
+
+
+def time_round_trip(serialize, deserialize, df):
+    """Serialize ``df`` to the JSON stored for an XCom and back, like an XCom push and pull."""
+    start = time.perf_counter()
+    stored = json.dumps(serialize(df))
+    push_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = deserialize(json.loads(stored))
+    pull_duration = time.perf_counter() - start
+    if not result.equals(df):
+        raise SystemExit("DataFrame changed in the round trip")
+    return len(stored), push_duration, pull_duration
+
+
+@click.command()
+@click.option("--num-rows", "num_rows_list", default=[100_000, 1_000_000], multiple=True, help="Rows")
+def main(num_rows_list):
+    """Compare the size and the time to serialize a DataFrame XCom with hex and with base64 encoding."""
+    from airflow.serialization.serde import deserialize, serialize
+
+    for num_rows in num_rows_list:
+        df = make_dataframe(num_rows)
+        for name, serialize_df in (("hex", hex_serialize), ("base64", serialize)):
+            size, push_duration, pull_duration = time_round_trip(serialize_df, deserialize, df)
+            print(
+                f"{num_rows:>9} rows {name:>6}: {size / 2**20:8.1f} MiB, "
+                f"push {push_duration * 1000:8.1f} ms, pull {pull_duration * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,9 @@ from airflow.sdk.api.datamodels._generated import (
     TaskInstanceState,
     TaskStatesResponse,
     TerminalStateNonSuccess,
+    TIBulkHeartbeatItem,
+    TIBulkHeartbeatPayload,
+    TIBulkHeartbeatResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -61,6 +64,9 @@ from airflow.sdk.api.datamodels._generated import (
     ValidationError as RemoteValidationError,
     VariablePostBody,
     VariableResponse,
+    XComBulkPullItem,
+    XComBulkPullRequest,
+    XComBulkPullResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -198,6 +204,12 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def heartbeat_many(self, heartbeats: list[TIBulkHeartbeatItem]) -> TIBulkHeartbeatResponse:
+        """Heartbeat many TaskInstances, each with its own token, in one request."""
+        body = TIBulkHeartbeatPayload(heartbeats=heartbeats)
+        resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIBulkHeartbeatResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -507,6 +519,18 @@ class XComOperations:
         resp = self.client.get(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}/slice", params=params)
         return XComSequenceSliceResponse.model_validate_json(resp.read())
 
+    def get_many(
+        self,
+        dag_id: str,
+        run_id: str,
+        xcoms: list[XComBulkPullItem],
+        include_prior_dates: bool = False,
+    ) -> XComBulkPullResponse:
+        """Get many XCom values of a DAG run from the API server with one request."""
+        body = XComBulkPullRequest(xcoms=xcoms, include_prior_dates=include_prior_dates)
+        resp = self.client.post(f"xcoms/{dag_id}/{run_id}/pull", content=body.model_dump_json())
+        return XComBulkPullResponse.model_validate_json(resp.read())
+
 
 class AssetOperations:
     __slots__ = ("client",)
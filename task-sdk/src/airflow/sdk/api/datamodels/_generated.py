@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2025-08-10"
+API_VERSION: Final[str] = "2025-10-10"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -212,6 +212,31 @@ class PrevSuccessfulDagRunResponse(BaseModel):
     end_date: Annotated[AwareDatetime | None, Field(title="End Date")] = None
 
 
+class TIBulkHeartbeatItem(BaseModel):
+    """
+    Schema for the heartbeat of one TaskInstance in the bulk heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    pid: Annotated[int, Field(title="Pid")]
+    id: Annotated[UUID, Field(title="Id")]
+    token: Annotated[str, Field(title="Token")]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    Outcome of the heartbeat of one TaskInstance, as the TaskInstance heartbeat endpoint would respond.
+    """
+
+    id: Annotated[UUID, Field(title="Id")]
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any] | None, Field(title="Detail")] = None
+    refreshed_token: Annotated[str | None, Field(title="Refreshed Token")] = None
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -391,6 +416,27 @@ class VariableResponse(BaseModel):
     value: Annotated[str | None, Field(title="Value")] = None
 
 
+class XComBulkPullItem(BaseModel):
+    """
+    An XCom requested in a bulk pull.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    task_id: Annotated[str, Field(title="Task Id")]
+    key: Annotated[str, Field(title="Key")]
+    map_index: Annotated[int | None, Field(title="Map Index")] = -1
+
+
+class XComBulkPullResponse(BaseModel):
+    """
+    XCom values of a bulk pull, in the order they were requested.
+    """
+
+    values: Annotated[list[list[JsonValue]], Field(title="Values")]
+
+
 class XComResponse(BaseModel):
     """
     XCom schema for responses with fields that are needed for Runtime.
@@ -541,6 +587,25 @@ class HTTPValidationError(BaseModel):
     detail: Annotated[list[ValidationError] | None, Field(title="Detail")] = None
 
 
+class TIBulkHeartbeatPayload(BaseModel):
+    """
+    Schema for the bulk TaskInstance heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    heartbeats: Annotated[list[TIBulkHeartbeatItem], Field(title="Heartbeats")]
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """
+    Schema for the response of the bulk TaskInstance heartbeat endpoint, in the order of the request.
+    """
+
+    results: Annotated[list[TIBulkHeartbeatResult], Field(title="Results")]
+
+
 class TIRunContext(BaseModel):
     """
     Response schema for TaskInstance run context.
@@ -560,6 +625,18 @@ class TIRunContext(BaseModel):
     should_retry: Annotated[bool | None, Field(title="Should Retry")] = False
 
 
+class XComBulkPullRequest(BaseModel):
+    """
+    Request to pull many XComs of a DAG run at once.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    xcoms: Annotated[list[XComBulkPullItem], Field(title="Xcoms")]
+    include_prior_dates: Annotated[bool | None, Field(title="Include Prior Dates")] = False
+
+
 class TITerminalStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a terminal state except SUCCESS state.
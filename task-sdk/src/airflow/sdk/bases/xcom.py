@@ -17,19 +17,26 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 import structlog
 
 from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceSlice,
     SetXCom,
+    XComBulkResult,
     XComResult,
     XComSequenceSliceResult,
 )
 
+if TYPE_CHECKING:
+    from pydantic import JsonValue
+
+    from airflow.sdk.api.datamodels._generated import XComBulkPullItem
+
 log = structlog.get_logger(logger_name="task")
 
 
@@ -314,6 +321,43 @@ class BaseXCom:
             return None
         return result
 
+    @classmethod
+    def _get_bulk(
+        cls,
+        *,
+        dag_id: str,
+        run_id: str,
+        xcoms: list[XComBulkPullItem],
+        include_prior_dates: bool = False,
+    ) -> list[list[JsonValue]]:
+        """
+        Retrieve the stored values of many XComs of a DAG run with one request.
+
+        The values are returned as stored in the database, without deserializing them.
+
+        :param dag_id: DAG ID to pull XComs from.
+        :param run_id: DAG run ID to pull XComs from.
+        :param xcoms: The XComs to pull. A map index of *None* pulls the XComs of every map index of the task.
+        :param include_prior_dates: If *True*, the latest matching XCom is returned regardless of the run it
+            belongs to. Only applies to XComs pulled with a map index.
+        :return: For each of ``xcoms``, the list of matching stored values.
+        """
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = SUPERVISOR_COMMS.send(
+            msg=GetXComBulk(
+                dag_id=dag_id,
+                run_id=run_id,
+                xcoms=xcoms,
+                include_prior_dates=include_prior_dates,
+            ),
+        )
+
+        if not isinstance(msg, XComBulkResult):
+            raise TypeError(f"Expected XComBulkResult, received: {type(msg)} {msg}")
+
+        return msg.values
+
     @staticmethod
     def serialize_value(
         value: Any,
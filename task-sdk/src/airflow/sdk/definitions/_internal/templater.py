@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import datetime
 import logging
-from collections.abc import Collection, Iterable, Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Hashable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -27,11 +29,14 @@ import jinja2
 import jinja2.nativetypes
 import jinja2.sandbox
 
+from airflow.configuration import conf
 from airflow.sdk import ObjectStoragePath
 from airflow.sdk.definitions._internal.mixins import ResolveMixin
 from airflow.utils.helpers import render_template_as_native, render_template_to_string
 
 if TYPE_CHECKING:
+    from types import CodeType
+
     from airflow.models.operator import Operator
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.definitions.dag import DAG
@@ -57,6 +62,106 @@ class LiteralValue(ResolveMixin):
 log = logging.getLogger(__name__)
 
 
+def _environment_key(env: jinja2.Environment) -> Hashable:
+    """
+    Get a key for everything about a Jinja environment that the code it compiles a template to depends on.
+
+    Environments built separately with the same options, e.g. for every task instance of a DAG, share a key.
+    """
+    return (
+        type(env),
+        env.block_start_string,
+        env.block_end_string,
+        env.variable_start_string,
+        env.variable_end_string,
+        env.comment_start_string,
+        env.comment_end_string,
+        env.line_statement_prefix,
+        env.line_comment_prefix,
+        env.trim_blocks,
+        env.lstrip_blocks,
+        env.newline_sequence,
+        env.keep_trailing_newline,
+        tuple(env.extensions),
+        env.optimized,
+        env.finalize,
+        env.autoescape,
+        env.is_async,
+        # Filters and tests are checked when compiling, and called when folding constants
+        frozenset(env.filters.items()),
+        frozenset(env.tests.items()),
+    )
+
+
+class _CompiledTemplateCache:
+    """A process-wide LRU cache of the code Jinja compiles templates to."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._codes: OrderedDict[Hashable, CodeType] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def compile(
+        self, env: jinja2.Environment, source: str, name: str | None = None, filename: str | None = None
+    ) -> CodeType:
+        if self.max_size <= 0:
+            return env.compile(source, name, filename)
+        key = (_environment_key(env), source, name, filename)
+        try:
+            hash(key)
+        except TypeError:
+            # An option of the environment, e.g. a custom filter, can't be hashed
+            return env.compile(source, name, filename)
+        with self._lock:
+            if (code := self._codes.get(key)) is not None:
+                self._codes.move_to_end(key)
+                return code
+        code = env.compile(source, name, filename)
+        with self._lock:
+            self._codes[key] = code
+            while len(self._codes) > self.max_size:
+                self._codes.popitem(last=False)
+        return code
+
+    def clear(self) -> None:
+        with self._lock:
+            self._codes.clear()
+
+
+_compiled_templates = _CompiledTemplateCache(
+    conf.getint("core", "compiled_template_cache_size", fallback=1024)
+)
+
+
+def template_from_string(env: jinja2.Environment, source: str) -> jinja2.Template:
+    """
+    Get a template from its source, like ``env.from_string(source)``.
+
+    The source is only compiled if no environment configured like this one has compiled it already.
+    """
+    code = _compiled_templates.compile(env, source)
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
+
+def get_template(env: jinja2.Environment, name: str) -> jinja2.Template:
+    """
+    Load a template with the loader of an environment, like ``env.get_template(name)``.
+
+    The source of the template is read every time, but only compiled if no environment configured like this
+    one has compiled the same source already.
+    """
+    loader = env.loader
+    if loader is None or type(loader).load is not jinja2.BaseLoader.load:
+        # Loaders that load templates some other way than from their source
+        return env.get_template(name)
+    source, filename, uptodate = loader.get_source(env, name)
+    code = _compiled_templates.compile(env, source, name, filename)
+    return env.template_class.from_code(env, code, env.make_globals(None), uptodate)
+
+
 class Templater:
     """
     This renders the template fields of object.
@@ -171,9 +276,9 @@ class Templater:
 
         if isinstance(value, str):
             if value.endswith(tuple(self.template_ext)):  # A filepath.
-                template = jinja_env.get_template(value)
+                template = get_template(jinja_env, value)
             else:
-                template = jinja_env.from_string(value)
+                template = template_from_string(jinja_env, value)
             return self._render(template, context)
         if isinstance(value, ObjectStoragePath):
             return self._render_object_storage_path(value, context, jinja_env)
@@ -202,7 +307,9 @@ class Templater:
     ) -> ObjectStoragePath:
         serialized_path = value.serialize()
         path_version = value.__version__
-        serialized_path["path"] = self._render(jinja_env.from_string(serialized_path["path"]), context)
+        serialized_path["path"] = self._render(
+            template_from_string(jinja_env, serialized_path["path"]), context
+        )
         return value.deserialize(data=serialized_path, version=path_version)
 
     def _render_nested_template_fields(
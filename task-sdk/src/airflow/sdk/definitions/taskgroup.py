@@ -24,6 +24,7 @@ import functools
 import operator
 import re
 import weakref
+from collections import deque
 from collections.abc import Callable, Generator, Iterator, Sequence
 from functools import cache
 from operator import methodcaller
@@ -526,50 +527,49 @@ class TaskGroup(DAGNode):
 
         :return: list of tasks in topological order
         """
-        # This uses a modified version of Kahn's Topological Sort algorithm to
-        # not have to pre-compute the "in-degree" of the nodes.
-        graph_unsorted = copy.copy(self.children)
-
-        graph_sorted: list[DAGNode] = []
-
-        # special case
-        if not self.children:
-            return graph_sorted
-
-        # Run until the unsorted graph is empty.
-        while graph_unsorted:
-            # Go through each of the node/edges pairs in the unsorted graph. If a set of edges doesn't contain
-            # any nodes that haven't been resolved, that is, that are still in the unsorted graph, remove the
-            # pair from the unsorted graph, and append it to the sorted graph. Note here that by using
-            # the values() method for iterating, a copy of the unsorted graph is used, allowing us to modify
-            # the unsorted graph as we move through it.
-            #
-            # We also keep a flag for checking that graph is acyclic, which is true if any nodes are resolved
-            # during each pass through the graph. If not, we need to exit as the graph therefore can't be
-            # sorted.
-            acyclic = False
-            for node in list(graph_unsorted.values()):
-                for edge in node.upstream_list:
-                    if edge.node_id in graph_unsorted:
-                        break
-                    # Check for task's group is a child (or grand child) of this TG,
-                    tg = edge.task_group
-                    while tg:
-                        if tg.node_id in graph_unsorted:
-                            break
-                        tg = tg.parent_group
-
-                    if tg:
-                        # We are already going to visit that TG
-                        break
-                else:
-                    acyclic = True
-                    del graph_unsorted[node.node_id]
-                    graph_sorted.append(node)
-
-            if not acyclic:
-                raise AirflowDagCycleException(f"A cyclic dependency occurred in dag: {self.dag_id}")
-
+        # This is Kahn's Topological Sort algorithm. The children are returned in the order of sweeping
+        # through them in insertion order until all are sorted, sorting each child once all its upstream
+        # children are sorted, which is worked out from the sweep each upstream child is sorted in, so it
+        # takes linear time rather than a sweep through all the unsorted children per sweep.
+        children = list(self.children.values())
+        position = {node.node_id: idx for idx, node in enumerate(children)}
+
+        downstream: list[list[int]] = [[] for _ in children]
+        in_degree = [0] * len(children)
+        for idx, node in enumerate(children):
+            upstream = set()
+            for edge in node.upstream_list:
+                up = position.get(edge.node_id)
+                # Check for task's group is a child (or grand child) of this TG,
+                tg = edge.task_group
+                while up is None and tg:
+                    up = position.get(tg.node_id)
+                    tg = tg.parent_group
+                if up is not None:
+                    upstream.add(up)
+            in_degree[idx] = len(upstream)
+            for up in upstream:
+                downstream[up].append(idx)
+
+        sweep = [0] * len(children)
+        ready = deque(idx for idx, degree in enumerate(in_degree) if not degree)
+        sorted_count = 0
+        while ready:
+            up = ready.popleft()
+            sorted_count += 1
+            for idx in downstream[up]:
+                # A child comes in the same sweep as its upstream child if it comes after it, else the next
+                sweep[idx] = max(sweep[idx], sweep[up] if up < idx else sweep[up] + 1)
+                in_degree[idx] -= 1
+                if not in_degree[idx]:
+                    ready.append(idx)
+
+        if sorted_count < len(children):
+            raise AirflowDagCycleException(f"A cyclic dependency occurred in dag: {self.dag_id}")
+
+        graph_sorted: list[DAGNode] = [
+            children[idx] for idx in sorted(range(len(children)), key=lambda idx: (sweep[idx], idx))
+        ]
         return graph_sorted
 
     def iter_mapped_task_groups(self) -> Iterator[MappedTaskGroup]:
@@ -17,27 +17,131 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import datetime
-import multiprocessing
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+import psutil
 
 from airflow.configuration import conf
 from airflow.sdk import timezone
 
+_STORE_DIR_PREFIX = "airflow-secret-cache-"
+
+
+def _shared_memory_dir() -> str | None:
+    """Return a memory backed directory to keep the cache in, if there is one."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        return "/dev/shm"
+    return None
+
+
+def _remove_stale_stores(parent: str) -> None:
+    """Remove the stores of this user left behind by processes that could not clean up, e.g. when killed."""
+    for entry in os.scandir(parent):
+        match = re.fullmatch(rf"{_STORE_DIR_PREFIX}(\d+)-\w+", entry.name)
+        if (
+            match
+            and entry.is_dir(follow_symlinks=False)
+            and entry.stat(follow_symlinks=False).st_uid == os.getuid()
+            and not psutil.pid_exists(int(match[1]))
+        ):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+class _SharedCacheStore:
+    """
+    Key-value store of the secret cache, shared by the process that created it and the processes it forks.
+
+    The entries are kept in a SQLite database in WAL mode, in a directory of ``parent`` only readable by the
+    current user. Each process opens its own connection to it, as SQLite connections must not be used across
+    a fork. The directory is removed when the creating process exits.
+
+    :param parent: The directory to create the store in, which has to be memory backed, as secrets must not
+        be written to disk.
+    """
+
+    def __init__(self, parent: str) -> None:
+        self._dir = tempfile.mkdtemp(prefix=f"{_STORE_DIR_PREFIX}{os.getpid()}-", dir=parent)
+        self.path = os.path.join(self._dir, "cache.db")
+        self._owner_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        with self._lock:
+            self._connection().execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, date REAL NOT NULL)"
+            )
+        atexit.register(self.remove)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            # Never close a connection inherited from the parent process, it would corrupt its state
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Entries do not need to survive a crash
+            conn.execute("PRAGMA synchronous=OFF")
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> SecretCache._CacheValue | None:
+        with self._lock:
+            row = self._connection().execute("SELECT value, date FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return SecretCache._CacheValue(
+            row[0], datetime.datetime.fromtimestamp(row[1], tz=datetime.timezone.utc)
+        )
+
+    def __setitem__(self, key: str, value: SecretCache._CacheValue) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache (key, value, date) VALUES (?, ?, ?)",
+                (key, value.value, value.date.timestamp()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def remove(self) -> None:
+        """Delete the database, if called from the process that created it."""
+        if os.getpid() == self._owner_pid:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class _LocalCacheStore(dict):
+    """
+    Key-value store of the secret cache, for when there is no shared memory to keep a shared one in.
+
+    Processes forked after it is created start with a copy of it, but do not see each other's entries.
+    """
+
+    def delete(self, key: str) -> None:
+        self.pop(key, None)
+
+    def remove(self) -> None:
+        self.clear()
+
 
 class SecretCache:
     """A static class to manage the global secret cache."""
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
+    _cache: _SharedCacheStore | _LocalCacheStore | None = None
     _ttl: datetime.timedelta
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
     class _CacheValue:
-        def __init__(self, value: str | None) -> None:
+        def __init__(self, value: str | None, date: datetime.datetime | None = None) -> None:
             self.value = value
-            self.date = timezone.utcnow()
+            self.date = date or timezone.utcnow()
 
         def is_expired(self, ttl: datetime.timedelta) -> bool:
             return timezone.utcnow() - self.date > ttl
@@ -57,17 +161,21 @@ class SecretCache:
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        if (shared_memory_dir := _shared_memory_dir()) is not None:
+            _remove_stale_stores(shared_memory_dir)
+            # Unlike a multiprocessing.Manager, this does not start a server process, and processes forked
+            # afterwards read and write the store directly
+            cls._cache = _SharedCacheStore(shared_memory_dir)
+        else:
+            cls._cache = _LocalCacheStore()
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
         cls._ttl = datetime.timedelta(seconds=ttl_seconds)
 
     @classmethod
     def reset(cls):
         """Use for test purposes only."""
+        if cls._cache is not None:
+            cls._cache.remove()
         cls._cache = None
 
     @classmethod
@@ -126,5 +234,4 @@ class SecretCache:
     def invalidate_variable(cls, key: str):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
         if cls._cache is not None:
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{key}", None)
+            cls._cache.delete(f"{cls._VARIABLE_PREFIX}{key}")
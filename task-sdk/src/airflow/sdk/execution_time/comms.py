@@ -49,6 +49,7 @@ Execution API server is because:
 from __future__ import annotations
 
 import itertools
+import threading
 from collections.abc import Iterator
 from datetime import datetime
 from functools import cached_property
@@ -87,6 +88,8 @@ from airflow.sdk.api.datamodels._generated import (
     TriggerDAGRunPayload,
     UpdateHITLDetailPayload,
     VariableResponse,
+    XComBulkPullItem,
+    XComBulkPullResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -184,8 +187,16 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
 
     err_decoder: TypeAdapter[ErrorResponse] = attrs.field(factory=lambda: TypeAdapter(ToTask), repr=False)
 
+    # Held from sending a request until its response is read, so that requests can be sent from other
+    # threads, for instance to prefetch XComs
+    _send_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False)
+
     def send(self, msg: SendMsgType) -> ReceiveMsgType | None:
         """Send a request to the parent and block until the response is received."""
+        with self._send_lock:
+            return self._send(msg)
+
+    def _send(self, msg: SendMsgType) -> ReceiveMsgType | None:
         frame = _RequestFrame(id=next(self.id_counter), body=msg.model_dump())
         frame_bytes = frame.as_bytes()
 
@@ -446,6 +457,16 @@ class XComSequenceSliceResult(BaseModel):
         return cls(root=response.root, type="XComSequenceSliceResult")
 
 
+class XComBulkResult(XComBulkPullResponse):
+    """Response to GetXComBulk request."""
+
+    type: Literal["XComBulkResult"] = "XComBulkResult"
+
+    @classmethod
+    def from_response(cls, response: XComBulkPullResponse) -> XComBulkResult:
+        return cls(values=response.values, type="XComBulkResult")
+
+
 class ConnectionResult(ConnectionResponse):
     type: Literal["ConnectionResult"] = "ConnectionResult"
 
@@ -599,6 +620,7 @@ ToTask = Annotated[
     | XComResult
     | XComSequenceIndexResult
     | XComSequenceSliceResult
+    | XComBulkResult
     | InactiveAssetsResult
     | CreateHITLDetailPayload
     | HITLDetailRequestResult
@@ -699,6 +721,16 @@ class GetXComSequenceItem(BaseModel):
     type: Literal["GetXComSequenceItem"] = "GetXComSequenceItem"
 
 
+class GetXComBulk(BaseModel):
+    """Get many XCom values of a DAG run at once."""
+
+    dag_id: str
+    run_id: str
+    xcoms: list[XComBulkPullItem]
+    include_prior_dates: bool = False
+    type: Literal["GetXComBulk"] = "GetXComBulk"
+
+
 class GetXComSequenceSlice(BaseModel):
     key: str
     dag_id: str
@@ -905,6 +937,7 @@ ToSupervisor = Annotated[
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
+    | GetXComBulk
     | PutVariable
     | RescheduleTask
     | RetryTask
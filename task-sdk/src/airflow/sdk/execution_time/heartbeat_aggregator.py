@@ -0,0 +1,293 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Send the heartbeats of all the tasks running on a worker to the API server in batches.
+
+Every running task's supervisor heartbeats its task instance, which is a request and a transaction on the
+metadata DB for each task. A heartbeat aggregator is a long-lived process on the worker, one per API server,
+that the supervisors send their heartbeats to instead. It sends the heartbeats it gets within
+``[workers] heartbeat_aggregator_batch_window`` to the bulk heartbeat endpoint in a single request, and sends
+each supervisor back what the API server said about its task instance.
+
+Supervisors talk to the aggregator over a Unix socket, with one JSON message per line in each direction. Each
+heartbeat carries the token of its task instance, so the aggregator does not have any token of its own.
+
+An aggregator exits once no supervisor has been connected to it for a while.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import selectors
+import socket
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import attrs
+import httpx
+import structlog
+from pydantic import ValidationError
+
+from airflow.configuration import conf
+from airflow.sdk.execution_time.local_server import connect, listen, runtime_dir, start_server
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger
+
+    from airflow.sdk.api.client import Client
+    from airflow.sdk.api.datamodels._generated import TIBulkHeartbeatItem
+
+__all__ = ["HeartbeatAggregator", "HeartbeatAggregatorConnection"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="heartbeat_aggregator")
+
+BATCH_WINDOW: float = conf.getfloat("workers", "heartbeat_aggregator_batch_window")
+
+# How long an aggregator stays around without any supervisor connected to it
+IDLE_TIMEOUT = 60.0
+
+
+def aggregator_socket_path(server: str) -> Path:
+    """
+    Get the path of the socket of the heartbeat aggregator for an API server.
+
+    :raises PermissionError: If the directory of the socket is not private to the current user, as the
+        supervisors send the tokens of their task instances to it.
+    """
+    digest = hashlib.sha256(server.encode()).hexdigest()[:16]
+    return runtime_dir("airflow-heartbeats") / f"{digest}.sock"
+
+
+@attrs.define
+class HeartbeatAggregatorConnection:
+    """
+    The connection of a supervisor to the heartbeat aggregator for its API server.
+
+    Heartbeats are sent without waiting for their result: ``read_reply`` is a handler for the supervisor's
+    selector, and calls ``on_reply`` with the error the heartbeat failed with, if any, and the refreshed token
+    of the task instance, if the API server issued one.
+    """
+
+    sock: socket.socket
+    server: str
+    on_reply: Callable[[Exception | None, str | None], None]
+    waiting: bool = attrs.field(default=False, init=False)
+    _buffer: bytes = attrs.field(default=b"", init=False)
+    _ti_id: UUID | None = attrs.field(default=None, init=False)
+
+    @classmethod
+    def connect(
+        cls, server: str, on_reply: Callable[[Exception | None, str | None], None]
+    ) -> HeartbeatAggregatorConnection | None:
+        """
+        Connect to the heartbeat aggregator for an API server, if it is running.
+
+        If it is not, it is started without waiting for it, as this is on the heartbeat path of the supervisor.
+
+        :return: The connection, or None if the aggregator is not running yet, in which case the heartbeat
+            should be sent directly.
+        """
+        path = aggregator_socket_path(server)
+        try:
+            return cls(connect(path), server, on_reply)
+        except (FileNotFoundError, ConnectionRefusedError):
+            log.info("Starting heartbeat aggregator", server=server)
+            start_server(__name__, server, os.fspath(path))
+            return None
+
+    def send(self, ti_id: UUID, *, pid: int, hostname: str, token: str) -> None:
+        """Send the heartbeat of a task instance, whose result is passed to ``on_reply`` once it is in."""
+        msg = {"id": str(ti_id), "pid": pid, "hostname": hostname, "token": token}
+        self.sock.sendall(json.dumps(msg).encode() + b"\n")
+        self._ti_id = ti_id
+        self.waiting = True
+
+    def read_reply(self, sock: socket.socket) -> bool:
+        """Read the result of the last heartbeat; a handler for the supervisor's selector."""
+        data = sock.recv(4096)
+        if not data:
+            return False
+        self._buffer += data
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            self.waiting = False
+            reply = json.loads(line)
+            self.on_reply(self._reply_error(reply), reply.get("refreshed_token"))
+        return True
+
+    def _reply_error(self, reply: dict[str, Any]) -> Exception | None:
+        from airflow.sdk.api.client import ServerResponseError
+
+        if error := reply.get("error"):
+            return ConnectionError(error)
+        if reply["status_code"] < 300:
+            return None
+        # Raised as if the supervisor had heartbeat directly, so it handles the result the same way
+        response = httpx.Response(
+            reply["status_code"],
+            json={"detail": reply.get("detail")},
+            request=httpx.Request("PUT", f"{self.server.rstrip('/')}/task-instances/{self._ti_id}/heartbeat"),
+        )
+        return ServerResponseError.from_response(response) or ConnectionError(
+            f"Heartbeat failed with status {reply['status_code']}"
+        )
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+@attrs.define(kw_only=True)
+class HeartbeatAggregator:
+    """Batch the heartbeats supervisors send for a single API server."""
+
+    server: str
+    socket_path: Path
+    batch_window: float = BATCH_WINDOW
+    idle_timeout: float = IDLE_TIMEOUT
+
+    _server_sock: socket.socket = attrs.field(init=False)
+    _selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, init=False)
+    _buffers: dict[socket.socket, bytes] = attrs.field(factory=dict, init=False)
+    _pending: list[tuple[socket.socket, TIBulkHeartbeatItem]] = attrs.field(factory=list, init=False)
+    _batch_deadline: float | None = attrs.field(default=None, init=False)
+    _last_connected: float = attrs.field(factory=time.monotonic, init=False)
+    _client: Client | None = attrs.field(default=None, init=False)
+
+    def bind(self) -> bool:
+        """
+        Listen on the socket.
+
+        :return: False if another aggregator is listening on it already.
+        """
+        server_sock = listen(self.socket_path)
+        if server_sock is None:
+            return False
+        self._server_sock = server_sock
+        return True
+
+    def serve(self) -> None:
+        """Send batches of heartbeats until no supervisor has been connected for too long."""
+        self._selector.register(self._server_sock, selectors.EVENT_READ, self._accept)
+        try:
+            while self._buffers or time.monotonic() - self._last_connected < self.idle_timeout:
+                timeout = self.idle_timeout
+                if self._batch_deadline is not None:
+                    timeout = max(0.0, self._batch_deadline - time.monotonic())
+                for key, _ in self._selector.select(timeout=timeout):
+                    key.data(key.fileobj)
+                if self._batch_deadline is not None and time.monotonic() >= self._batch_deadline:
+                    self._flush()
+        finally:
+            with suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            self._server_sock.close()
+
+    def _accept(self, server: socket.socket) -> None:
+        conn, _ = server.accept()
+        self._buffers[conn] = b""
+        self._selector.register(conn, selectors.EVENT_READ, self._on_heartbeat)
+
+    def _on_heartbeat(self, conn: socket.socket) -> None:
+        from airflow.sdk.api.datamodels._generated import TIBulkHeartbeatItem
+
+        try:
+            data = conn.recv(4096)
+        except OSError:
+            data = b""
+        if not data:
+            # The supervisor is done with its task
+            self._selector.unregister(conn)
+            del self._buffers[conn]
+            self._pending = [(c, item) for c, item in self._pending if c is not conn]
+            conn.close()
+            self._last_connected = time.monotonic()
+            return
+
+        self._buffers[conn] += data
+        while b"\n" in self._buffers[conn]:
+            line, self._buffers[conn] = self._buffers[conn].split(b"\n", 1)
+            try:
+                item = TIBulkHeartbeatItem.model_validate_json(line)
+            except ValidationError as e:
+                # The supervisor heartbeats directly once it has waited for a reply for too long
+                log.warning("Dropping invalid heartbeat", error=str(e))
+                continue
+            self._pending.append((conn, item))
+            if self._batch_deadline is None:
+                self._batch_deadline = time.monotonic() + self.batch_window
+
+    def _flush(self) -> None:
+        pending, self._pending, self._batch_deadline = self._pending, [], None
+        if not pending:
+            return
+
+        replies = self._send([item for _, item in pending])
+        log.debug("Sent heartbeats", count=len(pending))
+        for (conn, _), reply in zip(pending, replies):
+            with suppress(OSError):
+                conn.sendall(json.dumps(reply).encode() + b"\n")
+
+    def _send(self, items: list[TIBulkHeartbeatItem]) -> list[dict[str, Any]]:
+        from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError
+
+        # Any valid task token will do for the request itself; each heartbeat is checked with its own
+        token = items[-1].token
+        if self._client is None:
+            self._client = Client(base_url=self.server, token=token)
+        else:
+            self._client.auth = BearerAuth(token)
+
+        try:
+            response = self._client.task_instances.heartbeat_many(items)
+            return [result.model_dump(mode="json") for result in response.results]
+        except ServerResponseError as e:
+            if e.response.status_code in (401, 403) and len(items) > 1:
+                # Only the token the request was sent with was rejected, the others may well be valid
+                log.info("Bulk heartbeat not authorized, sending heartbeats one by one", count=len(items))
+                return [reply for item in items for reply in self._send([item])]
+            log.warning("Bulk heartbeat failed", status_code=e.response.status_code, detail=e.detail)
+            detail = e.detail if isinstance(e.detail, (dict, str)) else str(e)
+            return [{"status_code": e.response.status_code, "detail": detail}] * len(items)
+        except Exception as e:
+            log.warning("Bulk heartbeat failed", error=str(e))
+            return [{"error": str(e) or type(e).__name__}] * len(items)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Send the heartbeats of the tasks on this host in batches.")
+    parser.add_argument("server")
+    parser.add_argument("socket_path", type=Path)
+    args = parser.parse_args(argv)
+
+    aggregator = HeartbeatAggregator(server=args.server, socket_path=args.socket_path)
+    if not aggregator.bind():
+        # Another supervisor started one at the same time
+        return
+    log.info("Heartbeat aggregator ready", pid=os.getpid(), server=args.server)
+    aggregator.serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ from __future__ import annotations
 import collections
 import itertools
 from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import attrs
@@ -39,6 +41,29 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 log = structlog.get_logger(logger_name=__name__)
 
 
+def _get_window_size() -> int:
+    from airflow.configuration import conf
+
+    return conf.getint("workers", "xcom_sequence_window_size", fallback=100)
+
+
+def _get_max_cached_windows() -> int:
+    from airflow.configuration import conf
+
+    return conf.getint("workers", "xcom_sequence_max_cached_windows", fallback=10)
+
+
+def _get_prefetch() -> bool:
+    from airflow.configuration import conf
+
+    return conf.getboolean("workers", "xcom_sequence_prefetch", fallback=False)
+
+
+@cache
+def _prefetch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="xcom-sequence-prefetch")
+
+
 @attrs.define
 class LazyXComIterator(Iterator[T]):
     seq: LazyXComSequence[T]
@@ -50,7 +75,10 @@ class LazyXComIterator(Iterator[T]):
             # When iterating backwards, avoid extra HTTP request
             raise StopIteration()
         try:
-            val = self.seq[self.index]
+            if self.dir == 1:
+                val = self.seq._get_item_in_window(self.index)
+            else:
+                val = self.seq[self.index]
         except IndexError:
             raise StopIteration from None
         self.index += self.dir
@@ -66,6 +94,13 @@ class LazyXComSequence(Sequence[T]):
     _xcom_arg: PlainXComArg = attrs.field(alias="xcom_arg")
     _ti: RuntimeTaskInstance = attrs.field(alias="ti")
 
+    _window_size: int = attrs.field(init=False, factory=_get_window_size)
+    _max_cached_windows: int = attrs.field(init=False, factory=_get_max_cached_windows)
+    _prefetch: bool = attrs.field(init=False, factory=_get_prefetch)
+    # Start index -> items of the window, least recently used first
+    _windows: collections.OrderedDict[int, list[T]] = attrs.field(init=False, factory=collections.OrderedDict)
+    _prefetched: dict[int, Future[list[T]]] = attrs.field(init=False, factory=dict)
+
     def __repr__(self) -> str:
         if self._len is not None:
             counter = "item" if (length := len(self)) == 1 else "items"
@@ -146,6 +181,12 @@ class LazyXComSequence(Sequence[T]):
                 key = index()
             raise TypeError(f"Sequence indices must be integers or slices not {type(key).__name__}")
 
+        offset = key + self._len if key < 0 and self._len is not None else key
+        if offset >= 0 and self._window_size > 1:
+            start = offset - offset % self._window_size
+            if (items := self._windows.get(start)) is not None and offset - start < len(items):
+                return items[offset - start]
+
         source = (xcom_arg := self._xcom_arg).operator
         msg = SUPERVISOR_COMMS.send(
             GetXComSequenceItem(
@@ -162,6 +203,50 @@ class LazyXComSequence(Sequence[T]):
             raise TypeError(f"Got unexpected response to GetXComSequenceItem: {msg!r}")
         return XCom.deserialize_value(_XComWrapper(msg.root))
 
+    def _get_item_in_window(self, index: int) -> T:
+        """
+        Get the item at a non-negative ``index``, fetching the whole window of items it is in.
+
+        Used when iterating, so that the items are fetched ``xcom_sequence_window_size`` at a time instead
+        of one by one.
+        """
+        if (window_size := self._window_size) <= 1:
+            return self[index]
+        start = index - index % window_size
+        items = self._get_window(start)
+        if self._prefetch and index == start and len(items) == window_size:
+            self._prefetch_window(start + window_size)
+        if index - start >= len(items):
+            raise IndexError(index)
+        return items[index - start]
+
+    def _get_window(self, start: int) -> list[T]:
+        if (items := self._windows.get(start)) is not None:
+            self._windows.move_to_end(start)
+            return items
+        if (future := self._prefetched.pop(start, None)) is not None:
+            items = future.result()
+        else:
+            items = self._fetch_window(start)
+        self._windows[start] = items
+        while len(self._windows) > self._max_cached_windows:
+            self._windows.popitem(last=False)
+        return items
+
+    def _fetch_window(self, start: int) -> list[T]:
+        items = self[start : start + self._window_size]
+        if len(items) < self._window_size and (items or start == 0):
+            # A partial window is the last one, so the length is known without asking for it
+            self._len = start + len(items)
+        return list(items)
+
+    def _prefetch_window(self, start: int) -> None:
+        if start in self._windows or start in self._prefetched:
+            return
+        if self._len is not None and start >= self._len:
+            return
+        self._prefetched[start] = _prefetch_executor().submit(self._fetch_window, start)
+
 
 def _coerce_slice_index(value: Any) -> int | None:
     """
@@ -0,0 +1,133 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Start, listen on and connect to the long-lived processes on a worker that supervisors talk to.
+
+Such a local server (a DAG zygote, or a heartbeat aggregator) listens on a Unix socket in a directory private
+to the user, and is started by the first supervisor that finds nobody listening on it. Several supervisors may
+start one at the same time: the first to listen wins, and the others exit.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+
+__all__ = ["connect", "connect_or_start", "listen", "runtime_dir", "start_server"]
+
+
+def runtime_dir(name: str) -> Path:
+    """
+    Get a directory for sockets that only the current user can access, creating it if needed.
+
+    It is in ``$XDG_RUNTIME_DIR`` if set, and in the temporary directory otherwise. Either way it is checked
+    to be a directory owned by the current user and accessible to them only, as anyone who could connect to
+    the sockets in it could make the processes listening on them run code, or send them task tokens.
+
+    :param name: The name of the directory; the uid of the user is added to it in the temporary directory.
+    :raises PermissionError: If the directory exists but is not private to the current user.
+    """
+    if base := os.environ.get("XDG_RUNTIME_DIR"):
+        path = Path(base, name)
+    else:
+        path = Path(tempfile.gettempdir(), f"{name}-{os.getuid()}")
+    with suppress(FileExistsError):
+        path.mkdir(mode=0o700)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        raise PermissionError(f"{path} must be a directory owned by the current user, with mode 0700")
+    return path
+
+
+def start_server(module: str, *args: str) -> subprocess.Popen:
+    """Start a local server, running ``module`` with ``args``, in a session of its own so it outlives us."""
+    return subprocess.Popen(
+        [sys.executable, "-m", module, *args], stdin=subprocess.DEVNULL, start_new_session=True
+    )
+
+
+def connect(path: Path) -> socket.socket:
+    """
+    Connect to the local server listening on a socket.
+
+    :raises FileNotFoundError: If there is no socket.
+    :raises ConnectionRefusedError: If nobody listens on the socket.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(os.fspath(path))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def connect_or_start(path: Path, start: Callable[[], subprocess.Popen], timeout: float) -> socket.socket:
+    """
+    Connect to the local server listening on a socket, starting it if nobody does and waiting for it to listen.
+
+    :param start: Starts the server, which is to listen on ``path``.
+    :param timeout: How long to wait for the server to listen, in seconds.
+    :raises FileNotFoundError | ConnectionRefusedError: If the server did not start listening in time.
+    """
+    deadline = time.monotonic() + timeout
+    server: subprocess.Popen | None = None
+    while True:
+        try:
+            return connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # A server that exits cleanly before listening lost the race to start against another one
+            if time.monotonic() > deadline or (server and server.poll() not in (None, 0)):
+                raise
+        if server is None:
+            server = start()
+        time.sleep(0.05)
+
+
+def listen(path: Path) -> socket.socket | None:
+    """
+    Listen on a socket, replacing one left behind by a server that died.
+
+    :return: The listening socket, or None if another server is listening on it already.
+    """
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            server.bind(os.fspath(path))
+        except OSError:
+            try:
+                connect(path).close()
+            except ConnectionRefusedError:
+                path.unlink()
+                server.bind(os.fspath(path))
+            else:
+                server.close()
+                return None
+        server.listen()
+    except BaseException:
+        server.close()
+        raise
+    return server
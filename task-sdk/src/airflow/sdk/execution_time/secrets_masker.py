@@ -26,7 +26,6 @@ import sys
 from collections.abc import Callable, Generator, Iterable, Iterator
 from enum import Enum
 from functools import cache, cached_property
-from re import Pattern
 from typing import Any, TextIO, TypeAlias, TypeVar
 
 from airflow import settings
@@ -156,10 +155,108 @@ def _is_v1_env_var(v: Any) -> bool:
     return isinstance(v, _get_v1_env_var_type())
 
 
+class _SecretsReplacer:
+    """
+    Find and replace many secrets in a string at once.
+
+    Every substring of ``gram_length`` characters of every secret is indexed, ``gram_length`` being about
+    half the length of the shortest secret. Any occurrence of a secret then contains one of the substrings
+    starting at every ``step``-th position of the string, so only those positions are looked up. Most log
+    messages contain no secret and are rejected after ``len(string) / step`` dict lookups, however many
+    secrets there are. When there are fewer secrets than positions to look up, each secret is searched for
+    directly instead.
+
+    Secrets are added to the index one at a time; nothing is recompiled when a secret is added, unless it is
+    shorter than all previous ones.
+    """
+
+    MAX_GRAM_LENGTH = 8
+
+    def __init__(self, secrets: Iterable[str] = ()):
+        self.secrets: set[str] = set()
+        self.min_length = 0
+        self.gram_length = 0
+        self.step = 0
+        # Substring -> (secret, offset of the substring in the secret)
+        self._grams: dict[str, list[tuple[str, int]]] = {}
+        for secret in secrets:
+            self.add(secret)
+
+    def __bool__(self) -> bool:
+        return bool(self.secrets)
+
+    def add(self, secret: str) -> None:
+        if not secret or secret in self.secrets:
+            return
+        self.secrets.add(secret)
+        if self.min_length and len(secret) >= self.min_length:
+            self._index(secret)
+            return
+        self.min_length = len(secret)
+        self.gram_length = min(self.MAX_GRAM_LENGTH, (self.min_length + 1) // 2)
+        self.step = self.min_length - self.gram_length + 1
+        self._grams = {}
+        for existing in self.secrets:
+            self._index(existing)
+
+    def _index(self, secret: str) -> None:
+        for offset in range(len(secret) - self.gram_length + 1):
+            self._grams.setdefault(secret[offset : offset + self.gram_length], []).append((secret, offset))
+
+    def _find(self, string: str) -> dict[int, int]:
+        """Return the end of the longest secret starting at each position of ``string`` where one starts."""
+        match_ends: dict[int, int] = {}
+        positions = range(0, len(string) - self.gram_length + 1, self.step)
+        if len(self.secrets) < len(positions):
+            for secret in self.secrets:
+                start = string.find(secret)
+                while start != -1:
+                    match_ends[start] = max(match_ends.get(start, 0), start + len(secret))
+                    start = string.find(secret, start + 1)
+            return match_ends
+
+        grams = self._grams
+        gram_length = self.gram_length
+        for position in positions:
+            candidates = grams.get(string[position : position + gram_length])
+            if not candidates:
+                continue
+            for secret, offset in candidates:
+                start = position - offset
+                if start >= 0 and string.startswith(secret, start):
+                    match_ends[start] = max(match_ends.get(start, 0), start + len(secret))
+        return match_ends
+
+    def sub(self, replacement: str, string: str) -> str:
+        """Replace every occurrence of every secret in ``string`` with ``replacement``."""
+        if not self.secrets or len(string) < self.min_length:
+            return string
+        match_ends = self._find(string)
+        if not match_ends:
+            return string
+
+        # Overlapping secrets are replaced as a whole, so that no part of either is left in the string
+        parts = []
+        position = 0
+        end = -1
+        for start in sorted(match_ends):
+            if start < end:
+                end = max(end, match_ends[start])
+                continue
+            if end != -1:
+                parts.append(replacement)
+                position = end
+            parts.append(string[position:start])
+            end = match_ends[start]
+        parts.append(replacement)
+        parts.append(string[end:])
+        return "".join(parts)
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: _SecretsReplacer | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -360,7 +457,6 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -372,9 +468,9 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        if self.replacer is None:
+                            self.replacer = _SecretsReplacer()
+                        self.replacer.add(s)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import atexit
 import contextlib
+import functools
 import io
 import logging
 import os
@@ -54,7 +55,7 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.configuration import conf
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
@@ -90,6 +91,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -111,6 +113,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBulkResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -118,7 +121,10 @@ from airflow.sdk.execution_time.comms import (
     _RequestFrame,
     _ResponseFrame,
 )
+from airflow.sdk.execution_time.heartbeat_aggregator import HeartbeatAggregatorConnection
 from airflow.sdk.execution_time.secrets_masker import mask_secret
+from airflow.sdk.execution_time.zygote import ZygoteChildProcess, fork_from_zygote
+from airflow.utils.net import get_hostname
 
 try:
     from socket import send_fds
@@ -146,6 +152,12 @@ MAX_FAILED_HEARTBEATS: int = conf.getint("workers", "max_failed_heartbeats")
 
 SOCKET_CLEANUP_TIMEOUT: float = conf.getfloat("workers", "socket_cleanup_timeout")
 
+# Fork task processes from a process that has parsed their DAG file already
+DAG_ZYGOTE: bool = conf.getboolean("workers", "dag_zygote")
+
+# Send heartbeats through a process shared by all the tasks on this host, which sends them in batches
+HEARTBEAT_AGGREGATOR: bool = conf.getboolean("workers", "heartbeat_aggregator")
+
 # Maximum possible time (in seconds) that task will have for execution of auxiliary processes
 # like listeners after task is complete.
 TASK_OVERTIME_THRESHOLD: float = conf.getfloat("core", "task_success_overtime")
@@ -458,9 +470,16 @@ class WatchedSubprocess:
         *,
         target: Callable[[], None] = _subprocess_main,
         logger: FilteringBoundLogger | None = None,
+        zygote: Callable[[tuple[socket, socket, socket, socket]], ZygoteChildProcess | None] | None = None,
         **constructor_kwargs,
     ) -> Self:
-        """Fork and start a new subprocess with the specified target function."""
+        """
+        Fork and start a new subprocess with the specified target function.
+
+        If ``zygote`` is given, it is called with the child ends of the sockets to get a DAG zygote to fork the
+        subprocess instead, which then runs the task runner rather than ``target``. The subprocess is forked
+        here if that returns None.
+        """
         # Create socketpairs/"pipes" to connect to the stdin and out from the subprocess
         child_stdout, read_stdout = socketpair()
         child_stderr, read_stderr = socketpair()
@@ -471,7 +490,8 @@ class WatchedSubprocess:
         # Open the socketpair before forking off the child, so that it is open when we fork.
         child_logs, read_logs = socketpair()
 
-        pid = os.fork()
+        zygote_child = zygote((child_requests, child_stdout, child_stderr, child_logs)) if zygote else None
+        pid = zygote_child.pid if zygote_child else os.fork()
         if pid == 0:
             # Close and delete of the parent end of the sockets.
             cls._close_unused_sockets(read_requests, read_stdout, read_stderr, read_logs)
@@ -504,7 +524,7 @@ class WatchedSubprocess:
         proc = cls(
             pid=pid,
             stdin=read_requests,
-            process=psutil.Process(pid),
+            process=zygote_child or psutil.Process(pid),
             process_log=logger,
             start_time=time.monotonic(),
             **constructor_kwargs,
@@ -516,6 +536,13 @@ class WatchedSubprocess:
             requests=read_requests,
             logs=read_logs,
         )
+        if zygote_child:
+            # The zygote tells us when the process exits, so we notice it as soon as we would for our own child
+            proc.selector.register(
+                zygote_child.control,
+                selectors.EVENT_READ,
+                (zygote_child.read_exit_code, lambda sock: None),
+            )
 
         return proc
 
@@ -830,6 +857,8 @@ class ActivitySubprocess(WatchedSubprocess):
     # does not hang around forever.
     failed_heartbeats: int = attrs.field(default=0, init=False)
 
+    _heartbeat_aggregator: HeartbeatAggregatorConnection | None = attrs.field(default=None, init=False)
+
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
 
@@ -850,6 +879,10 @@ class ActivitySubprocess(WatchedSubprocess):
         **kwargs,
     ) -> Self:
         """Fork and start a new subprocess to execute the given task."""
+        if DAG_ZYGOTE and target is _subprocess_main:
+            kwargs["zygote"] = functools.partial(
+                fork_from_zygote, bundle_info=bundle_info, dag_rel_path=os.fspath(dag_rel_path)
+            )
         proc: Self = super().start(id=what.id, client=client, target=target, logger=logger, **kwargs)
         # Tell the task process what it needs to do!
         proc._on_child_started(ti=what, dag_rel_path=dag_rel_path, bundle_info=bundle_info)
@@ -895,6 +928,8 @@ class ActivitySubprocess(WatchedSubprocess):
             self._monitor_subprocess()
         finally:
             self.selector.close()
+            if self._heartbeat_aggregator:
+                self._heartbeat_aggregator.close()
 
         # self._monitor_subprocess() will set the exit code when the process has finished
         # If it hasn't, assume it's failed
@@ -1001,33 +1036,102 @@ class ActivitySubprocess(WatchedSubprocess):
             return
 
         self._last_heartbeat_attempt = time.monotonic()
+        if HEARTBEAT_AGGREGATOR and self._send_heartbeat_to_aggregator():
+            # The result is handled once the aggregator replies
+            return
         try:
             self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
+        except Exception as e:
+            self._handle_heartbeat_result(e)
+        else:
+            self._handle_heartbeat_result(None)
+
+    def _send_heartbeat_to_aggregator(self) -> bool:
+        """
+        Send a heartbeat through the heartbeat aggregator of this host.
+
+        :return: False if the aggregator can't be used, in which case the heartbeat should be sent directly.
+        """
+        if self._heartbeat_aggregator and self._heartbeat_aggregator.waiting:
+            # No reply to the last one: don't wait on it any longer, and connect again next time
+            log.warning("Heartbeat aggregator did not reply, sending heartbeat directly", ti_id=self.id)
+            self._close_heartbeat_aggregator(self._heartbeat_aggregator.sock)
+            return False
+        try:
+            if self._heartbeat_aggregator is None:
+                self._heartbeat_aggregator = HeartbeatAggregatorConnection.connect(
+                    str(self.client.base_url), self._on_aggregated_heartbeat
+                )
+                if self._heartbeat_aggregator is None:
+                    # Started, but only used from the next heartbeat on
+                    return False
+                self.selector.register(
+                    self._heartbeat_aggregator.sock,
+                    selectors.EVENT_READ,
+                    (self._heartbeat_aggregator.read_reply, self._on_heartbeat_aggregator_closed),
+                )
+            self._heartbeat_aggregator.send(
+                self.id,
+                pid=self._process.pid,
+                hostname=get_hostname(),
+                token=getattr(self.client.auth, "token", ""),
+            )
+        except OSError as e:
+            log.warning("Could not use heartbeat aggregator, sending heartbeat directly", error=str(e))
+            if self._heartbeat_aggregator:
+                self._close_heartbeat_aggregator(self._heartbeat_aggregator.sock)
+            return False
+        return True
+
+    def _on_aggregated_heartbeat(self, error: Exception | None, refreshed_token: str | None):
+        if refreshed_token:
+            log.debug("Execution API issued us a refreshed Task token")
+            self.client.auth = BearerAuth(refreshed_token)
+        if self._terminal_state or self._exit_code is not None:
+            return
+        self._handle_heartbeat_result(error)
+
+    def _on_heartbeat_aggregator_closed(self, sock: socket):
+        if self._heartbeat_aggregator and self._heartbeat_aggregator.sock is sock:
+            if self._heartbeat_aggregator.waiting:
+                self._handle_heartbeat_failures(ConnectionError("Heartbeat aggregator went away"))
+            self._heartbeat_aggregator = None
+
+    def _close_heartbeat_aggregator(self, sock: socket):
+        with suppress(KeyError, ValueError):
+            self.selector.unregister(sock)
+        self._heartbeat_aggregator = None
+        sock.close()
+
+    def _handle_heartbeat_result(self, error: Exception | None):
+        """Handle the outcome of a heartbeat, sent directly or through the heartbeat aggregator."""
+        if error is None:
             # Update the last heartbeat time on success
             self._last_successful_heartbeat = time.monotonic()
 
             # Reset the counter on success
             self.failed_heartbeats = 0
-        except ServerResponseError as e:
-            if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
-            else:
-                # If we get any other error, we'll just log it and try again next time
-                self._handle_heartbeat_failures(e)
-        except Exception as e:
-            self._handle_heartbeat_failures(e)
+            return
+        if isinstance(error, ServerResponseError) and error.response.status_code in {
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.CONFLICT,
+        }:
+            log.error(
+                "Server indicated the task shouldn't be running anymore",
+                detail=error.detail,
+                status_code=error.response.status_code,
+                ti_id=self.id,
+            )
+            self.process_log.error(
+                "Server indicated the task shouldn't be running anymore. Terminating process",
+                detail=error.detail,
+            )
+            self.kill(signal.SIGTERM, force=True)
+            self.process_log.error("Task killed!")
+            self._terminal_state = SERVER_TERMINATED
+        else:
+            # If we get any other error, we'll just log it and try again next time
+            self._handle_heartbeat_failures(error)
 
     def _handle_heartbeat_failures(self, exc: Exception | None):
         """Increment the failed heartbeats counter and kill the process if too many failures."""
@@ -1135,6 +1239,9 @@ class ActivitySubprocess(WatchedSubprocess):
                 msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.start, msg.stop, msg.step
             )
             resp = XComSequenceSliceResult.from_response(xcoms)
+        elif isinstance(msg, GetXComBulk):
+            xcom_bulk = self.client.xcoms.get_many(msg.dag_id, msg.run_id, msg.xcoms, msg.include_prior_dates)
+            resp = XComBulkResult.from_response(xcom_bulk)
         elif isinstance(msg, DeferTask):
             self._terminal_state = TaskInstanceState.DEFERRED
             self._rendered_map_index = msg.rendered_map_index
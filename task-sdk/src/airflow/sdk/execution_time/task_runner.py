@@ -30,6 +30,7 @@ from contextlib import suppress
 from datetime import datetime, timezone
 from itertools import product
 from pathlib import Path
+from types import MethodType
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import attrs
@@ -44,10 +45,12 @@ from airflow.exceptions import AirflowInactiveAssetInInletOrOutletException
 from airflow.listeners.listener import get_listener_manager
 from airflow.sdk.api.datamodels._generated import (
     AssetProfile,
+    BundleInfo,
     DagRun,
     TaskInstance,
     TaskInstanceState,
     TIRunContext,
+    XComBulkPullItem,
 )
 from airflow.sdk.bases.operator import BaseOperator, ExecutorSafeguard
 from airflow.sdk.bases.xcom import BaseXCom
@@ -89,6 +92,7 @@ from airflow.sdk.execution_time.comms import (
     ToTask,
     TriggerDagRun,
     ValidateInletsAndOutlets,
+    XComResult,
 )
 from airflow.sdk.execution_time.context import (
     ConnectionAccessor,
@@ -113,6 +117,7 @@ if TYPE_CHECKING:
     from structlog.typing import FilteringBoundLogger as Logger
 
     from airflow.exceptions import DagRunTriggerException, TaskDeferred
+    from airflow.models.dagbag import DagBag
     from airflow.sdk.definitions._internal.abstractoperator import AbstractOperator
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.types import OutletEventAccessorsProtocol
@@ -356,14 +361,12 @@ class RuntimeTaskInstance(TaskInstance):
         # If map_indexes is not specified, pull xcoms from all map indexes for each task
         if isinstance(map_indexes, ArgNotSet):
             xcoms: list[Any] = []
-            for t_id in task_ids:
-                values = XCom.get_all(
-                    run_id=run_id,
-                    key=key,
-                    task_id=t_id,
-                    dag_id=dag_id,
-                )
-
+            for values in _xcom_get_all_for_tasks(
+                run_id=run_id,
+                key=key,
+                task_ids=list(task_ids),
+                dag_id=dag_id,
+            ):
                 if values is None:
                     xcoms.append(None)
                 else:
@@ -385,15 +388,13 @@ class RuntimeTaskInstance(TaskInstance):
             )
 
         xcoms = []
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
-            value = XCom.get_one(
-                run_id=run_id,
-                key=key,
-                task_id=t_id,
-                dag_id=dag_id,
-                map_index=m_idx,
-                include_prior_dates=include_prior_dates,
-            )
+        for value in _xcom_get_one_for_tasks(
+            run_id=run_id,
+            key=key,
+            task_ids_and_map_indexes=list(product(task_ids, map_indexes_iterable)),
+            dag_id=dag_id,
+            include_prior_dates=include_prior_dates,
+        ):
             if value is None:
                 xcoms.append(default)
             else:
@@ -569,6 +570,84 @@ def _xcom_push(ti: RuntimeTaskInstance, key: str, value: Any, mapped_length: int
     )
 
 
+def _can_pull_xcoms_in_bulk(num_xcoms: int) -> bool:
+    """Whether pulling ``num_xcoms`` XComs with one request saves requests and gives the same values."""
+
+    def is_base_method(name: str) -> bool:
+        method, base_method = getattr(XCom, name), getattr(BaseXCom, name)
+        return isinstance(method, MethodType) and method.__func__ is getattr(base_method, "__func__", None)
+
+    # A custom XCom backend may change how single XComs are pulled
+    return num_xcoms > 1 and is_base_method("get_one") and is_base_method("get_all")
+
+
+def _xcom_get_all_for_tasks(*, run_id: str, key: str, task_ids: list[str], dag_id: str) -> list[Any]:
+    """Return what ``XCom.get_all`` returns for each of ``task_ids``, with one request when possible."""
+    if not _can_pull_xcoms_in_bulk(len(task_ids)):
+        return [XCom.get_all(run_id=run_id, key=key, task_id=t_id, dag_id=dag_id) for t_id in task_ids]
+
+    from airflow.serialization.serde import deserialize
+
+    stored = XCom._get_bulk(
+        dag_id=dag_id,
+        run_id=run_id,
+        xcoms=[XComBulkPullItem(task_id=t_id, key=key, map_index=None) for t_id in task_ids],
+    )
+    return [deserialize(values) or None for values in stored]
+
+
+def _xcom_get_one_for_tasks(
+    *,
+    run_id: str,
+    key: str,
+    task_ids_and_map_indexes: list[tuple[str, int | None]],
+    dag_id: str,
+    include_prior_dates: bool,
+) -> list[Any]:
+    """Return what ``XCom.get_one`` returns for each task id and map index, with one request when possible."""
+    if not _can_pull_xcoms_in_bulk(len(task_ids_and_map_indexes)):
+        return [
+            XCom.get_one(
+                run_id=run_id,
+                key=key,
+                task_id=t_id,
+                dag_id=dag_id,
+                map_index=m_idx,
+                include_prior_dates=include_prior_dates,
+            )
+            for t_id, m_idx in task_ids_and_map_indexes
+        ]
+
+    stored = XCom._get_bulk(
+        dag_id=dag_id,
+        run_id=run_id,
+        xcoms=[
+            # Like for a single XCom, no map index means the XCom of an unmapped task
+            XComBulkPullItem(
+                task_id=t_id, key=key, map_index=m_idx if m_idx is not None and m_idx >= 0 else -1
+            )
+            for t_id, m_idx in task_ids_and_map_indexes
+        ],
+        include_prior_dates=include_prior_dates,
+    )
+    log = structlog.get_logger(logger_name="task")
+    values = []
+    for (t_id, m_idx), found in zip(task_ids_and_map_indexes, stored):
+        if found and found[0] is not None:
+            values.append(XCom.deserialize_value(XComResult(key=key, value=found[0])))
+            continue
+        log.warning(
+            "No XCom value found; defaulting to None.",
+            key=key,
+            dag_id=dag_id,
+            task_id=t_id,
+            run_id=run_id,
+            map_index=m_idx,
+        )
+        values.append(None)
+    return values
+
+
 def _xcom_push_to_db(ti: RuntimeTaskInstance, key: str, value: Any) -> None:
     """Push a XCom directly to metadata DB, bypassing custom xcom_backend."""
     XCom._set_xcom_in_db(
@@ -598,13 +677,11 @@ def get_log_url_from_ti(ti: RuntimeTaskInstance) -> str:
     return _log_uri
 
 
-def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
-    # TODO: Task-SDK:
-    # Using DagBag here is about 98% wrong, but it'll do for now
+# Set in a DAG zygote process, before it forks the task processes for the DAG file it has parsed
+_preloaded_dag_bag: tuple[str, DagBag] | None = None
 
-    from airflow.models.dagbag import DagBag
 
-    bundle_info = what.bundle_info
+def _initialize_bundle(bundle_info: BundleInfo) -> BaseDagBundle:
     bundle_instance = DagBundlesManager().get_bundle(
         name=bundle_info.name,
         version=bundle_info.version,
@@ -615,14 +692,48 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     # code in util modules to be shared between files within the same bundle.
     if (bundle_root := os.fspath(bundle_instance.path)) not in sys.path:
         sys.path.append(bundle_root)
+    return bundle_instance
 
-    dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
-    bag = DagBag(
+
+def _get_dag_bag(dag_absolute_path: str) -> DagBag:
+    from airflow.models.dagbag import DagBag
+
+    if _preloaded_dag_bag and _preloaded_dag_bag[0] == dag_absolute_path:
+        return _preloaded_dag_bag[1]
+    return DagBag(
         dag_folder=dag_absolute_path,
         include_examples=False,
         safe_mode=False,
         load_op_links=False,
     )
+
+
+def preload_dag_file(bundle_info: BundleInfo, dag_rel_path: str) -> DagBag:
+    """
+    Parse a DAG file ahead of any task, so that the task processes forked from this one don't parse it again.
+
+    This is what a DAG zygote does once, before it starts forking task processes for the DAG file. A file that
+    fails to import is not kept, so that each task process parses it again and logs the errors.
+    """
+    global _preloaded_dag_bag
+
+    bundle_instance = _initialize_bundle(bundle_info)
+    dag_absolute_path = os.fspath(Path(bundle_instance.path, dag_rel_path))
+    bag = _get_dag_bag(dag_absolute_path)
+    if not bag.import_errors:
+        _preloaded_dag_bag = (dag_absolute_path, bag)
+    return bag
+
+
+def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
+    # TODO: Task-SDK:
+    # Using DagBag here is about 98% wrong, but it'll do for now
+
+    bundle_info = what.bundle_info
+    bundle_instance = _initialize_bundle(bundle_info)
+
+    dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
+    bag = _get_dag_bag(dag_absolute_path)
     if TYPE_CHECKING:
         assert what.ti.dag_id
 
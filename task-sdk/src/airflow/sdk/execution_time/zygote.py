@@ -0,0 +1,367 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Fork task processes from a "zygote" process that has already parsed their DAG file.
+
+Starting a task process means parsing its DAG file, which imports the module and everything it imports in
+turn. For short tasks this can take longer than the task itself. A DAG zygote is a long-lived process on the
+worker, one per bundle, bundle version and DAG file, that parses the file once and then forks a task process
+for each task the supervisors on that worker run from that file.
+
+Supervisors talk to the zygote over a Unix socket: the supervisor sends the child ends of the sockets it
+would otherwise hand to a forked child, the zygote forks a child that runs the task runner with them, replies
+with its pid, and once the child has exited, with its exit code.
+
+A zygote exits after it has been idle for ``[workers] dag_zygote_idle_timeout`` seconds, so the zygotes for
+older versions of a bundle go away once no more tasks run from those, or once its socket has been removed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import hashlib
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+import psutil
+import structlog
+
+from airflow.configuration import conf
+from airflow.sdk.execution_time.local_server import connect_or_start, listen, runtime_dir, start_server
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger
+
+    from airflow.sdk.api.datamodels._generated import BundleInfo
+
+__all__ = ["DagZygote", "ZygoteChildProcess", "fork_from_zygote"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="dag_zygote")
+
+IDLE_TIMEOUT: float = conf.getfloat("workers", "dag_zygote_idle_timeout")
+
+# How long a supervisor waits for a zygote to start and parse the DAG file before forking the task itself
+START_TIMEOUT = 120.0
+
+# How often a zygote checks whether it has been idle for too long, or its socket has been removed
+POLL_INTERVAL = 5.0
+
+# Sent with the file descriptors of the child ends of the supervisor sockets to ask for a new task process
+_FORK_REQUEST = b"F"
+# pids and exit codes are sent back as signed 32 bit ints
+_INT = struct.Struct("!i")
+
+# Same as what psutil.Process.wait() returns for a process killed by a signal, so the supervisor can log it
+Negsignal = enum.IntEnum("Negsignal", {sig.name: -sig.value for sig in signal.Signals})  # type: ignore[misc]
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+def zygote_socket_path(bundle_info: BundleInfo, dag_rel_path: str) -> Path:
+    """
+    Get the path of the socket of the zygote for a version of a bundle and a DAG file.
+
+    Each version gets a zygote of its own, as tasks from an older version may still be running or queued when
+    a newer one comes in. Bundles without versions change in place, so the modification time of the DAG file
+    stands in for the version for those.
+    """
+    version = bundle_info.version
+    if version is None:
+        from airflow.dag_processing.bundles.manager import DagBundlesManager
+
+        bundle = DagBundlesManager().get_bundle(name=bundle_info.name)
+        version = str(Path(bundle.path, dag_rel_path).stat().st_mtime_ns)
+    return runtime_dir("airflow-dag-zygotes") / f"{_digest(bundle_info.name, dag_rel_path, version)}.sock"
+
+
+def _recv_int(sock: socket.socket) -> int | None:
+    data = sock.recv(_INT.size, socket.MSG_WAITALL)
+    if len(data) < _INT.size:
+        return None
+    return _INT.unpack(data)[0]
+
+
+class ZygoteChildProcess(psutil.Process):
+    """
+    A task process forked by a DAG zygote.
+
+    It is not a child of the supervisor, so its exit code comes from the zygote over ``control`` rather than
+    from ``wait()``.
+    """
+
+    def __init__(self, pid: int, control: socket.socket):
+        super().__init__(pid)
+        self.control = control
+        self.returncode: int | None = None
+        self._zygote_gone = False
+
+    def read_exit_code(self, sock: socket.socket) -> bool:
+        """Read the exit code sent by the zygote; a handler for the supervisor's selector."""
+        code = _recv_int(sock)
+        if code is None:
+            self._zygote_gone = True
+        elif self.returncode is None:
+            self.returncode = code
+            if code < 0:
+                with suppress(ValueError):
+                    self.returncode = Negsignal(code)
+        return False
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self.returncode is None and not self._zygote_gone and timeout != 0:
+            self.control.settimeout(timeout)
+            try:
+                self.read_exit_code(self.control)
+            except TimeoutError:
+                pass
+        if self.returncode is None and self._zygote_gone and not self.is_running():
+            # The zygote died before the task process did, so there's no telling how it exited
+            self.returncode = 1
+        if self.returncode is None:
+            raise psutil.TimeoutExpired(timeout, pid=self.pid)
+        return self.returncode
+
+
+def _connect_to_zygote(path: Path, bundle_info: BundleInfo, dag_rel_path: str) -> socket.socket:
+    def start():
+        args = [bundle_info.name, dag_rel_path, os.fspath(path)]
+        if bundle_info.version is not None:
+            args += ["--bundle-version", bundle_info.version]
+        log.info(
+            "Starting DAG zygote", bundle=bundle_info.name, version=bundle_info.version, path=dag_rel_path
+        )
+        return start_server(__name__, *args)
+
+    return connect_or_start(path, start, timeout=START_TIMEOUT)
+
+
+def fork_from_zygote(
+    child_sockets: tuple[socket.socket, socket.socket, socket.socket, socket.socket],
+    *,
+    bundle_info: BundleInfo,
+    dag_rel_path: str,
+) -> ZygoteChildProcess | None:
+    """
+    Ask the zygote for a bundle version and DAG file to fork a task process, starting it if needed.
+
+    :param child_sockets: The child ends of the requests, stdout, stderr and logs sockets of the supervisor.
+    :param bundle_info: The bundle the DAG file belongs to.
+    :param dag_rel_path: The path of the DAG file, relative to the bundle root.
+    :return: The forked task process, or None if it could not be forked by a zygote, in which case the
+        supervisor should fork it itself.
+    """
+    try:
+        path = zygote_socket_path(bundle_info, dag_rel_path)
+        control = _connect_to_zygote(path, bundle_info, dag_rel_path)
+    except OSError as e:
+        log.warning("Could not connect to DAG zygote, forking the task process directly", error=str(e))
+        return None
+
+    try:
+        # The zygote only answers once it has parsed the DAG file
+        control.settimeout(START_TIMEOUT)
+        socket.send_fds(control, [_FORK_REQUEST], [sock.fileno() for sock in child_sockets])
+        pid = _recv_int(control)
+        if pid is None:
+            raise ConnectionResetError("DAG zygote closed the connection")
+        control.settimeout(None)
+        return ZygoteChildProcess(pid, control)
+    except (OSError, psutil.Error) as e:
+        control.close()
+        log.warning("DAG zygote failed to fork the task process, forking it directly", error=str(e))
+        return None
+
+
+@attrs.define(kw_only=True)
+class DagZygote:
+    """Serve the fork requests of supervisors for a DAG file, from a process that has parsed it already."""
+
+    socket_path: Path
+    idle_timeout: float = IDLE_TIMEOUT
+
+    _server: socket.socket = attrs.field(init=False)
+    _inode: int = attrs.field(init=False)
+    _selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, init=False)
+    _wakeup: tuple[socket.socket, socket.socket] = attrs.field(factory=socket.socketpair, init=False)
+    _children: dict[int, socket.socket] = attrs.field(factory=dict, init=False)
+    _last_activity: float = attrs.field(factory=time.monotonic, init=False)
+
+    def bind(self) -> bool:
+        """
+        Listen on the socket, so supervisors can connect while the DAG file is still being parsed.
+
+        :return: False if another zygote is listening on it already.
+        """
+        server = listen(self.socket_path)
+        if server is None:
+            return False
+        self._server = server
+        self._inode = self.socket_path.stat().st_ino
+        return True
+
+    def serve(self) -> None:
+        """Fork task processes until idle for too long, or until the socket is removed or replaced."""
+        wakeup_r, wakeup_w = self._wakeup
+        wakeup_w.setblocking(False)
+        signal.set_wakeup_fd(wakeup_w.fileno())
+        # A handler is needed for the wakeup fd to be written to
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+        self._selector.register(self._server, selectors.EVENT_READ, self._accept)
+        self._selector.register(wakeup_r, selectors.EVENT_READ, self._reap)
+
+        accepting = True
+        while True:
+            for key, _ in self._selector.select(timeout=POLL_INTERVAL):
+                key.data(key.fileobj)
+
+            if accepting and not self._is_current():
+                log.info("DAG zygote socket removed, exiting once its task processes are done")
+                self._selector.unregister(self._server)
+                self._server.close()
+                accepting = False
+            idle = time.monotonic() - self._last_activity > self.idle_timeout
+            if not self._children and (idle or not accepting):
+                break
+
+        if accepting:
+            with suppress(FileNotFoundError):
+                if self._is_current():
+                    self.socket_path.unlink()
+            self._server.close()
+
+    def _is_current(self) -> bool:
+        try:
+            return self.socket_path.stat().st_ino == self._inode
+        except FileNotFoundError:
+            return False
+
+    def _accept(self, server: socket.socket) -> None:
+        conn, _ = server.accept()
+        self._selector.register(conn, selectors.EVENT_READ, self._on_request)
+
+    def _on_request(self, conn: socket.socket) -> None:
+        self._last_activity = time.monotonic()
+        try:
+            msg, fds, _, _ = socket.recv_fds(conn, len(_FORK_REQUEST), 4)
+        except OSError:
+            msg, fds = b"", []
+        if msg != _FORK_REQUEST or len(fds) != 4:
+            # The supervisor went away (or sent something we don't understand)
+            for fd in fds:
+                os.close(fd)
+            self._selector.unregister(conn)
+            if conn not in self._children.values():
+                conn.close()
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            self._run_child(fds)
+        for fd in fds:
+            os.close(fd)
+        self._children[pid] = conn
+        # The exit code is sent when the child is reaped; nothing else is expected from the supervisor
+        self._selector.unregister(conn)
+        with suppress(OSError):
+            conn.sendall(_INT.pack(pid))
+
+    def _run_child(self, fds: list[int]):
+        from airflow.sdk.execution_time.supervisor import _fork_main, _subprocess_main
+
+        try:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()  # type: ignore[union-attr]
+            self._selector.close()
+            for sock in (*self._wakeup, *self._children.values()):
+                sock.close()
+
+            requests, stdout, stderr, logs = (socket.socket(fileno=fd) for fd in fds)
+            _fork_main(requests, stdout, stderr, logs.fileno(), _subprocess_main)
+        except BaseException as e:
+            import traceback
+
+            with suppress(BaseException):
+                print("Exception in _fork_main, exiting with code 124", file=sys.stderr)
+                traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+
+        # Never return into the zygote's loop from a child
+        os._exit(124)
+
+    def _reap(self, wakeup_r: socket.socket) -> None:
+        with suppress(BlockingIOError):
+            wakeup_r.recv(4096)
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            self._last_activity = time.monotonic()
+            if conn := self._children.pop(pid, None):
+                with suppress(OSError):
+                    conn.sendall(_INT.pack(os.waitstatus_to_exitcode(status)))
+                conn.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    from airflow.dag_processing.bundles.base import BundleVersionLock
+    from airflow.sdk.api.datamodels._generated import BundleInfo
+    from airflow.sdk.execution_time.supervisor import block_orm_access
+    from airflow.sdk.execution_time.task_runner import preload_dag_file
+
+    parser = argparse.ArgumentParser(description="Fork task processes for a DAG file, parsing it only once.")
+    parser.add_argument("bundle_name")
+    parser.add_argument("dag_rel_path")
+    parser.add_argument("socket_path", type=Path)
+    parser.add_argument("--bundle-version", default=None)
+    args = parser.parse_args(argv)
+
+    zygote = DagZygote(socket_path=args.socket_path)
+    if not zygote.bind():
+        # Another supervisor started one at the same time
+        return
+
+    bundle_info = BundleInfo(name=args.bundle_name, version=args.bundle_version)
+    with BundleVersionLock(bundle_name=bundle_info.name, bundle_version=bundle_info.version):
+        # The task processes can't access the database, so the DAG file has to parse without it here too
+        block_orm_access()
+        bag = preload_dag_file(bundle_info, args.dag_rel_path)
+        if bag.import_errors:
+            log.warning("DAG file failed to parse, the task processes will parse it", path=args.dag_rel_path)
+        log.info("DAG zygote ready", pid=os.getpid(), bundle=bundle_info.name, path=args.dag_rel_path)
+        zygote.serve()
+
+
+if __name__ == "__main__":
+    main()
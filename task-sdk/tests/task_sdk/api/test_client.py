@@ -38,7 +38,10 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunState,
     DagRunStateResponse,
     HITLDetailResponse,
+    TIBulkHeartbeatItem,
     VariableResponse,
+    XComBulkPullItem,
+    XComBulkPullResponse,
     XComResponse,
 )
 from airflow.sdk.exceptions import ErrorType
@@ -342,6 +345,37 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_heartbeat_many(self):
+        ti_ids = [uuid6.uuid7(), uuid6.uuid7()]
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats":
+                actual_body = json.loads(request.read())
+                assert [hb["id"] for hb in actual_body["heartbeats"]] == [str(ti_id) for ti_id in ti_ids]
+                assert [hb["token"] for hb in actual_body["heartbeats"]] == ["token-0", "token-1"]
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": [
+                            {"id": str(ti_ids[0]), "status_code": 204, "refreshed_token": "new-token"},
+                            {"id": str(ti_ids[1]), "status_code": 409, "detail": {"reason": "not_running"}},
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.task_instances.heartbeat_many(
+            [
+                TIBulkHeartbeatItem(id=ti_id, hostname="host", pid=100 + idx, token=f"token-{idx}")
+                for idx, ti_id in enumerate(ti_ids)
+            ]
+        )
+
+        assert [r.status_code for r in result.results] == [204, 409]
+        assert result.results[0].refreshed_token == "new-token"
+        assert result.results[1].detail == {"reason": "not_running"}
+
     def test_task_instance_defer(self):
         # Simulate a successful response from the server that defers a task
         ti_id = uuid6.uuid7()
@@ -741,6 +775,35 @@ class TestXCOMOperations:
         assert result.key == "test_key"
         assert result.value == "test_value"
 
+    def test_xcom_get_many(self):
+        # Simulate a successful response from the server when getting many xcoms with one request
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/xcoms/dag_id/run_id/pull" and request.method == "POST":
+                assert json.loads(request.read()) == {
+                    "xcoms": [
+                        {"task_id": "task_a", "key": "key", "map_index": -1},
+                        {"task_id": "task_b", "key": "key", "map_index": None},
+                    ],
+                    "include_prior_dates": True,
+                }
+                return httpx.Response(
+                    status_code=200, json={"values": [["value_a"], ["value_b0", "value_b1"]]}
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.xcoms.get_many(
+            dag_id="dag_id",
+            run_id="run_id",
+            xcoms=[
+                XComBulkPullItem(task_id="task_a", key="key"),
+                XComBulkPullItem(task_id="task_b", key="key", map_index=None),
+            ],
+            include_prior_dates=True,
+        )
+        assert isinstance(result, XComBulkPullResponse)
+        assert result.values == [["value_a"], ["value_b0", "value_b1"]]
+
     @mock.patch("time.sleep", return_value=None)
     def test_xcom_get_500_error(self, mock_sleep):
         # Simulate a successful response from the server returning a 500 error
@@ -18,12 +18,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest import mock
 
 import jinja2
 import pytest
 
 from airflow.sdk import DAG, ObjectStoragePath
-from airflow.sdk.definitions._internal.templater import LiteralValue, SandboxedEnvironment, Templater
+from airflow.sdk.definitions._internal.templater import (
+    LiteralValue,
+    NativeEnvironment,
+    SandboxedEnvironment,
+    Templater,
+    _CompiledTemplateCache,
+    get_template,
+    template_from_string,
+)
 
 
 class TestTemplater:
@@ -92,6 +101,99 @@ class TestTemplater:
         assert rendered_content == "template_file.txt"
 
 
+class TestCompiledTemplateCache:
+    @pytest.fixture(autouse=True)
+    def cache(self, monkeypatch):
+        cache = _CompiledTemplateCache(max_size=2)
+        monkeypatch.setattr("airflow.sdk.definitions._internal.templater._compiled_templates", cache)
+        return cache
+
+    def test_shared_by_environments_with_the_same_options(self, cache):
+        env = SandboxedEnvironment(cache_size=0)
+        other_env = SandboxedEnvironment(cache_size=0)
+
+        assert template_from_string(env, "Hello {{ name }}").render(name="world") == "Hello world"
+        template = template_from_string(other_env, "Hello {{ name }}")
+
+        assert len(cache) == 1
+        assert template.environment is other_env
+        assert template.render(name="again") == "Hello again"
+
+    @pytest.mark.parametrize(
+        "other_env",
+        [
+            pytest.param(NativeEnvironment(cache_size=0), id="native"),
+            pytest.param(SandboxedEnvironment(cache_size=0, trim_blocks=True), id="options"),
+            pytest.param(SandboxedEnvironment(cache_size=0, extensions=["jinja2.ext.do"]), id="extensions"),
+        ],
+    )
+    def test_not_shared_by_environments_with_other_options(self, cache, other_env):
+        template_from_string(SandboxedEnvironment(cache_size=0), "{{ name }}")
+        template_from_string(other_env, "{{ name }}")
+
+        assert len(cache) == 2
+
+    def test_custom_filters(self, cache):
+        """Constant expressions are folded with the filters of the environment when compiling."""
+        env = SandboxedEnvironment(cache_size=0)
+        env.filters["shout"] = lambda value: value.upper()
+        other_env = SandboxedEnvironment(cache_size=0)
+        other_env.filters["shout"] = lambda value: value + "!"
+
+        assert template_from_string(env, "{{ 'hi' | shout }}").render() == "HI"
+        assert template_from_string(other_env, "{{ 'hi' | shout }}").render() == "hi!"
+
+    def test_least_recently_used_evicted(self, cache):
+        env = SandboxedEnvironment(cache_size=0)
+        for source in ("{{ a }}", "{{ b }}", "{{ a }}", "{{ c }}"):
+            template_from_string(env, source)
+
+        assert len(cache) == 2
+        with mock.patch.object(env, "compile", wraps=env.compile) as compile:
+            template_from_string(env, "{{ a }}")
+            template_from_string(env, "{{ b }}")
+        compile.assert_called_once_with("{{ b }}", None, None)
+
+    def test_disabled(self, monkeypatch):
+        cache = _CompiledTemplateCache(max_size=0)
+        monkeypatch.setattr("airflow.sdk.definitions._internal.templater._compiled_templates", cache)
+
+        assert template_from_string(SandboxedEnvironment(cache_size=0), "{{ a }}").render(a=1) == "1"
+        assert len(cache) == 0
+
+    def test_get_template(self, cache, tmp_path):
+        (tmp_path / "script.sh").write_text("echo {{ name }}")
+        env = SandboxedEnvironment(cache_size=0, loader=jinja2.FileSystemLoader(tmp_path))
+
+        assert get_template(env, "script.sh").render(name="world") == "echo world"
+        template = get_template(
+            SandboxedEnvironment(cache_size=0, loader=jinja2.FileSystemLoader(tmp_path)), "script.sh"
+        )
+        assert template.render(name="again") == "echo again"
+        assert len(cache) == 1
+
+        # Changes to the file are picked up
+        (tmp_path / "script.sh").write_text("echo changed")
+        assert get_template(env, "script.sh").render() == "echo changed"
+
+    def test_render_template_fields_of_mapped_tasks(self, cache):
+        templater = Templater()
+        templater.template_ext = [".sh"]
+        dag = DAG(dag_id="test_dag", schedule=None)
+
+        rendered = [
+            templater.render_template(
+                {"cmd": "echo {{ map_index }}", "args": ["{{ map_index + 1 }}"]},
+                {"map_index": map_index},
+                templater.get_template_env(dag),
+            )
+            for map_index in range(3)
+        ]
+
+        assert rendered == [{"cmd": f"echo {i}", "args": [str(i + 1)]} for i in range(3)]
+        assert len(cache) == 2
+
+
 @pytest.fixture
 def env():
     return SandboxedEnvironment(undefined=jinja2.StrictUndefined, cache_size=0)
@@ -31,7 +31,7 @@ from airflow.sdk.bases.xcom import BaseXCom
 from airflow.sdk.definitions.dag import DAG
 from airflow.sdk.definitions.mappedoperator import MappedOperator
 from airflow.sdk.definitions.xcom_arg import XComArg
-from airflow.sdk.execution_time.comms import GetXCom, SetXCom, XComResult
+from airflow.sdk.execution_time.comms import GetXCom, GetXComBulk, SetXCom, XComBulkResult, XComResult
 from airflow.utils.trigger_rule import TriggerRule
 
 from tests_common.test_utils.mapping import expand_mapped_task  # noqa: F401
@@ -593,6 +593,15 @@ def test_operator_mapped_task_group_receives_value(create_runtime_ti, mock_super
         t.override(task_id="t3")(tg1)
 
     def xcom_get(msg):
+        if isinstance(msg, GetXComBulk):
+            return XComBulkResult(
+                values=[
+                    [expected_values[key]]
+                    if (key := (item.task_id, item.map_index)) in expected_values
+                    else []
+                    for item in msg.xcoms
+                ]
+            )
         if not isinstance(msg, GetXCom):
             return mock.DEFAULT
         key = (msg.task_id, msg.map_index)
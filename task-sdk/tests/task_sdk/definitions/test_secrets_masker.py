@@ -680,6 +680,38 @@ class TestEdgeCases:
         assert redacted.startswith("Contains ")
         assert " and " in redacted
 
+    @pytest.mark.parametrize(
+        ("secrets", "value", "expected"),
+        [
+            pytest.param(["secret_one"], "no secrets here", "no secrets here", id="no-match"),
+            pytest.param(["secret_one"], "secret_one", "***", id="whole-string"),
+            pytest.param(["secret_one"], "a secret_one, b secret_one", "a ***, b ***", id="repeated"),
+            pytest.param(["secret", "secret_one"], "x secret_one y", "x *** y", id="longest-wins"),
+            pytest.param(["abcdef", "defghi"], "x abcdefghi y", "x *** y", id="overlapping"),
+            pytest.param(["abcdef", "ghijkl"], "abcdefghijkl", "******", id="adjacent"),
+            pytest.param(["aaaaa"], "aaaaaaaa", "***", id="self-overlapping"),
+            pytest.param(
+                ["long_secret_value", "short"], "short long_secret_value", "*** ***", id="re-anchored"
+            ),
+        ],
+    )
+    def test_multiple_secrets_in_string(self, secrets, value, expected):
+        secrets_masker = SecretsMasker()
+        for secret in secrets:
+            secrets_masker.add_mask(secret)
+
+        assert secrets_masker.redact(value) == expected
+
+    def test_many_secrets(self):
+        secrets = [f"conn-{i}-password-{i * 7919}" for i in range(500)]
+        secrets_masker = SecretsMasker()
+        for secret in secrets:
+            secrets_masker.add_mask(secret)
+
+        assert secrets_masker.redact("Nothing to see in this log line") == "Nothing to see in this log line"
+        assert secrets_masker.redact(f"Connecting with {secrets[123]}!") == "Connecting with ***!"
+        assert secrets_masker.redact(" ".join(secrets)) == " ".join(["***"] * len(secrets))
+
 
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
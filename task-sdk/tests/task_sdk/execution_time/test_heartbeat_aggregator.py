@@ -0,0 +1,180 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import selectors
+import threading
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+import uuid6
+
+from airflow.sdk.api.client import ServerResponseError
+from airflow.sdk.api.datamodels._generated import TIBulkHeartbeatResponse, TIBulkHeartbeatResult
+from airflow.sdk.execution_time.heartbeat_aggregator import (
+    HeartbeatAggregator,
+    HeartbeatAggregatorConnection,
+)
+
+SERVER = "http://api-server/execution/"
+
+
+@pytest.fixture
+def heartbeat_many():
+    with mock.patch("airflow.sdk.api.client.TaskInstanceOperations.heartbeat_many") as heartbeat_many:
+        yield heartbeat_many
+
+
+@pytest.fixture
+def aggregator(tmp_path: Path, heartbeat_many):
+    """An aggregator in a thread, with a long enough batch window for all the heartbeats of a test."""
+    path = tmp_path / "heartbeats.sock"
+    aggregator = HeartbeatAggregator(server=SERVER, socket_path=path, batch_window=0.2, idle_timeout=0.5)
+    assert aggregator.bind()
+    thread = threading.Thread(target=aggregator.serve, daemon=True)
+    thread.start()
+    with mock.patch(
+        "airflow.sdk.execution_time.heartbeat_aggregator.aggregator_socket_path", return_value=path
+    ):
+        yield thread
+    thread.join(timeout=5)
+
+
+def _heartbeat(ti_ids):
+    """Send the heartbeats of the TIs from a connection each, and wait for what each connection got back."""
+    replies: dict = {}
+    selector = selectors.DefaultSelector()
+    conns = []
+    for ti_id in ti_ids:
+        conn = HeartbeatAggregatorConnection.connect(
+            SERVER, lambda error, token, ti_id=ti_id: replies.__setitem__(ti_id, (error, token))
+        )
+        selector.register(conn.sock, selectors.EVENT_READ, conn.read_reply)
+        conn.send(ti_id, pid=1789, hostname="random-hostname", token=f"token-{ti_id}")
+        conns.append(conn)
+    while len(replies) < len(ti_ids):
+        events = selector.select(timeout=5)
+        assert events, "No reply from the aggregator"
+        for key, _ in events:
+            key.data(key.fileobj)
+    for conn in conns:
+        conn.close()
+    return replies
+
+
+def test_heartbeats_are_sent_in_one_batch(aggregator, heartbeat_many):
+    ti_ids = [uuid6.uuid7() for _ in range(3)]
+    heartbeat_many.return_value = TIBulkHeartbeatResponse(
+        results=[
+            TIBulkHeartbeatResult(id=ti_ids[0], status_code=204),
+            TIBulkHeartbeatResult(id=ti_ids[1], status_code=204, refreshed_token="refreshed"),
+            TIBulkHeartbeatResult(
+                id=ti_ids[2], status_code=409, detail={"reason": "not_running", "current_state": "success"}
+            ),
+        ]
+    )
+
+    replies = _heartbeat(ti_ids)
+
+    heartbeat_many.assert_called_once()
+    (items,) = heartbeat_many.call_args.args
+    assert [item.id for item in items] == ti_ids
+    assert [item.token for item in items] == [f"token-{ti_id}" for ti_id in ti_ids]
+    assert replies[ti_ids[0]] == (None, None)
+    assert replies[ti_ids[1]] == (None, "refreshed")
+
+    error, _ = replies[ti_ids[2]]
+    # The same as what the supervisor would get if it had heartbeat directly
+    assert isinstance(error, ServerResponseError)
+    assert error.response.status_code == 409
+    assert error.detail == {"detail": {"reason": "not_running", "current_state": "success"}}
+
+
+def test_failed_batch_fails_every_heartbeat(aggregator, heartbeat_many):
+    ti_ids = [uuid6.uuid7() for _ in range(2)]
+    heartbeat_many.side_effect = httpx.ConnectError("Connection refused")
+
+    replies = _heartbeat(ti_ids)
+
+    for ti_id in ti_ids:
+        error, token = replies[ti_id]
+        assert isinstance(error, ConnectionError)
+        assert "Connection refused" in str(error)
+        assert token is None
+
+
+def test_unauthorized_batch_is_sent_one_by_one(aggregator, heartbeat_many):
+    ti_ids = [uuid6.uuid7() for _ in range(2)]
+    forbidden = ServerResponseError.from_response(
+        httpx.Response(403, json={"detail": "Invalid token"}, request=httpx.Request("PATCH", SERVER))
+    )
+    heartbeat_many.side_effect = [
+        forbidden,
+        TIBulkHeartbeatResponse(results=[TIBulkHeartbeatResult(id=ti_ids[0], status_code=204)]),
+        forbidden,
+    ]
+
+    replies = _heartbeat(ti_ids)
+
+    assert [[item.id for item in call.args[0]] for call in heartbeat_many.call_args_list] == [
+        ti_ids,
+        ti_ids[:1],
+        ti_ids[1:],
+    ]
+    assert replies[ti_ids[0]] == (None, None)
+    error, _ = replies[ti_ids[1]]
+    assert isinstance(error, ServerResponseError)
+    assert error.response.status_code == 403
+
+
+def test_invalid_heartbeat_is_dropped(aggregator, heartbeat_many):
+    ti_id = uuid6.uuid7()
+    heartbeat_many.return_value = TIBulkHeartbeatResponse(
+        results=[TIBulkHeartbeatResult(id=ti_id, status_code=204)]
+    )
+    conn = HeartbeatAggregatorConnection.connect(SERVER, lambda error, token: None)
+    conn.sock.sendall(b'{"id": "not-a-uuid"}\n')
+    conn.close()
+
+    replies = _heartbeat([ti_id])
+
+    assert replies[ti_id] == (None, None)
+    (items,) = heartbeat_many.call_args.args
+    assert [item.id for item in items] == [ti_id]
+
+
+def test_connect_starts_aggregator_without_waiting(tmp_path):
+    path = tmp_path / "heartbeats.sock"
+    with (
+        mock.patch(
+            "airflow.sdk.execution_time.heartbeat_aggregator.aggregator_socket_path", return_value=path
+        ),
+        mock.patch("airflow.sdk.execution_time.heartbeat_aggregator.start_server") as start_server,
+    ):
+        assert HeartbeatAggregatorConnection.connect(SERVER, lambda error, token: None) is None
+
+    start_server.assert_called_once_with("airflow.sdk.execution_time.heartbeat_aggregator", SERVER, str(path))
+
+
+def test_aggregator_exits_when_idle(aggregator, tmp_path):
+    aggregator.join(timeout=5)
+
+    assert not aggregator.is_alive()
+    assert not (tmp_path / "heartbeats.sock").exists()
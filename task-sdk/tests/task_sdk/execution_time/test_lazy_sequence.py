@@ -76,6 +76,28 @@ def test_len(mock_supervisor_comms, lazy_sequence):
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
+    mock_supervisor_comms.send.return_value = XComSequenceSliceResult(root=["f"])
+    assert list(it) == ["f"]
+    mock_supervisor_comms.send.assert_called_once_with(
+        GetXComSequenceSlice(
+            key=BaseXCom.XCOM_RETURN_KEY,
+            dag_id="dag",
+            task_id="task",
+            run_id="run",
+            start=0,
+            stop=100,
+            step=None,
+        ),
+    )
+    # The last window was not full, so the length is known
+    assert len(lazy_sequence) == 1
+    mock_supervisor_comms.send.assert_called_once()
+
+
+@conf_vars({("workers", "xcom_sequence_window_size"): "1"})
+def test_iter_one_by_one(mock_supervisor_comms, mock_xcom_arg, mock_ti):
+    it = iter(LazyXComSequence(mock_xcom_arg, mock_ti))
+
     mock_supervisor_comms.send.side_effect = [
         XComSequenceIndexResult(root="f"),
         ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
@@ -105,6 +127,63 @@ def test_iter(mock_supervisor_comms, lazy_sequence):
     )
 
 
+def _slice_responder(values):
+    def send(msg):
+        if isinstance(msg, GetXComCount):
+            return XComCountResponse(len=len(values))
+        assert isinstance(msg, GetXComSequenceSlice)
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop])
+
+    return send
+
+
+def _sliced_starts(mock_supervisor_comms):
+    return [
+        c.args[0].start
+        for c in mock_supervisor_comms.send.call_args_list
+        if isinstance(c.args[0], GetXComSequenceSlice)
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@conf_vars({("workers", "xcom_sequence_window_size"): "3"})
+def test_iter_windows(mock_supervisor_comms, mock_xcom_arg, mock_ti, prefetch):
+    values = list(range(7))
+    mock_supervisor_comms.send.side_effect = _slice_responder(values)
+    with conf_vars({("workers", "xcom_sequence_prefetch"): str(prefetch)}):
+        lazy_sequence = LazyXComSequence(mock_xcom_arg, mock_ti)
+
+    assert list(lazy_sequence) == values
+    assert _sliced_starts(mock_supervisor_comms) == [0, 3, 6]
+
+    # Iterating again, indexing and len() are served from the cached windows
+    mock_supervisor_comms.send.reset_mock()
+    assert list(lazy_sequence) == values
+    assert lazy_sequence[4] == 4
+    assert lazy_sequence[-1] == 6
+    assert len(lazy_sequence) == 7
+    mock_supervisor_comms.send.assert_not_called()
+
+
+@conf_vars(
+    {
+        ("workers", "xcom_sequence_window_size"): "2",
+        ("workers", "xcom_sequence_max_cached_windows"): "1",
+    }
+)
+def test_iter_windows_cache_is_bounded(mock_supervisor_comms, mock_xcom_arg, mock_ti):
+    values = list(range(5))
+    mock_supervisor_comms.send.side_effect = _slice_responder(values)
+    lazy_sequence = LazyXComSequence(mock_xcom_arg, mock_ti)
+
+    assert list(lazy_sequence) == values
+    assert list(lazy_sequence._windows) == [4]
+
+    mock_supervisor_comms.send.reset_mock()
+    assert list(lazy_sequence) == values
+    assert _sliced_starts(mock_supervisor_comms) == [0, 2, 4]
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
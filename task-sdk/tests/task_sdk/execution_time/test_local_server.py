@@ -0,0 +1,102 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import socket
+import stat
+from unittest import mock
+
+import pytest
+
+from airflow.sdk.execution_time.local_server import connect, connect_or_start, listen, runtime_dir
+
+
+def test_runtime_dir_is_private(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    path = runtime_dir("sockets")
+
+    assert path == tmp_path / "sockets"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o700
+    assert runtime_dir("sockets") == path
+
+
+@pytest.mark.parametrize(
+    "make_dir",
+    [
+        pytest.param(lambda path: path.mkdir(mode=0o755), id="other-users-can-read"),
+        pytest.param(lambda path: path.symlink_to(path.parent), id="symlink"),
+        pytest.param(lambda path: path.touch(mode=0o700), id="file"),
+    ],
+)
+def test_runtime_dir_refuses_shared_dir(monkeypatch, tmp_path, make_dir):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    make_dir(tmp_path / "sockets")
+
+    with pytest.raises(PermissionError, match="mode 0700"):
+        runtime_dir("sockets")
+
+
+def test_listen_once(tmp_path):
+    path = tmp_path / "server.sock"
+    server = listen(path)
+    assert server is not None
+
+    # Another server is listening already
+    assert listen(path) is None
+    connect(path).close()
+    server.close()
+
+
+def test_listen_replaces_stale_socket(tmp_path):
+    path = tmp_path / "server.sock"
+    # Left behind by a server that died
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    with pytest.raises(ConnectionRefusedError):
+        connect(path)
+
+    server = listen(path)
+
+    assert server is not None
+    connect(path).close()
+    server.close()
+
+
+def test_connect_or_start_starts_server_once(tmp_path):
+    path = tmp_path / "server.sock"
+    servers = []
+
+    def start():
+        servers.append(listen(path))
+        return mock.Mock(**{"poll.return_value": None})
+
+    connect_or_start(path, start, timeout=5).close()
+    connect_or_start(path, start, timeout=5).close()
+
+    assert len(servers) == 1
+    servers[0].close()
+
+
+def test_connect_or_start_gives_up_when_server_fails(tmp_path):
+    start = mock.Mock(return_value=mock.Mock(**{"poll.return_value": 1}))
+
+    with pytest.raises(FileNotFoundError):
+        connect_or_start(tmp_path / "server.sock", start, timeout=5)
+    start.assert_called_once()
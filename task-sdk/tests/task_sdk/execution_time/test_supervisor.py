@@ -56,6 +56,7 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunType,
     TaskInstance,
     TaskInstanceState,
+    XComBulkPullItem,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
 from airflow.sdk.execution_time import task_runner
@@ -85,6 +86,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceItem,
     GetXComSequenceSlice,
     HITLDetailRequestResult,
@@ -107,6 +109,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBulkResult,
     XComResult,
     XComSequenceIndexResult,
     XComSequenceSliceResult,
@@ -854,6 +857,70 @@ class TestWatchedSubprocess:
             "timestamp": mocker.ANY,
         } in captured_logs
 
+    def test_heartbeat_through_aggregator(self, monkeypatch, mocker):
+        """Heartbeats sent through the aggregator are handled the same as those sent directly."""
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.HEARTBEAT_AGGREGATOR", True)
+        connection = mocker.Mock(waiting=False, sock=socket.socket())
+        connect = mocker.patch(
+            "airflow.sdk.execution_time.supervisor.HeartbeatAggregatorConnection.connect",
+            return_value=connection,
+        )
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+
+        client = make_client(transport=httpx.MockTransport(lambda request: httpx.Response(status_code=500)))
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.MagicMock(),
+            client=client,
+            process=mocker.Mock(pid=12345),
+        )
+
+        proc._send_heartbeat_if_needed()
+
+        connect.assert_called_once_with(str(client.base_url), proc._on_aggregated_heartbeat)
+        connection.send.assert_called_once_with(
+            TI_ID, pid=12345, hostname=mocker.ANY, token=client.auth.token
+        )
+
+        # The aggregator replies with a refreshed token
+        proc._on_aggregated_heartbeat(None, "refreshed-token")
+        assert client.auth.token == "refreshed-token"
+        assert proc.failed_heartbeats == 0
+
+        # And then that the task shouldn't be running anymore
+        response = httpx.Response(
+            409,
+            json={"detail": {"reason": "not_running"}},
+            request=httpx.Request("PUT", f"http://localhost/task-instances/{TI_ID}/heartbeat"),
+        )
+        proc._on_aggregated_heartbeat(ServerResponseError.from_response(response), None)
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+        assert proc._terminal_state == "SERVER_TERMINATED"
+
+    def test_heartbeat_sent_directly_while_aggregator_starts(self, monkeypatch, mocker):
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.HEARTBEAT_AGGREGATOR", True)
+        connect = mocker.patch(
+            "airflow.sdk.execution_time.supervisor.HeartbeatAggregatorConnection.connect", return_value=None
+        )
+        client = mocker.Mock()
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.MagicMock(),
+            client=client,
+            process=mocker.Mock(pid=12345),
+        )
+
+        proc._send_heartbeat_if_needed()
+
+        connect.assert_called_once()
+        client.task_instances.heartbeat.assert_called_once_with(TI_ID, pid=12345)
+        assert proc._heartbeat_aggregator is None
+        assert proc.failed_heartbeats == 0
+
     @pytest.mark.parametrize(
         ["terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"],
         [
@@ -1982,6 +2049,31 @@ class TestHandleRequest:
                 None,
                 id="get_xcom_seq_slice",
             ),
+            pytest.param(
+                GetXComBulk(
+                    dag_id="test_dag",
+                    run_id="test_run",
+                    xcoms=[
+                        XComBulkPullItem(task_id="task_a", key="test_key"),
+                        XComBulkPullItem(task_id="task_b", key="test_key", map_index=None),
+                    ],
+                ),
+                {"values": [["foo"], ["bar", "baz"]], "type": "XComBulkResult"},
+                "xcoms.get_many",
+                (
+                    "test_dag",
+                    "test_run",
+                    [
+                        XComBulkPullItem(task_id="task_a", key="test_key"),
+                        XComBulkPullItem(task_id="task_b", key="test_key", map_index=None),
+                    ],
+                    False,
+                ),
+                {},
+                XComBulkResult(values=[["foo"], ["bar", "baz"]]),
+                None,
+                id="get_xcom_bulk",
+            ),
             pytest.param(
                 CreateHITLDetailPayload(
                     ti_id=TI_ID,
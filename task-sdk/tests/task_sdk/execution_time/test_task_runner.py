@@ -84,6 +84,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceSlice,
     OKResponse,
     PreviousDagRunResult,
@@ -99,6 +100,7 @@ from airflow.sdk.execution_time.comms import (
     TICount,
     TriggerDagRun,
     VariableResult,
+    XComBulkResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -118,6 +120,7 @@ from airflow.sdk.execution_time.task_runner import (
     finalize,
     get_log_url_from_ti,
     parse,
+    preload_dag_file,
     run,
     startup,
 )
@@ -291,6 +294,46 @@ def test_parse_module_in_bundle_root(tmp_path: Path, make_ti_context):
     assert ti.task.dag.dag_id == "dag_name"
 
 
+def test_parse_uses_preloaded_dag_file(test_dags_dir: Path, make_ti_context, monkeypatch):
+    """A task process forked from a DAG zygote uses the DAG file parsed by the zygote."""
+    monkeypatch.setattr("airflow.sdk.execution_time.task_runner._preloaded_dag_bag", None)
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="super_basic",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+        ),
+        dag_rel_path="super_basic.py",
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+    )
+
+    with patch.dict(
+        os.environ,
+        {
+            "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                [
+                    {
+                        "name": "my-bundle",
+                        "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                        "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                    }
+                ]
+            ),
+        },
+    ):
+        bag = preload_dag_file(what.bundle_info, what.dag_rel_path)
+        with patch("airflow.models.dagbag.DagBag") as dag_bag:
+            ti = parse(what, mock.Mock())
+
+    dag_bag.assert_not_called()
+    assert ti.task.dag is bag.dags["super_basic"]
+
+
 def test_run_deferred_basic(time_machine, create_runtime_ti, mock_supervisor_comms):
     """Test that a task can transition to a deferred state."""
     from airflow.providers.standard.sensors.date_time import DateTimeSensorAsync
@@ -1419,6 +1462,9 @@ class TestRuntimeTaskInstance:
             print(f"{args=}, {kwargs=}, {msg=}")
             if isinstance(msg, GetXComSequenceSlice):
                 return XComSequenceSliceResult(root=[ser_value])
+            if isinstance(msg, GetXComBulk):
+                values = [ser_value] if ser_value is not None else []
+                return XComBulkResult(values=[values for _ in msg.xcoms])
             return XComResult(key="key", value=ser_value)
 
         mock_supervisor_comms.send.side_effect = mock_send_side_effect
@@ -1432,10 +1478,30 @@ class TestRuntimeTaskInstance:
         if not isinstance(map_indexes, Iterable):
             map_indexes = [map_indexes]
 
+        # Without task_ids (or None) expected behavior is to pull with calling task_id
+        task_ids = [
+            test_task_id if task_id is None or isinstance(task_id, ArgNotSet) else task_id
+            for task_id in task_ids
+        ]
+
+        if len(task_ids) * len(map_indexes) > 1:
+            # Many XComs are pulled with a single request
+            bulk_msg = next(
+                call.kwargs["msg"]
+                for call in mock_supervisor_comms.send.call_args_list
+                if isinstance(call.kwargs.get("msg"), GetXComBulk)
+            )
+            assert bulk_msg.dag_id == "test_dag"
+            assert bulk_msg.run_id == "test_run"
+            assert {(item.task_id, item.key, item.map_index) for item in bulk_msg.xcoms} == {
+                # All map indexes are pulled without a map index, an unmapped XCom with map index -1
+                (task_id, "key", None if map_index == NOTSET else -1 if map_index is None else map_index)
+                for task_id in task_ids
+                for map_index in map_indexes
+            }
+            return
+
         for task_id in task_ids:
-            # Without task_ids (or None) expected behavior is to pull with calling task_id
-            if task_id is None or isinstance(task_id, ArgNotSet):
-                task_id = test_task_id
             for map_index in map_indexes:
                 if map_index == NOTSET:
                     mock_supervisor_comms.send.assert_any_call(
@@ -0,0 +1,137 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import selectors
+import signal
+import socket
+import time
+from contextlib import suppress
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.sdk.api.datamodels._generated import BundleInfo
+from airflow.sdk.execution_time.zygote import DagZygote, fork_from_zygote, zygote_socket_path
+
+
+def test_zygote_socket_path_changes_with_bundle_version(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    v1 = zygote_socket_path(BundleInfo(name="my-bundle", version="v1"), "dag.py")
+    v2 = zygote_socket_path(BundleInfo(name="my-bundle", version="v2"), "dag.py")
+    other_file = zygote_socket_path(BundleInfo(name="my-bundle", version="v1"), "other.py")
+
+    assert len({v1, v2, other_file}) == 3
+    assert v1.parent == v2.parent == other_file.parent == tmp_path / "airflow-dag-zygotes"
+
+
+def _run_child(self, fds: list[int]):
+    requests, stdout = socket.socket(fileno=fds[0]), socket.socket(fileno=fds[1])
+    stdout.sendall(b"forked\n")
+    if requests.recv(1) == b"k":
+        os.kill(os.getpid(), signal.SIGTERM)
+    os._exit(3)
+
+
+@pytest.fixture
+def zygote(tmp_path: Path):
+    """A zygote in a forked process, whose children only say hello and exit."""
+    path = tmp_path / "zygote.sock"
+    with (
+        mock.patch.object(DagZygote, "_run_child", _run_child),
+        mock.patch("airflow.sdk.execution_time.zygote.POLL_INTERVAL", 0.1),
+    ):
+        pid = os.fork()
+        if pid == 0:
+            zygote = DagZygote(socket_path=path, idle_timeout=1.0)
+            zygote.bind()
+            zygote.serve()
+            os._exit(0)
+    while not path.exists():
+        time.sleep(0.01)
+    yield path, pid
+    with suppress(ProcessLookupError, ChildProcessError):
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+
+@pytest.mark.parametrize(
+    ("how_to_exit", "expected_exit_code"),
+    [
+        pytest.param(b"x", 3, id="exit-code"),
+        pytest.param(b"k", -signal.SIGTERM, id="signal"),
+    ],
+)
+def test_fork_from_zygote(zygote, how_to_exit, expected_exit_code):
+    path, _ = zygote
+    pairs = [socket.socketpair() for _ in range(4)]
+    # Tells the child how to exit
+    pairs[0][1].sendall(how_to_exit)
+
+    with mock.patch("airflow.sdk.execution_time.zygote.zygote_socket_path", return_value=path):
+        child = fork_from_zygote(
+            tuple(child for child, _ in pairs),
+            bundle_info=BundleInfo(name="my-bundle", version="v1"),
+            dag_rel_path="dag.py",
+        )
+
+    assert child is not None
+    for child_end, _ in pairs:
+        child_end.close()
+    assert pairs[1][1].recv(100) == b"forked\n"
+
+    selector = selectors.DefaultSelector()
+    selector.register(child.control, selectors.EVENT_READ, child.read_exit_code)
+    for key, _ in selector.select(timeout=10):
+        key.data(key.fileobj)
+
+    assert child.wait(timeout=0) == expected_exit_code
+    if expected_exit_code < 0:
+        assert child.wait(timeout=0).name == "SIGTERM"
+
+
+def test_zygote_exits_when_socket_replaced(zygote):
+    path, pid = zygote
+    path.unlink()
+    path.touch()
+
+    assert os.waitpid(pid, 0) == (pid, 0)
+    # The replacement's socket is left alone
+    assert path.exists()
+
+
+def test_zygote_exits_when_idle(zygote):
+    path, pid = zygote
+
+    assert os.waitpid(pid, 0) == (pid, 0)
+    assert not path.exists()
+
+
+def test_fork_from_zygote_falls_back_when_zygote_fails(tmp_path):
+    with mock.patch(
+        "airflow.sdk.execution_time.zygote._connect_to_zygote", side_effect=ConnectionRefusedError
+    ):
+        child = fork_from_zygote(
+            tuple(socket.socketpair()[0] for _ in range(4)),
+            bundle_info=BundleInfo(name="my-bundle", version="v1"),
+            dag_rel_path="dag.py",
+        )
+
+    assert child is None